@@ -0,0 +1,35 @@
+# micro benchmarks for snacks modules.
+# each module has main() printing JSON result, run it like:
+#   python -m snacks.benchmarks.batch_add
+import json
+import sys
+import timeit
+from typing import Any, Callable, Dict, Sequence
+
+
+def best_of(func: Callable[[], Any], repeat: int = 5, number: int = 1) -> float:
+    # seconds per call, minimum of repeats (see timeit docs why minimum)
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def dump(result: Any) -> None:
+    json.dump(result, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+def percentile(sorted_values: Sequence[float], p: float) -> float:
+    # nearest-rank method, sorted_values must be sorted ascending.
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * p // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(latencies: Sequence[float], elapsed: float) -> Dict[str, float]:
+    values = sorted(latencies)
+    return {
+        "elapsed": elapsed,
+        "throughput": len(values) / elapsed if elapsed > 0 else 0.0,
+        "p50": percentile(values, 50),
+        "p99": percentile(values, 99),
+    }
@@ -0,0 +1,42 @@
+# scalar add (one python call per element) vs *_add_batch()
+import array
+import argparse
+
+from snacks.mypkgdemo1 import mypkgdemo1_add, mypkgdemo1_add_batch
+from snacks.mypkgdemo1 import module2
+from . import best_of, dump
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+    ns1 = array.array("q", range(args.n))
+    ns2 = array.array("q", range(args.n, 0, -1))
+
+    result = {
+        "n": args.n,
+        "mypkgdemo1_add": best_of(
+            lambda: [mypkgdemo1_add(a, b) for a, b in zip(ns1, ns2)]
+        ),
+        "mypkgdemo1_add_batch": best_of(lambda: mypkgdemo1_add_batch(ns1, ns2)),
+        "module2_add": best_of(
+            lambda: [module2.module2_add(a, b, a) for a, b in zip(ns1, ns2)]
+        ),
+        "module2_add_batch": best_of(lambda: module2.module2_add_batch(ns1, ns2, ns1)),
+    }
+    try:
+        import numpy
+    except ImportError:
+        pass
+    else:
+        a1 = numpy.asarray(ns1)
+        a2 = numpy.asarray(ns2)
+        result["mypkgdemo1_add_batch(numpy)"] = best_of(
+            lambda: mypkgdemo1_add_batch(a1, a2)
+        )
+    dump(result)
+
+
+if __name__ == "__main__":
+    main()
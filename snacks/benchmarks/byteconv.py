@@ -0,0 +1,61 @@
+# per value int.from_bytes() / to_bytes() / indexing loop vs byteconv bulk conversion.
+# default buffer is 100MB, loop versions take some seconds.
+import argparse
+import os
+import sys
+
+from snacks.byteconv import as_ints, from_ints, iter_ints
+from . import best_of, dump
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mb", type=int, default=100)
+    parser.add_argument("--width", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=1)
+    args = parser.parse_args(argv)
+    width = args.width
+    data = os.urandom(args.mb * 1_000_000 // width * width)
+    n = len(data)
+    other = "big" if sys.byteorder == "little" else "little"
+
+    def loop_index():
+        return [data[i] for i in range(n)]
+
+    def loop_from_bytes():
+        return [
+            int.from_bytes(data[i:j], other)
+            for i, j in zip(range(0, n, width), range(width, n + 1, width))
+        ]
+
+    ints = as_ints(data, width, other).tolist()
+
+    def loop_to_bytes():
+        return b"".join([v.to_bytes(width, other) for v in ints])
+
+    timings = {
+        "loop data[i]": best_of(loop_index, repeat=args.repeat),
+        "as_ints(width=1)": best_of(lambda: as_ints(data).tolist(), repeat=args.repeat),
+        "loop int.from_bytes": best_of(loop_from_bytes, repeat=args.repeat),
+        "as_ints native": best_of(
+            lambda: as_ints(data, width, sys.byteorder).tolist(), repeat=args.repeat
+        ),
+        "as_ints byteswap": best_of(
+            lambda: as_ints(data, width, other).tolist(), repeat=args.repeat
+        ),
+        "iter_ints": best_of(
+            lambda: list(iter_ints(data, width, other)), repeat=args.repeat
+        ),
+        "loop int.to_bytes": best_of(loop_to_bytes, repeat=args.repeat),
+        "from_ints": best_of(lambda: from_ints(ints, width, other), repeat=args.repeat),
+    }
+    result = {
+        "bytes": n,
+        "width": width,
+        "ns_per_byte": {k: v / n * 1e9 for k, v in timings.items()},
+    }
+    dump(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+# threading vs multiprocessing vs asyncio, for CPU-bound and I/O-bound workloads.
+# see: https://docs.python.org/ja/3/glossary.html#term-global-interpreter-lock
+#
+# - threads : concurrent.futures.ThreadPoolExecutor
+# - processes : concurrent.futures.ProcessPoolExecutor
+# - asyncio : coroutines limited by Semaphore(workers) on one event loop.
+#
+# workloads (see workloads.py) :
+# - cpu : pure python loop, runs on the event loop thread for asyncio (never yields).
+# - io : tempfile write/read, run_in_executor() of workers threads for asyncio
+#        (asyncio has no non-blocking local file I/O).
+# - socket : round trip over local socket pair, asyncio streams for asyncio.
+#
+# latency = execution time of each task measured inside the worker.
+# throughput = tasks / wall-clock time of the whole batch, pool startup / shutdown and
+# event loop creation are not included (pools are warmed up before timing).
+import argparse
+import asyncio
+import functools
+import multiprocessing
+import tempfile
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Tuple, Type
+
+from . import dump, summarize
+from .workloads import (
+    async_cpu_bound,
+    async_io_bound,
+    async_socket_bound,
+    cpu_bound,
+    io_bound,
+    socket_bound,
+)
+
+MODELS = ("threads", "processes", "asyncio")
+WORKLOADS = ("cpu", "io", "socket")
+
+
+def _timed(func: Callable[..., Any], *args) -> float:
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def _warm_up(executor: Executor, workers: int) -> None:
+    # exclude worker startup
+    for future in [executor.submit(cpu_bound, 1) for _ in range(workers)]:
+        future.result()
+
+
+def _run_executor(
+    executor_class: Type[Executor], workers: int, calls: List[functools.partial]
+) -> Tuple[List[float], float]:
+    with executor_class(workers) as executor:
+        _warm_up(executor, workers)
+        start = time.perf_counter()
+        futures = [executor.submit(_timed, call) for call in calls]
+        latencies = [future.result() for future in futures]
+        elapsed = time.perf_counter() - start
+    return latencies, elapsed
+
+
+def _run_asyncio(
+    workers: int, calls: List[Callable[[], Awaitable[Any]]]
+) -> Tuple[List[float], float]:
+    async def run_all() -> Tuple[List[float], float]:
+        # run_in_executor(None, ...) uses workers threads, same as "threads" model
+        executor = ThreadPoolExecutor(workers)
+        _warm_up(executor, workers)
+        asyncio.get_running_loop().set_default_executor(executor)
+        semaphore = asyncio.Semaphore(workers)
+
+        async def run_one(call: Callable[[], Awaitable[Any]]) -> float:
+            async with semaphore:
+                start = time.perf_counter()
+                await call()
+                return time.perf_counter() - start
+
+        start = time.perf_counter()
+        latencies = list(await asyncio.gather(*(run_one(call) for call in calls)))
+        return latencies, time.perf_counter() - start
+
+    return asyncio.run(run_all())
+
+
+def run_benchmark(
+    workload: str, model: str, workers: int, tasks: int, size: int
+) -> Dict[str, float]:
+    # size : loop count for "cpu", line count for "io" and "socket"
+    if workload not in WORKLOADS:
+        raise ValueError("unknown workload: {!r}".format(workload))
+    if model not in MODELS:
+        raise ValueError("unknown model: {!r}".format(model))
+    with tempfile.TemporaryDirectory() as dirpath:
+        if model == "asyncio":
+            func: Callable[..., Any] = {
+                "cpu": async_cpu_bound,
+                "io": async_io_bound,
+                "socket": async_socket_bound,
+            }[workload]
+        else:
+            func = {"cpu": cpu_bound, "io": io_bound, "socket": socket_bound}[workload]
+        if workload == "io":
+            calls = [functools.partial(func, dirpath, i, size) for i in range(tasks)]
+        else:
+            calls = [functools.partial(func, size) for _ in range(tasks)]
+
+        if model == "asyncio":
+            latencies, elapsed = _run_asyncio(workers, calls)
+        else:
+            executor_class = (
+                ThreadPoolExecutor if model == "threads" else ProcessPoolExecutor
+            )
+            latencies, elapsed = _run_executor(executor_class, workers, calls)
+
+    result = summarize(latencies, elapsed)
+    result["workers"] = workers
+    return result
+
+
+def run_all(
+    max_workers: int, tasks: int, cpu_size: int, io_size: int
+) -> Dict[str, Dict[str, List[Dict[str, float]]]]:
+    sizes = {"cpu": cpu_size, "io": io_size, "socket": io_size}
+    result: Dict[str, Dict[str, List[Dict[str, float]]]] = {}
+    for workload in WORKLOADS:
+        result[workload] = {}
+        for model in MODELS:
+            runs = [
+                run_benchmark(workload, model, workers, tasks, sizes[workload])
+                for workers in range(1, max_workers + 1)
+            ]
+            base = runs[0]["throughput"]
+            for run in runs:
+                run["scaling"] = run["throughput"] / base if base else 0.0
+            result[workload][model] = runs
+    return result
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-workers", type=int, default=multiprocessing.cpu_count())
+    parser.add_argument("--tasks", type=int, default=64)
+    parser.add_argument("--cpu-loops", type=int, default=100_000)
+    parser.add_argument("--io-lines", type=int, default=1_000)
+    args = parser.parse_args(argv)
+    dump(run_all(args.max_workers, args.tasks, args.cpu_loops, args.io_lines))
+
+
+if __name__ == "__main__":
+    main()
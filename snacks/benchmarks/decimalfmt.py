@@ -0,0 +1,62 @@
+# f"{v:{width}.{places}f}" per value vs DecimalFormatter.format_column() on 1M Decimals.
+# "float (unchecked)" shows why there is no float fallback : mismatches are counted.
+import argparse
+import random
+from decimal import Decimal
+
+from snacks.decimalfmt import DecimalFormatter
+from . import best_of, dump
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--values", type=int, default=1_000_000)
+    parser.add_argument("--places", type=int, default=2)
+    parser.add_argument("--width", type=int, default=14)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    rnd = random.Random(0)
+    values = [
+        Decimal(rnd.randint(-(10**10), 10**10)).scaleb(-rnd.randint(0, 5))
+        for _ in range(args.values)
+    ]
+    width, places = args.width, args.places
+    spec = ">{}.{}f".format(width, places)
+    thousands_spec = ">{},.{}f".format(width, places)
+    plain = DecimalFormatter(places, width)
+    thousands = DecimalFormatter(places, width, thousands=True)
+
+    def f_string():
+        return [f"{v:{width}.{places}f}" for v in values]
+
+    def float_unchecked():
+        return [format(float(v), spec) for v in values]
+
+    expected = f_string()
+    assert plain.format_column(values) == expected
+    assert thousands.format_column(values) == [
+        format(v, thousands_spec) for v in values
+    ]
+    result = {
+        "values": args.values,
+        "f-string nested spec": best_of(f_string, repeat=args.repeat),
+        "format(v, spec)": best_of(
+            lambda: [format(v, spec) for v in values], repeat=args.repeat
+        ),
+        "format_column": best_of(
+            lambda: plain.format_column(values), repeat=args.repeat
+        ),
+        "format(v, spec) thousands": best_of(
+            lambda: [format(v, thousands_spec) for v in values], repeat=args.repeat
+        ),
+        "format_column thousands": best_of(
+            lambda: thousands.format_column(values), repeat=args.repeat
+        ),
+        "float (unchecked)": best_of(float_unchecked, repeat=args.repeat),
+        "float mismatches": sum(a != b for a, b in zip(expected, float_unchecked())),
+    }
+    dump(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# functools.singledispatch / singledispatchmethod vs snacks.dispatch
+import argparse
+from functools import singledispatch, singledispatchmethod
+
+from snacks.dispatch import typedispatch, dispatchmethod
+from . import best_of, dump
+
+
+def _make_functions():
+    @singledispatch
+    def sd(arg) -> str:
+        return "other"
+
+    @sd.register
+    def _sd_str(arg: str) -> str:
+        return "str"
+
+    @sd.register
+    def _sd_int(arg: int) -> str:
+        return "int"
+
+    @typedispatch
+    def td(arg) -> str:
+        return "other"
+
+    @td.register
+    def _td_str(arg: str) -> str:
+        return "str"
+
+    @td.register
+    def _td_int(arg: int) -> str:
+        return "int"
+
+    return sd, td
+
+
+class WithSingleDispatchMethod:
+    @singledispatchmethod
+    def handle(self, arg) -> str:
+        return "other"
+
+    @handle.register
+    def _handle_str(self, arg: str) -> str:
+        return "str"
+
+    @handle.register
+    def _handle_int(self, arg: int) -> str:
+        return "int"
+
+
+class WithDispatchMethod:
+    @dispatchmethod
+    def handle(self, arg) -> str:
+        return "other"
+
+    @handle.register
+    def _handle_str(self, arg: str) -> str:
+        return "str"
+
+    @handle.register
+    def _handle_int(self, arg: int) -> str:
+        return "int"
+
+
+class WithClassDispatch:
+    @dispatchmethod
+    @classmethod
+    def handle(cls, arg) -> str:
+        return "other"
+
+    @handle.register
+    @classmethod
+    def _handle_str(cls, arg: str) -> str:
+        return "str"
+
+    @handle.register
+    @classmethod
+    def _handle_int(cls, arg: int) -> str:
+        return "int"
+
+
+class WithIfElif:
+    # hand written chain, checked in the same order as MRO resolution would do
+    @classmethod
+    def handle(cls, arg) -> str:
+        if isinstance(arg, str):
+            return "str"
+        elif isinstance(arg, int):
+            return "int"
+        else:
+            return "other"
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=300_000)
+    args = parser.parse_args(argv)
+    messages = [("a", 1, 2.0, True, [1])[i % 5] for i in range(args.n)]
+    sd, td = _make_functions()
+    o1 = WithSingleDispatchMethod()
+    o2 = WithDispatchMethod()
+    handle = WithClassDispatch.handle
+    result = {
+        "n": args.n,
+        "singledispatch": best_of(lambda: [sd(m) for m in messages]),
+        "typedispatch": best_of(lambda: [td(m) for m in messages]),
+        "typedispatch.dispatch_many": best_of(lambda: td.dispatch_many(messages)),
+        "singledispatchmethod": best_of(lambda: [o1.handle(m) for m in messages]),
+        "dispatchmethod": best_of(lambda: [o2.handle(m) for m in messages]),
+        "dispatchmethod.dispatch_many": best_of(
+            lambda: o2.handle.dispatch_many(messages)
+        ),
+        "classmethod dispatchmethod": best_of(
+            lambda: [WithClassDispatch.handle(m) for m in messages]
+        ),
+        # bound dispatcher taken once : no descriptor call in the loop
+        "classmethod dispatchmethod (hoisted)": best_of(
+            lambda: [handle(m) for m in messages]
+        ),
+        "classmethod if/elif": best_of(
+            lambda: [WithIfElif.handle(m) for m in messages]
+        ),
+    }
+    dump(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+# Enum vs FastEnum lookup and iteration on an enum with many members
+import argparse
+from enum import Enum
+
+from snacks.fastenum import FastEnum
+from . import best_of, dump
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--members", type=int, default=5_000)
+    args = parser.parse_args(argv)
+    names = ["CODE{:05d}".format(i) for i in range(args.members)]
+    values = list(range(100_000, 100_000 + args.members))
+    PlainCodes = Enum("PlainCodes", list(zip(names, values)))  # type: ignore
+    FastCodes = FastEnum("FastCodes", list(zip(names, values)))  # type: ignore
+
+    result = {
+        "members": args.members,
+        "Enum(value)": best_of(lambda: [PlainCodes(v) for v in values]),
+        "FastEnum.from_value": best_of(
+            lambda: [FastCodes.from_value(v) for v in values]
+        ),
+        "Enum[name]": best_of(lambda: [PlainCodes[n] for n in names]),
+        "FastEnum.from_name": best_of(lambda: [FastCodes.from_name(n) for n in names]),
+        "iterate Enum": best_of(lambda: list(PlainCodes)),
+        "iterate FastEnum": best_of(lambda: list(FastCodes)),
+        "Enum.__members__.items()": best_of(
+            lambda: [m.value for _, m in PlainCodes.__members__.items()]
+        ),
+        "FastEnum.members()": best_of(lambda: [m.value for m in FastCodes.members()]),
+    }
+    dump(result)
+
+
+if __name__ == "__main__":
+    main()
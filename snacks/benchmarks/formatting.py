@@ -0,0 +1,71 @@
+# str.format() vs f-string vs compile_format() / format_rows() on report line templates.
+# "numeric" template is dominated by number formatting itself,
+# "text" template has many fields with cheap values (template parsing cost is visible).
+import argparse
+import io
+
+from snacks.formatting import compile_format, format_rows
+from . import best_of, dump
+
+NUMERIC = "{0:>8}|{1:0>8b}|{2:+,.2f}|{3:<10}\n"
+TEXT = "{0}\t{1}\t{2}\t{3}\t{4}\t{5}\n"
+
+
+def numeric_f_string(rows):
+    buf = io.StringIO()
+    for a, b, c, d in rows:
+        buf.write(f"{a:>8}|{b:0>8b}|{c:+,.2f}|{d:<10}\n")
+    return buf.getvalue()
+
+
+def text_f_string(rows):
+    buf = io.StringIO()
+    for a, b, c, d, e, f in rows:
+        buf.write(f"{a}\t{b}\t{c}\t{d}\t{e}\t{f}\n")
+    return buf.getvalue()
+
+
+def run(template, rows, f_string):
+    fmt = compile_format(template)
+
+    def with_format():
+        buf = io.StringIO()
+        for row in rows:
+            buf.write(template.format(*row))
+        return buf.getvalue()
+
+    def with_compiled():
+        buf = io.StringIO()
+        for row in rows:
+            buf.write(fmt(*row))
+        return buf.getvalue()
+
+    expected = with_format()
+    assert expected == f_string(rows) == with_compiled()
+    assert expected == format_rows(template, rows, end="")
+    return {
+        "str.format": best_of(with_format),
+        "f-string": best_of(lambda: f_string(rows)),
+        "compile_format": best_of(with_compiled),
+        "format_rows": best_of(lambda: format_rows(template, rows, end="")),
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args(argv)
+    n = args.rows
+    numeric_rows = [(i, i % 256, i * 1.5, "name{}".format(i % 100)) for i in range(n)]
+    words = ["alpha", "beta", "gamma", "delta", "epsilon", "zeta"]
+    text_rows = [tuple(words[(i + j) % 6] for j in range(6)) for i in range(n)]
+    result = {
+        "rows": n,
+        "numeric": run(NUMERIC, numeric_rows, numeric_f_string),
+        "text": run(TEXT, text_rows, text_f_string),
+    }
+    dump(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+# import time of tests.snacks.mypkgdemo2 : lazy (PEP 562 __getattr__) vs eager access.
+# "eager" touches every alias and all_module_names (glob scan) right after import,
+# as the old __init__.py did at import time.
+import argparse
+import os
+import statistics
+
+from snacks.importtime import run_importtime, total_us
+from . import dump
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+STATEMENTS = {
+    "lazy": "import tests.snacks.mypkgdemo2",
+    "eager": "import tests.snacks.mypkgdemo2 as m; m.all_module_names; "
+    "[getattr(m, n) for n in m._aliases]",
+}
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args(argv)
+    result = {}
+    for label, statement in STATEMENTS.items():
+        package_samples = []
+        process_samples = []
+        for _ in range(args.runs):
+            entries = run_importtime(statement, cwd=_ROOT)
+            package_samples.append(total_us(entries, "tests.snacks.mypkgdemo2"))
+            # includes stdlib modules pulled in by the package (glob, fnmatch, ...)
+            process_samples.append(total_us(entries))
+        result[label] = {
+            "statement": statement,
+            "package_median_us": statistics.median(package_samples),
+            "process_median_us": statistics.median(process_samples),
+        }
+    dump(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# peak memory / time of loading and running N parameterized cases :
+# eager (all cases and tests materialized before run, like parameterized.expand()) vs
+# lazy (snacks.testing.lazyparam, tests created while running).
+import argparse
+import time
+import tracemalloc
+import unittest
+
+from snacks.testing.lazyparam import expand, load_tests
+from . import dump
+
+
+def build(cases: int, eager: bool) -> unittest.TestSuite:
+    def gen_cases():
+        for x in range(cases):
+            yield (x, x + 1, "payload {}".format(x) * 4)
+
+    class TestGenerated(unittest.TestCase):
+        @expand(list(gen_cases()) if eager else gen_cases)
+        def test_add(self, x, y, payload):
+            self.assertEqual(x + 1, y)
+
+    loader = unittest.TestLoader()
+    suite = load_tests(loader, loader.loadTestsFromTestCase(TestGenerated), None)
+    if eager:
+        (lazy,) = suite
+        suite = unittest.TestSuite(list(lazy))
+    return suite
+
+
+def run(cases: int, eager: bool) -> None:
+    result = unittest.TestResult()
+    build(cases, eager).run(result)
+    assert result.wasSuccessful() and result.testsRun == cases
+
+
+def measure(cases: int, eager: bool) -> dict:
+    # time and memory in separate runs (tracemalloc slows down allocation)
+    start = time.perf_counter()
+    run(cases, eager)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    run(cases, eager)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"seconds": elapsed, "peak_mb": peak / 1e6}
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cases", type=int, default=100_000)
+    args = parser.parse_args(argv)
+    dump(
+        {
+            "cases": args.cases,
+            "eager": measure(args.cases, True),
+            "lazy": measure(args.cases, False),
+        }
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# speedup of snacks.parallel on CPU-bound batch, 1 to N processes.
+import argparse
+import multiprocessing
+import time
+
+from snacks.parallel import ProcessPoolRunner
+from . import dump
+from .workloads import cpu_bound
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=64)
+    parser.add_argument("--loops", type=int, default=200_000)
+    parser.add_argument(
+        "--max-processes", type=int, default=multiprocessing.cpu_count()
+    )
+    parser.add_argument("--start-method", default=None)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    for _ in range(args.tasks):
+        cpu_bound(args.loops)
+    serial = time.perf_counter() - start
+
+    result = {"tasks": args.tasks, "loops": args.loops, "serial": serial, "runs": []}
+    for processes in range(1, args.max_processes + 1):
+        with ProcessPoolRunner(processes, args.start_method) as runner:
+            # warm up: exclude worker startup
+            runner.map(cpu_bound, [1] * processes)
+            start = time.perf_counter()
+            runner.map(cpu_bound, [args.loops] * args.tasks)
+            elapsed = time.perf_counter() - start
+        result["runs"].append(
+            {"processes": processes, "elapsed": elapsed, "speedup": serial / elapsed}
+        )
+    dump(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# memory usage (tracemalloc) : @dataclass vs @record (__slots__) vs RecordBatch
+import argparse
+import dataclasses
+import tracemalloc
+from typing import Any, Callable
+
+from snacks.records import record, RecordBatch
+from . import dump
+
+
+@dataclasses.dataclass
+class PlainData:
+    str1: str
+    int1: int
+    float1: float
+
+
+@record
+class SlotsData:
+    str1: str
+    int1: int
+    float1: float
+
+
+def _traced_bytes(build: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        kept = build()  # noqa: F841 (keep objects alive until measured)
+        return tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+    n = args.n
+    # shared string objects : measure the container cost, not the values
+    strings = ["s{}".format(i % 100) for i in range(100)]
+
+    def build_batch():
+        batch = RecordBatch(SlotsData, typecodes={"int1": "q", "float1": "d"})
+        for i in range(n):
+            batch.append(strings[i % 100], i, i * 0.5)
+        return batch
+
+    result = {"n": n}
+    for label, build in (
+        (
+            "dataclass",
+            lambda: [PlainData(strings[i % 100], i, i * 0.5) for i in range(n)],
+        ),
+        ("record", lambda: [SlotsData(strings[i % 100], i, i * 0.5) for i in range(n)]),
+        ("record_batch", build_batch),
+    ):
+        traced = _traced_bytes(build)
+        result[label] = {"bytes": traced, "bytes_per_row": traced / n}
+    dump(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# append-loop repeat() (test_enum_demo.py StringRepeater) vs cached repeat() / repeat_many()
+import argparse
+from enum import Enum
+
+from snacks.repeater import CachedRepeater
+from . import best_of, dump
+
+
+class LoopRepeater(Enum):
+    FIVE_COLON = (5, ":")
+
+    def __init__(self, count: int, joiner: str):
+        self.count = count
+        self.joiner = joiner
+
+    def repeat(self, target: str) -> str:
+        targets = []
+        for _ in range(self.count):
+            targets.append(target)
+        return self.joiner.join(targets)
+
+
+class FastRepeater(CachedRepeater, Enum):
+    FIVE_COLON = (5, ":")
+
+    def __init__(self, count: int, joiner: str):
+        self.count = count
+        self.joiner = joiner
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=100_000)
+    parser.add_argument("--distinct", type=int, default=100)
+    args = parser.parse_args(argv)
+    targets = ["word{}".format(i % args.distinct) for i in range(args.calls)]
+    loop = LoopRepeater.FIVE_COLON
+    fast = FastRepeater.FIVE_COLON
+    assert [loop.repeat(t) for t in targets[:10]] == fast.repeat_many(targets[:10])
+
+    result = {
+        "calls": args.calls,
+        "distinct": args.distinct,
+        "append loop repeat": best_of(lambda: [loop.repeat(t) for t in targets]),
+        "cached repeat": best_of(lambda: [fast.repeat(t) for t in targets]),
+        "cached repeat_many": best_of(lambda: fast.repeat_many(targets)),
+    }
+    dump(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# inspect.signature(func).bind() per call vs compiled SignatureBinder
+import argparse
+import inspect
+
+from snacks.sigbind import get_binder
+from . import best_of, dump
+
+
+def plugin(name, *values, sep=",", prefix="", **options):
+    return prefix + name + sep.join(map(str, values)) + str(len(options))
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args(argv)
+    mappings = [
+        {"name": "p{}".format(i % 10), "values": (i, i + 1), "sep": ":", "debug": True}
+        for i in range(args.calls)
+    ]
+    signature = inspect.signature(plugin)
+    binder = get_binder(plugin)
+
+    def with_signature_bind():
+        results = []
+        for m in mappings:
+            kwargs = dict(m)
+            values = kwargs.pop("values", ())
+            bound = signature.bind(kwargs.pop("name"), *values, **kwargs)
+            bound.apply_defaults()
+            results.append(plugin(*bound.args, **bound.kwargs))
+        return results
+
+    def with_call_dict():
+        return [binder.call_dict(m) for m in mappings]
+
+    def with_bind():
+        return [binder.bind(m["name"], *m["values"], sep=m["sep"]) for m in mappings]
+
+    expected = with_signature_bind()
+    assert expected == with_call_dict() == binder.call_many(mappings)
+    result = {
+        "calls": args.calls,
+        "inspect bind + call": best_of(with_signature_bind),
+        "SignatureBinder.call_dict": best_of(with_call_dict),
+        "SignatureBinder.call_many": best_of(lambda: binder.call_many(mappings)),
+        "inspect bind only": best_of(
+            lambda: [
+                signature.bind(m["name"], *m["values"], sep=m["sep"]) for m in mappings
+            ]
+        ),
+        "SignatureBinder.bind only": best_of(with_bind),
+    }
+    dump(result)
+
+
+if __name__ == "__main__":
+    main()
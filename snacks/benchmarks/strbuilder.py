@@ -0,0 +1,67 @@
+# "r += ..." argument trace (test_arg_type_mixin_demo) vs StringIO / StringBuilder / arg_trace
+import argparse
+import io
+
+from snacks.strbuilder import StringBuilder, format_arg_trace
+from . import best_of, dump
+
+
+def trace_concat(prefix, suffix, args, kwargs):
+    r = prefix
+    for i, arg in enumerate(args):
+        r += ",*a[{}]=[{}]".format(i, arg)
+    for kw, kwarg in kwargs.items():
+        r += ",**kw[{}]=[{}]".format(kw, kwarg)
+    return r + suffix
+
+
+def trace_stringio(prefix, suffix, args, kwargs):
+    buf = io.StringIO()
+    write = buf.write
+    write(prefix)
+    for i, arg in enumerate(args):
+        write(",*a[{}]=[{}]".format(i, arg))
+    for kw, kwarg in kwargs.items():
+        write(",**kw[{}]=[{}]".format(kw, kwarg))
+    write(suffix)
+    return buf.getvalue()
+
+
+def trace_builder(prefix, suffix, args, kwargs):
+    sb = StringBuilder(prefix)
+    for i, arg in enumerate(args):
+        sb.append_format(",*a[{}]=[{}]", i, arg)
+    for kw, kwarg in kwargs.items():
+        sb.append_format(",**kw[{}]=[{}]", kw, kwarg)
+    return sb.append(suffix).getvalue()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 100, 1_000, 10_000, 100_000]
+    )
+    args = parser.parse_args(argv)
+    result = {}
+    for size in args.sizes:
+        values = list(range(size))
+        kwargs = {"kw{}".format(i): "v{}".format(i) for i in range(min(size, 100))}
+        number = max(1, 10_000 // size)
+        funcs = {
+            "+= concat": trace_concat,
+            "StringIO": trace_stringio,
+            "StringBuilder": trace_builder,
+            "format_arg_trace": format_arg_trace,
+        }
+        expected = trace_concat(">>", ",<<", values, kwargs)
+        for func in funcs.values():
+            assert func(">>", ",<<", values, kwargs) == expected
+        result[size] = {
+            name: best_of(lambda: func(">>", ",<<", values, kwargs), number=number)
+            for name, func in funcs.items()
+        }
+    dump(result)
+
+
+if __name__ == "__main__":
+    main()
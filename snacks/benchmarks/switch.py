@@ -0,0 +1,78 @@
+# if/elif chain vs dispatch dict (membership test + lambda call) vs compiled switch,
+# as the number of cases grows.
+import argparse
+import random
+from typing import Any, Callable, Dict, List
+
+from snacks.switch import SwitchBuilder
+from . import best_of, dump
+
+
+def _pairs(keys: List[str]) -> List[List[str]]:
+    # two keys share one result, like "aa or bb"
+    return [list(pair) for pair in zip(keys[0::2], keys[1::2])]
+
+
+def _if_elif(keys: List[str]) -> Callable[[str], Any]:
+    # generated source : same shape as test_no_switch_use_if_elif_else()
+    lines = ["def f1(s0):"]
+    for i, pair in enumerate(_pairs(keys)):
+        keyword = "if" if i == 0 else "elif"
+        lines.append("    {} s0 in {!r}:".format(keyword, tuple(pair)))
+        lines.append("        return {!r}".format(" or ".join(pair)))
+    lines.append("    return 'xx'")
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["f1"]
+
+
+def _dispatch_dict(keys: List[str]) -> Callable[[str], Any]:
+    # same shape as test_no_switch_use_function_dispatch_dict() : one lambda per key
+    func_dispatch_dict = {}
+    for pair in _pairs(keys):
+        result = " or ".join(pair)
+        for key in pair:
+            func_dispatch_dict[key] = lambda result=result: result
+
+    def f1(s0: str) -> str:
+        if s0 in func_dispatch_dict:
+            return func_dispatch_dict[s0]()
+        return "xx"
+
+    return f1
+
+
+def _compiled(keys: List[str]) -> Callable[[str], Any]:
+    builder = SwitchBuilder(default="xx")
+    for pair in _pairs(keys):
+        builder.case(pair, " or ".join(pair))
+    return builder.compile()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lookups", type=int, default=100_000)
+    args = parser.parse_args(argv)
+    rng = random.Random(0)
+    result = []
+    for n_cases in (4, 16, 64, 100, 256):
+        keys = ["op{:03d}".format(i) for i in range(n_cases)]
+        # 90% hits, 10% misses
+        inputs = [
+            rng.choice(keys) if rng.random() < 0.9 else "unknown"
+            for _ in range(args.lookups)
+        ]
+        row = {"cases": n_cases}
+        for label, build in (
+            ("if_elif", _if_elif),
+            ("dispatch_dict", _dispatch_dict),
+            ("compiled", _compiled),
+        ):
+            f1 = build(keys)
+            row[label] = best_of(lambda: [f1(s0) for s0 in inputs])
+        result.append(row)
+    dump(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# serial "unittest discover" vs parallel sharded runner on generated test modules.
+# "sleep" workload scales with processes even on few cores (I/O wait like tests),
+# "cpu" workload scales up to number of cores.
+import argparse
+import io
+import os
+import sys
+import tempfile
+import textwrap
+import time
+import unittest
+
+from snacks.testing.runner import run
+from . import dump
+
+TEMPLATE = textwrap.dedent("""
+    import time
+    import unittest
+
+
+    def work(kind, seconds):
+        if kind == "sleep":
+            time.sleep(seconds)
+            return
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            pass
+
+
+    class TestGenerated{index}(unittest.TestCase):
+    {methods}
+    """)
+
+METHOD = "    def test_{index}(self):\n        work({kind!r}, {seconds})\n"
+
+
+def generate(
+    directory: str, kind: str, modules: int, tests: int, seconds: float
+) -> None:
+    for m in range(modules):
+        # uneven classes : LPT balancing matters
+        methods = "".join(
+            METHOD.format(index=t, kind=kind, seconds=seconds * (1 + m % 3))
+            for t in range(tests)
+        )
+        with open(os.path.join(directory, "test_generated_{}.py".format(m)), "w") as f:
+            f.write(TEMPLATE.format(index=m, methods=methods))
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--kind", choices=["sleep", "cpu"], default="sleep")
+    parser.add_argument("--modules", type=int, default=16)
+    parser.add_argument("--tests", type=int, default=10)
+    parser.add_argument("--seconds", type=float, default=0.005)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args(argv)
+    result = {"kind": args.kind, "cpu_count": os.cpu_count()}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        generate(tmpdir, args.kind, args.modules, args.tests, args.seconds)
+        sys.path.insert(0, tmpdir)
+        suite = unittest.TestLoader().discover(tmpdir, top_level_dir=tmpdir)
+        start = time.perf_counter()
+        unittest.TextTestRunner(stream=io.StringIO()).run(suite)
+        result["serial"] = time.perf_counter() - start
+        for processes in args.processes:
+            start = time.perf_counter()
+            run(tmpdir, top_level_dir=tmpdir, processes=processes, stream=io.StringIO())
+            result["parallel -j {}".format(processes)] = time.perf_counter() - start
+        sys.path.remove(tmpdir)
+    dump(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# eager split() / splitlines() vs lazy isplit() / isplitlines() : throughput and peak memory
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from snacks.textsplit import isplit, isplitlines, open_mmap
+from . import dump
+
+
+def count(items) -> int:
+    n = 0
+    for _ in items:
+        n += 1
+    return n
+
+
+def measure(func: Callable[[], Any], size: int) -> Dict[str, float]:
+    # timing and peak memory are measured separately (tracemalloc slows allocations)
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"elapsed": elapsed, "MB/s": size / elapsed / 1e6, "peak_MB": peak / 1e6}
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mb", type=int, default=32)
+    args = parser.parse_args(argv)
+    line = "2020-03-01,INFO,some message text,12345\n"
+    text = line * (args.mb * 1_000_000 // len(line))
+    size = len(text)
+    fd, path = tempfile.mkstemp(suffix=".csv")
+    try:
+        with os.fdopen(fd, "w", newline="") as f:
+            f.write(text)
+
+        def file_eager():
+            with open(path, "rb") as f:
+                return count(f.read().splitlines())
+
+        def file_mmap_lazy():
+            with open_mmap(path) as m:
+                return count(isplitlines(m))
+
+        result = {
+            "size": size,
+            "str.splitlines": measure(lambda: count(text.splitlines()), size),
+            "isplitlines(str)": measure(lambda: count(isplitlines(text)), size),
+            "str.split(',')": measure(lambda: count(text.split(",")), size),
+            "isplit(str, ',')": measure(lambda: count(isplit(text, ",")), size),
+            "read().splitlines()": measure(file_eager, size),
+            "isplitlines(mmap)": measure(file_mmap_lazy, size),
+        }
+    finally:
+        os.remove(path)
+    dump(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# per-test tempfile.TemporaryDirectory() vs TempDirPool, like setUp() / tearDown() of
+# TestUnittestSetupTeardown : 3 directories per test, one small file written in each.
+import argparse
+import os
+import tempfile
+import time
+
+from snacks.testing.tmppool import TempDirPool, default_base_dir
+from . import dump
+
+SUFFIXES = [(None, None), ("_suffix0_", None), ("_suffix0_", "_prefix0_")]
+
+
+def write_files(dirpaths) -> None:
+    for dirpath in dirpaths:
+        with open(os.path.join(dirpath, "data.txt"), "w", encoding="utf8") as f:
+            f.write("日本語テキスト")
+
+
+def bench_tempdir(tests: int, base_dir: str) -> float:
+    start = time.perf_counter()
+    for _ in range(tests):
+        tempdirs = [tempfile.TemporaryDirectory(s, p, base_dir) for s, p in SUFFIXES]
+        write_files([t.name for t in tempdirs])
+        for t in tempdirs:
+            t.cleanup()
+    return time.perf_counter() - start
+
+
+def bench_pool(tests: int, base_dir: str) -> float:
+    with TempDirPool(base_dir=base_dir) as pool:
+        start = time.perf_counter()
+        for _ in range(tests):
+            dirpaths = [pool.acquire(s, p) for s, p in SUFFIXES]
+            write_files(dirpaths)
+            for dirpath in dirpaths:
+                pool.release(dirpath)
+        return time.perf_counter() - start
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tests", type=int, default=5000)
+    args = parser.parse_args(argv)
+    base_dirs = sorted({tempfile.gettempdir(), default_base_dir(use_shm=True)})
+    result = {"tests": args.tests}
+    for base_dir in base_dirs:
+        for name, bench in (
+            ("TemporaryDirectory", bench_tempdir),
+            ("TempDirPool", bench_pool),
+        ):
+            elapsed = bench(args.tests, base_dir)
+            result["{} {} us/test".format(name, base_dir)] = elapsed / args.tests * 1e6
+    dump(result)
+
+
+if __name__ == "__main__":
+    main()
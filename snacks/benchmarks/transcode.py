@@ -0,0 +1,71 @@
+# whole file read().decode() vs streaming decode / transcode : throughput and peak memory
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from snacks.transcode import DEFAULT_CHUNK_SIZE, decode_stream, transcode_file
+from . import dump
+
+
+def measure(func: Callable[[], Any], size: int) -> Dict[str, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "elapsed": elapsed,
+        "MB/s": size / elapsed / 1e6,
+        "peak_MB": peak / 1e6,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mb", type=int, default=32)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+    line = "2020-03-01 INFO ログ出力 mixed ascii / 日本語 / emoji 😀\n".encode("utf_8")
+    fd, path = tempfile.mkstemp(suffix=".log")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for _ in range(args.mb * 1_000_000 // len(line)):
+                f.write(line)
+        size = os.path.getsize(path)
+
+        def whole_decode() -> None:
+            with open(path, "rb") as f:
+                f.read().decode("utf_8")
+
+        def stream_decode() -> None:
+            with open(path, "rb") as f:
+                for _ in decode_stream(f, "utf_8", chunk_size=args.chunk_size):
+                    pass
+
+        def whole_transcode() -> None:
+            with open(path, "rb") as f, open(os.devnull, "wb") as dst:
+                dst.write(f.read().decode("utf_8").encode("utf_16"))
+
+        def stream_transcode() -> None:
+            with open(path, "rb") as f, open(os.devnull, "wb") as dst:
+                transcode_file(f, dst, "utf_8", "utf_16", chunk_size=args.chunk_size)
+
+        result = {
+            "size": size,
+            "chunk_size": args.chunk_size,
+            "read().decode()": measure(whole_decode, size),
+            "decode_stream": measure(stream_decode, size),
+            "read().decode().encode()": measure(whole_transcode, size),
+            "transcode_file": measure(stream_transcode, size),
+        }
+    finally:
+        os.remove(path)
+    dump(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+# typing.get_type_hints() vs snacks.typehints.get_hints() (cache hit path)
+from dataclasses import dataclass, field
+from typing import Any, List, Union, get_type_hints
+
+from snacks.typehints import get_hints, get_hint_infos
+from . import best_of, dump
+
+
+@dataclass
+class Demo:
+    str1: str = ""
+    int1: int = 0
+    strings1: List[str] = field(default_factory=list)
+
+    def some_method(self, str2: str, int2: int, float2: float, any2: Any):
+        pass
+
+    @classmethod
+    def some_class_method(cls, str3: str, list3: List[Any], union3: Union[str, int]):
+        pass
+
+
+def main(argv=None) -> None:
+    number = 10_000
+    o1 = Demo()
+    result = {}
+    for label, obj in (
+        ("class", Demo),
+        ("method", o1.some_method),
+        ("classmethod", Demo.some_class_method),
+    ):
+        raw = best_of(lambda: get_type_hints(obj), number=number)
+        cached = best_of(lambda: get_hints(obj), number=number)
+        infos = best_of(lambda: get_hint_infos(obj), number=number)
+        result[label] = {
+            "get_type_hints": raw,
+            "get_hints": cached,
+            "get_hint_infos": infos,
+            "speedup": raw / cached,
+        }
+    dump(result)
+
+
+if __name__ == "__main__":
+    main()
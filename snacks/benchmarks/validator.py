@@ -0,0 +1,81 @@
+# compiled validator vs naive recursive isinstance walker, on bulk payloads.
+import argparse
+import dataclasses
+import time
+from typing import Any, Dict, List, Union, get_args, get_origin, get_type_hints
+
+from snacks.validator import validate_many
+from . import dump
+
+
+@dataclasses.dataclass
+class Record:
+    name: str
+    count: int
+    price: float
+    tags: List[str]
+    attrs: Dict[str, Union[str, int]]
+
+
+def _naive_check(value: Any, hint: Any) -> bool:
+    # walks the hint tree for every value
+    origin = get_origin(hint)
+    if hint is Any:
+        return True
+    if hint is float:
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    if origin is list:
+        return isinstance(value, list) and all(
+            _naive_check(v, get_args(hint)[0]) for v in value
+        )
+    if origin is dict:
+        k_hint, v_hint = get_args(hint)
+        return isinstance(value, dict) and all(
+            _naive_check(k, k_hint) and _naive_check(v, v_hint)
+            for k, v in value.items()
+        )
+    if origin is Union:
+        return any(_naive_check(value, h) for h in get_args(hint))
+    return type(value) is hint
+
+
+def naive_validate_many(cls: type, payloads: List[Dict[str, Any]]) -> List[Any]:
+    result = []
+    for payload in payloads:
+        hints = get_type_hints(cls)
+        for name, hint in hints.items():
+            if not _naive_check(payload[name], hint):
+                raise ValueError(name)
+        result.append(cls(**payload))
+    return result
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-n", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+    payloads = [
+        {
+            "name": "item{}".format(i % 1000),
+            "count": i,
+            "price": 1.5,
+            "tags": ["a", "b", "c"],
+            "attrs": {"color": "red", "weight": i},
+        }
+        for i in range(args.n)
+    ]
+    result: Dict[str, Any] = {"n": args.n}
+    for label, func in (
+        ("naive", naive_validate_many),
+        ("compiled", validate_many),
+    ):
+        start = time.perf_counter()
+        func(Record, payloads)
+        elapsed = time.perf_counter() - start
+        result[label] = {"elapsed": elapsed, "records_per_sec": args.n / elapsed}
+    result["speedup"] = result["naive"]["elapsed"] / result["compiled"]["elapsed"]
+    dump(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# workloads shared by benchmarks.
+# module level functions : picklable for process pools.
+# async_* : same workload as coroutine, for asyncio event loop.
+import asyncio
+import os
+import socket
+
+from snacks.mypkgdemo1 import MyPkgDemo1a
+
+_LINE = "日本語テキスト1\n".encode("utf8")
+
+
+def cpu_bound(loops: int) -> int:
+    # pure python tight loop : holds the GIL all the time.
+    o = MyPkgDemo1a(1)
+    n = 0
+    for _ in range(loops):
+        n = o.add(n)
+    return n
+
+
+async def async_cpu_bound(loops: int) -> int:
+    # no await inside : blocks the event loop (other coroutines) until done.
+    return cpu_bound(loops)
+
+
+def io_bound(dirpath: str, index: int, lines: int = 100) -> int:
+    # same file write/read as TestUnittestSetupTeardown.test_demo1,
+    # the GIL is released during the file system calls.
+    filepath = os.path.join(dirpath, "日本語{}_utf8.txt".format(index))
+    with open(filepath, "w", encoding="utf8") as f:
+        for _ in range(lines):
+            print("日本語テキスト1", file=f)
+        f.flush()
+        os.fsync(f.fileno())
+    with open(filepath, "r", encoding="utf8") as f:
+        text = f.read()
+    os.remove(filepath)
+    return len(text)
+
+
+async def async_io_bound(dirpath: str, index: int, lines: int = 100) -> int:
+    # asyncio has no non-blocking local file I/O : file calls run in the default
+    # executor of the loop (what asyncio.to_thread() does on Python 3.9+).
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, io_bound, dirpath, index, lines)
+
+
+def socket_bound(lines: int = 100) -> int:
+    # line by line round trip over local socket pair,
+    # the GIL is released while waiting for the socket.
+    a, b = socket.socketpair()
+    n = 0
+    with a, b:
+        for _ in range(lines):
+            a.sendall(_LINE)
+            received = 0
+            while received < len(_LINE):
+                received += len(b.recv(len(_LINE) - received))
+            n += received
+    return n
+
+
+async def async_socket_bound(lines: int = 100) -> int:
+    # same round trip with asyncio streams, the event loop runs other coroutines
+    # while waiting for the socket.
+    a, b = socket.socketpair()
+    _, writer = await asyncio.open_connection(sock=a)
+    reader, peer = await asyncio.open_connection(sock=b)
+    n = 0
+    try:
+        for _ in range(lines):
+            writer.write(_LINE)
+            await writer.drain()
+            n += len(await reader.readexactly(len(_LINE)))
+    finally:
+        writer.close()
+        peer.close()
+        await writer.wait_closed()
+        await peer.wait_closed()
+    return n
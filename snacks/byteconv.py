@@ -0,0 +1,99 @@
+# bulk bytes <> ints conversion, instead of int.from_bytes() / to_bytes() per value.
+# (see test_string_lietral_byte_array_conversion_unicode_demo in test_string_demo.py)
+# ref: https://docs.python.org/ja/3/library/stdtypes.html#memoryview.cast
+# ref: https://docs.python.org/ja/3/library/array.html
+# ref: https://docs.python.org/ja/3/library/struct.html#struct.iter_unpack
+#
+#   as_ints(b"\x01\x00\x02\x00", 2).tolist()       # -> [1, 2]
+#   from_ints([1, 2], 2, "big")                     # -> b"\x00\x01\x00\x02"
+#   list(iter_ints(b"\x00\x01\x00\x02", 2, "big"))  # -> [1, 2]
+import array
+import struct
+import sys
+from typing import Dict, Iterable, Iterator, Tuple, Union
+
+BytesLike = Union[bytes, bytearray, memoryview]
+IntArray = Union[memoryview, array.array]
+
+_BYTEORDER_PREFIX = {"little": "<", "big": ">"}
+
+# (width, signed) -> native format code. memoryview.cast() accepts native formats only.
+_FORMATS: Dict[Tuple[int, bool], str] = {}
+for _code in "BHILQ":
+    _FORMATS.setdefault((struct.calcsize(_code), False), _code)
+    _FORMATS.setdefault((struct.calcsize(_code.lower()), True), _code.lower())
+del _code
+
+# (width, signed) -> standard size format code, used with "<" / ">" prefix in struct.
+_STD_FORMATS = {
+    (width, signed): code.lower() if signed else code
+    for width, code in ((1, "B"), (2, "H"), (4, "I"), (8, "Q"))
+    for signed in (False, True)
+}
+
+
+def _format(width: int, byteorder: str, signed: bool) -> str:
+    if byteorder not in _BYTEORDER_PREFIX:
+        raise ValueError(
+            "byteorder must be either 'little' or 'big': {!r}".format(byteorder)
+        )
+    try:
+        return _FORMATS[(width, signed)]
+    except KeyError:
+        raise ValueError("unsupported width: {}".format(width)) from None
+
+
+def _check_length(view: memoryview, width: int) -> None:
+    if view.nbytes % width:
+        raise ValueError(
+            "buffer length {} is not a multiple of width {}".format(view.nbytes, width)
+        )
+
+
+def as_ints(
+    buffer: BytesLike, width: int = 1, byteorder: str = "little", signed: bool = False
+) -> IntArray:
+    # native byteorder : memoryview over buffer (zero copy, writable if buffer is).
+    # other byteorder : one copy into array.array + byteswap().
+    # both support len(), [i], iteration and tolist().
+    fmt = _format(width, byteorder, signed)
+    view = memoryview(buffer).cast("B")
+    _check_length(view, width)
+    if byteorder == sys.byteorder:
+        return view.cast(fmt)
+    ints = array.array(fmt)
+    ints.frombytes(view)
+    ints.byteswap()
+    return ints
+
+
+def iter_ints(
+    buffer: BytesLike, width: int = 1, byteorder: str = "little", signed: bool = False
+) -> Iterator[int]:
+    # streaming, any byteorder without copying whole buffer.
+    _format(width, byteorder, signed)
+    view = memoryview(buffer).cast("B")
+    _check_length(view, width)
+    fmt = _BYTEORDER_PREFIX[byteorder] + _STD_FORMATS[(width, signed)]
+    for (value,) in struct.iter_unpack(fmt, view):
+        yield value
+
+
+def from_ints(
+    values: Iterable[int],
+    width: int = 1,
+    byteorder: str = "little",
+    signed: bool = False,
+) -> bytes:
+    # OverflowError if value does not fit in width (same as int.to_bytes())
+    fmt = _format(width, byteorder, signed)
+    ints = (
+        values
+        if isinstance(values, array.array) and values.typecode == fmt
+        else array.array(fmt, values)
+    )
+    if byteorder != sys.byteorder:
+        if ints is values:
+            ints = array.array(fmt, ints)
+        ints.byteswap()
+    return ints.tobytes()
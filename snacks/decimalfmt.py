@@ -0,0 +1,83 @@
+# bulk Decimal quantize + format for report columns.
+# (see f"{v:{width}.{precision}}" with decimal.Decimal in test_f_string of test_string_demo.py)
+# ref: https://docs.python.org/ja/3/library/decimal.html#decimal.Decimal.quantize
+#
+#   DecimalFormatter(places=2, width=10).format_column([Decimal("12.345"), Decimal("-1")])
+#   # -> ["     12.34", "     -1.00"]
+#
+# rounding is done with formatter's own Context (quantize() or format() in localcontext),
+# so the result does not depend on caller's decimal.getcontext().
+# no float fallback : float formatting differs for values like Decimal("2.675").
+import decimal
+from decimal import Decimal
+from typing import Dict, Iterable, List
+
+_exponents: Dict[int, Decimal] = {}
+
+# str() of quantized value is plain (not exponential) notation up to 6 places
+_STR_MAX_PLACES = 6
+
+
+def exponent(places: int) -> Decimal:
+    # Decimal("1E-{places}"), cached per places
+    try:
+        return _exponents[places]
+    except KeyError:
+        pass
+    if places < 0:
+        raise ValueError("places must be >= 0: {}".format(places))
+    return _exponents.setdefault(places, Decimal(1).scaleb(-places))
+
+
+class DecimalFormatter:
+    def __init__(
+        self,
+        places: int = 2,
+        width: int = 0,
+        rounding: str = decimal.ROUND_HALF_EVEN,
+        thousands: bool = False,
+    ):
+        self.places = places
+        self.width = width
+        self.exponent = exponent(places)
+        # MAX_PREC : quantize() never fails by too many digits
+        self.context = decimal.Context(prec=decimal.MAX_PREC, rounding=rounding)
+        self.spec = ">{}{}.{}f".format(width or "", "," if thousands else "", places)
+        self.use_str = not thousands and places <= _STR_MAX_PLACES
+
+    def format(self, value: Decimal) -> str:
+        return self.format_column((value,))[0]
+
+    def format_column(self, values: Iterable[Decimal]) -> List[str]:
+        values = values if isinstance(values, (list, tuple)) else list(values)
+        if not self.use_str:
+            return self._format_all(values)
+        context = self.context
+        quantize = Decimal.quantize
+        exp = self.exponent
+        try:
+            quantized = [quantize(v, exp, None, context) for v in values]
+        except decimal.InvalidOperation:
+            # rare : Infinity / sNaN in column, format() whole column instead.
+            return self._format_all(values)
+        # str() + rjust() of quantized value is faster than format()
+        width = self.width
+        if not width:
+            return list(map(str, quantized))
+        return [str(q).rjust(width) for q in quantized]
+
+    def _format_all(self, values: Iterable[Decimal]) -> List[str]:
+        # format() rounds with current context : formatter's context is used.
+        spec = self.spec
+        with decimal.localcontext(self.context):
+            return [format(v, spec) for v in values]
+
+
+def format_decimals(
+    values: Iterable[Decimal],
+    places: int = 2,
+    width: int = 0,
+    rounding: str = decimal.ROUND_HALF_EVEN,
+    thousands: bool = False,
+) -> List[str]:
+    return DecimalFormatter(places, width, rounding, thousands).format_column(values)
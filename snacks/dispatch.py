@@ -0,0 +1,237 @@
+# single dispatch with exact-type cache, instance-bound dispatch and bulk dispatch.
+# ref: https://docs.python.org/ja/3/library/functools.html#functools.singledispatch
+#
+# MRO/ABC resolution is delegated to functools.singledispatch, resolved handler is
+# cached per exact type in a plain dict: a hit costs one dict lookup.
+# the cache is cleared when it reaches CACHE_SIZE types, so dynamically created classes
+# (type(), test doubles) are not kept alive forever.
+#
+#   @typedispatch
+#   def f(arg) -> str: ...
+#
+#   @f.register
+#   def _f_str(arg: str) -> str: ...
+#
+#   f.dispatch_many(["aa", 1, "bb"])  # handler lookup once per type
+from functools import singledispatch, update_wrapper
+from abc import get_cache_token
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+CACHE_SIZE = 1024
+
+
+class TypeDispatcher:
+    def __init__(self, default: Callable[..., Any]):
+        self._singledispatch = singledispatch(default)
+        self._cache: Dict[type, Callable[..., Any]] = {}
+        # same as singledispatch : ABC registration may change the resolution,
+        # checked only when an ABC has been registered.
+        self._cache_token: Optional[object] = None
+        update_wrapper(self, default)
+
+    @property
+    def registry(self):
+        return self._singledispatch.registry
+
+    def register(self, cls, func=None):
+        # same usage as singledispatch.register() : register(int, f),
+        # @register(int) or @register with type annotation.
+        result = self._singledispatch.register(cls, func)
+        if self._cache_token is None and any(
+            hasattr(t, "__abstractmethods__") for t in self.registry
+        ):
+            self._cache_token = get_cache_token()
+        self._cache.clear()
+        return result
+
+    def dispatch(self, cls: type) -> Callable[..., Any]:
+        if self._cache_token is not None:
+            token = get_cache_token()
+            if token != self._cache_token:
+                self._cache.clear()
+                self._cache_token = token
+        try:
+            return self._cache[cls]
+        except KeyError:
+            impl = self._singledispatch.dispatch(cls)
+            if len(self._cache) >= CACHE_SIZE:
+                # cleared in place : typedispatch() wrappers hold the same dict
+                self._cache.clear()
+            self._cache[cls] = impl
+            return impl
+
+    def cache_clear(self) -> None:
+        self._cache.clear()
+
+    def __call__(self, arg, *args, **kwargs):
+        impl = self._cache.get(arg.__class__)
+        if impl is None or self._cache_token is not None:
+            impl = self.dispatch(arg.__class__)
+        return impl(arg, *args, **kwargs)
+
+    def dispatch_many(self, items: Sequence[Any], *args, **kwargs) -> List[Any]:
+        # items are grouped by type, handler is resolved once per group.
+        # results are returned in the order of items.
+        return _dispatch_many(self, None, items, args, kwargs)
+
+
+def _dispatch_many(dispatcher, bound, items, args, kwargs) -> List[Any]:
+    groups: Dict[type, List[int]] = {}
+    for index, item in enumerate(items):
+        groups.setdefault(item.__class__, []).append(index)
+    results: List[Any] = [None] * len(items)
+    for cls, indexes in groups.items():
+        impl = dispatcher.dispatch(cls)
+        if bound is None:
+            for index in indexes:
+                results[index] = impl(items[index], *args, **kwargs)
+        else:
+            for index in indexes:
+                results[index] = impl(bound, items[index], *args, **kwargs)
+    return results
+
+
+def typedispatch(func: Callable[..., Any]) -> Callable[..., Any]:
+    # returns plain function (like functools.singledispatch does):
+    # calling a function is cheaper than calling TypeDispatcher.__call__().
+    dispatcher = TypeDispatcher(func)
+    cache = dispatcher._cache
+
+    def wrapper(arg, *args, **kwargs):
+        impl = cache.get(arg.__class__)
+        if impl is None or dispatcher._cache_token is not None:
+            impl = dispatcher.dispatch(arg.__class__)
+        return impl(arg, *args, **kwargs)
+
+    wrapper.dispatcher = dispatcher  # type: ignore
+    wrapper.register = dispatcher.register  # type: ignore
+    wrapper.dispatch = dispatcher.dispatch  # type: ignore
+    wrapper.dispatch_many = dispatcher.dispatch_many  # type: ignore
+    wrapper.registry = dispatcher.registry  # type: ignore
+    wrapper.cache_clear = dispatcher.cache_clear  # type: ignore
+    update_wrapper(wrapper, func)
+    return wrapper
+
+
+class BoundDispatcher:
+    # returned by dispatchmethod.__get__() : dispatch table is shared by the class,
+    # nothing is rebuilt per instance.
+    __slots__ = ("_dispatcher", "_self")
+
+    def __init__(self, dispatcher: TypeDispatcher, bound: Any):
+        self._dispatcher = dispatcher
+        self._self = bound
+
+    def __call__(self, arg, *args, **kwargs):
+        dispatcher = self._dispatcher
+        impl = (
+            dispatcher._cache.get(arg.__class__)
+            if dispatcher._cache_token is None
+            else None
+        )
+        if impl is None:
+            impl = dispatcher.dispatch(arg.__class__)
+        return impl(self._self, arg, *args, **kwargs)
+
+    def dispatch_many(self, items: Sequence[Any], *args, **kwargs) -> List[Any]:
+        return _dispatch_many(self._dispatcher, self._self, items, args, kwargs)
+
+
+def _unwrap(method) -> Tuple[str, Callable[..., Any]]:
+    if isinstance(method, classmethod):
+        return "classmethod", method.__func__
+    if isinstance(method, staticmethod):
+        return "staticmethod", method.__func__
+    return "method", method
+
+
+class dispatchmethod:
+    # like functools.singledispatchmethod, dispatches on the first argument after
+    # self/cls. classmethod and staticmethod also work (bpo-39679):
+    #
+    #   class C1:
+    #       @dispatchmethod
+    #       def add(self, arg1) -> str: ...
+    #
+    #       @add.register
+    #       def _add_str(self, arg1: str) -> str: ...
+    #
+    #       @dispatchmethod
+    #       @classmethod
+    #       def bigger(cls, arg1) -> str: ...
+    #
+    #       @bigger.register
+    #       @classmethod
+    #       def _bigger_str(cls, arg1: str) -> str: ...
+    #
+    # for classmethod, the bound dispatcher is cached per class (in the class's own
+    # __dict__, so it lives as long as the class), and C1.bigger(...) does not create
+    # a new bound object on every call.
+    def __init__(self, func: Callable[..., Any]):
+        self.kind, unwrapped = _unwrap(func)
+        self.dispatcher = TypeDispatcher(unwrapped)
+        self.func = func
+        # class attribute name of bound dispatcher, unique per dispatchmethod
+        # (same name in subclass may be another dispatchmethod)
+        self._bound_attr = "_dispatchmethod_bound_{:x}".format(id(self))
+        update_wrapper(self, unwrapped)
+
+    def _register(self, cls, method):
+        kind, unwrapped = _unwrap(method)
+        if kind != self.kind:
+            raise TypeError(
+                "cannot register {} to {} dispatcher {!r}".format(
+                    kind, self.kind, self.__name__
+                )
+            )
+        if cls is None:
+            # type is taken from the annotation of first dispatched argument
+            self.dispatcher.register(unwrapped)
+        else:
+            self.dispatcher.register(cls, unwrapped)
+        # returns classmethod/staticmethod object as is, for the class body
+        return method
+
+    def register(self, cls, method=None):
+        # register(int, method), @register(int) or @register with type annotation.
+        if method is not None:
+            return self._register(cls, method)
+        if isinstance(cls, type):
+            return lambda method: self._register(cls, method)
+        return self._register(None, cls)
+
+    def __get__(self, obj, cls=None):
+        if self.kind == "method":
+            if obj is None:
+                return self
+            return BoundDispatcher(self.dispatcher, obj)
+        if self.kind == "staticmethod":
+            return self.dispatcher
+        if cls is None:
+            cls = type(obj)
+        bound = cls.__dict__.get(self._bound_attr)
+        if bound is None:
+            bound = _bind_to_class(self.dispatcher, cls)
+            try:
+                setattr(cls, self._bound_attr, bound)
+            except TypeError:
+                pass  # class attribute is not settable : not cached
+        return bound
+
+
+def _bind_to_class(dispatcher: TypeDispatcher, cls: type) -> Callable[..., Any]:
+    # plain function (not BoundDispatcher) : cheaper to call, built once per class.
+    cache = dispatcher._cache
+
+    def bound(arg, *args, **kwargs):
+        impl = cache.get(arg.__class__)
+        if impl is None or dispatcher._cache_token is not None:
+            impl = dispatcher.dispatch(arg.__class__)
+        return impl(cls, arg, *args, **kwargs)
+
+    def dispatch_many(items: Sequence[Any], *args, **kwargs) -> List[Any]:
+        return _dispatch_many(dispatcher, cls, items, args, kwargs)
+
+    update_wrapper(bound, dispatcher.__wrapped__)  # type: ignore
+    bound.dispatch_many = dispatch_many  # type: ignore
+    return bound
@@ -0,0 +1,80 @@
+# Enum with precomputed lookup index, for enums with many members.
+# ref: https://docs.python.org/ja/3/library/enum.html
+#
+# FastEnum is a normal Enum (@unique, auto(), _generate_next_value_, custom __new__,
+# _missing_ ... work as is), the metaclass additionally builds at class creation:
+#   - value -> member dict  (from_value)
+#   - name -> member dict   (from_name, includes aliases)
+#   - members tuple in definition order (iteration, ordinal, from_ordinal)
+#
+#   class Animals(FastEnum):
+#       CAT = 1
+#       DOG = 2
+#
+#   Animals.from_value(2)     # -> Animals.DOG, no EnumMeta.__call__
+#   Animals.from_name("CAT")  # -> Animals.CAT
+#   Animals.DOG.ordinal       # -> 1
+from enum import Enum, EnumMeta
+from typing import Any, Dict, Iterator, Tuple, Type, TypeVar
+
+E = TypeVar("E", bound="FastEnum")
+
+
+class FastEnumMeta(EnumMeta):
+    def __new__(metacls, cls, bases, classdict, **kwds):
+        enum_class = super().__new__(metacls, cls, bases, classdict, **kwds)
+        members: Tuple[Any, ...] = tuple(
+            enum_class._member_map_[name] for name in enum_class._member_names_
+        )
+        by_value: Dict[Any, Any] = {}
+        for ordinal, member in enumerate(members):
+            member._ordinal_ = ordinal
+            try:
+                by_value.setdefault(member._value_, member)
+            except TypeError:
+                # unhashable value : from_value() falls back to Enum lookup
+                pass
+        enum_class._fast_members_ = members
+        enum_class._fast_by_value_ = by_value
+        enum_class._fast_by_name_ = dict(enum_class._member_map_)
+        return enum_class
+
+    def __iter__(cls) -> Iterator[Any]:
+        return iter(cls._fast_members_)
+
+    def __reversed__(cls) -> Iterator[Any]:
+        return reversed(cls._fast_members_)
+
+    def __len__(cls) -> int:
+        return len(cls._fast_members_)
+
+
+class FastEnum(Enum, metaclass=FastEnumMeta):
+    @classmethod
+    def from_value(cls: Type[E], value: Any) -> E:
+        try:
+            return cls._fast_by_value_[value]  # type: ignore
+        except (KeyError, TypeError):
+            # not found (or unhashable) : same behaviour and error as cls(value),
+            # including _missing_() hook.
+            return cls(value)
+
+    @classmethod
+    def from_name(cls: Type[E], name: str) -> E:
+        try:
+            return cls._fast_by_name_[name]  # type: ignore
+        except KeyError:
+            raise KeyError(name) from None
+
+    @classmethod
+    def from_ordinal(cls: Type[E], ordinal: int) -> E:
+        return cls._fast_members_[ordinal]  # type: ignore
+
+    @classmethod
+    def members(cls: Type[E]) -> Tuple[E, ...]:
+        # canonical members (without aliases) in definition order
+        return cls._fast_members_  # type: ignore
+
+    @property
+    def ordinal(self) -> int:
+        return self._ordinal_  # type: ignore
@@ -0,0 +1,191 @@
+# precompiled str.format() template : format string is parsed once (string.Formatter.parse)
+# and compiled into a function returning an f-string, so each call skips template parsing
+# and arguments are bound to local variables by the function call itself.
+# (see test_format / test_f_string in test_string_demo.py)
+# ref: https://docs.python.org/ja/3/library/string.html#string.Formatter.parse
+# ref: https://docs.python.org/ja/3/reference/lexical_analysis.html#f-strings
+#
+#   fmt = compile_format("{0:0>8b},{n:+,.2f}")
+#   fmt(45, n=1234.567)                               # -> "00101101,+1,234.57"
+#   format_rows("{}:{:>5}", [("a", 1), ("b", 2)])     # -> "a:    1\nb:    2\n"
+import io
+import itertools
+import keyword
+import re
+import string
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, TextIO
+
+_parse = string.Formatter().parse
+
+# "name", ".attr" and "[key]" parts of field name (same as str.format())
+_FIELD_FIRST = re.compile(r"[^.\[]*")
+_FIELD_REST = re.compile(r"\.([^.\[]+)|\[([^\]]+)\]")
+# format spec which can be written into f-string source as is
+_SAFE_SPEC = re.compile(r"[\w<>=^+\- #,.%]*")
+
+
+class _Compiler:
+    def __init__(self, template: str):
+        self.template = template
+        self.auto_index = 0
+        self.manual = False
+        self.consts: Dict[str, Any] = {}
+        self.positional: Dict[int, str] = {}
+        self.keywords: Dict[str, str] = {}
+
+    def const(self, value: Any) -> str:
+        name = "_format_c{}".format(len(self.consts))
+        self.consts[name] = value
+        return name
+
+    def arg(self, first: str) -> str:
+        if not first:
+            if self.manual:
+                raise ValueError(
+                    "cannot switch from manual field specification to automatic field numbering"
+                )
+            self.auto_index += 1
+            first = str(self.auto_index - 1)
+        elif first.isdecimal():
+            if self.auto_index:
+                raise ValueError(
+                    "cannot switch from automatic field numbering to manual field specification"
+                )
+            self.manual = True
+        if first.isdecimal():
+            # "00", "٣" (non ASCII decimal digit) : same index as str.format()
+            index = int(first)
+            return self.positional.setdefault(index, "_format_p{}".format(index))
+        if first not in self.keywords:
+            # non ASCII identifier is NFKC normalized in source ("\ufb01" -> "fi") :
+            # passed through _format_kwargs instead
+            if (
+                first.isascii()
+                and first.isidentifier()
+                and not keyword.iskeyword(first)
+                and not first.startswith("_format_")
+            ):
+                self.keywords[first] = first
+            else:
+                self.keywords[first] = "_format_k{}".format(len(self.keywords))
+        return self.keywords[first]
+
+    def field(self, field_name: str) -> str:
+        first = _FIELD_FIRST.match(field_name).group()  # type: ignore
+        expr = self.arg(first)
+        size = len(first)
+        rest = field_name[size:]
+        pos = 0
+        for match in _FIELD_REST.finditer(rest):
+            if match.start() != pos:
+                raise ValueError(
+                    "Only '.' or '[' may follow ']' in format field specifier"
+                )
+            pos = match.end()
+            attr, key = match.groups()
+            if (
+                attr is not None
+                and attr.isascii()
+                and attr.isidentifier()
+                and not keyword.iskeyword(attr)
+            ):
+                expr = "{}.{}".format(expr, attr)
+            elif attr is not None:
+                expr = "getattr({}, {})".format(expr, self.const(attr))
+            elif key.isdecimal():
+                expr = "{}[{}]".format(expr, int(key))
+            else:
+                expr = "{}[{}]".format(expr, self.const(key))
+        if pos != len(rest):
+            raise ValueError("Only '.' or '[' may follow ']' in format field specifier")
+        return expr
+
+    def conversion(self, conversion: Optional[str]) -> str:
+        if not conversion:
+            return ""
+        if conversion not in ("r", "s", "a"):
+            raise ValueError("Unknown conversion specifier {}".format(conversion))
+        return "!" + conversion
+
+    def spec(self, format_spec: str) -> str:
+        # nested replacement fields in spec, e.g. "{width}.{precision}"
+        parts: List[str] = []
+        for literal, field_name, nested_spec, conversion in _parse(format_spec):
+            if literal:
+                parts.append(
+                    literal
+                    if _SAFE_SPEC.fullmatch(literal)
+                    else "{" + self.const(literal) + "}"
+                )
+            if field_name is not None:
+                if nested_spec:
+                    raise ValueError("Max string recursion exceeded")
+                parts.append(
+                    "{" + self.field(field_name) + self.conversion(conversion) + "}"
+                )
+        return "".join(parts)
+
+    def compile(self) -> Callable[..., str]:
+        pieces: List[str] = []
+        for literal, field_name, format_spec, conversion in _parse(self.template):
+            if literal:
+                escaped = literal.replace("{", "{{").replace("}", "}}")
+                pieces.append("f" + repr(escaped))
+            if field_name is None:
+                continue
+            source = self.field(field_name) + self.conversion(conversion)
+            if format_spec:
+                source += ":" + self.spec(format_spec)
+            pieces.append("f'{" + source + "}'")
+        # arguments are bound by function call itself :
+        #   def _format(_format_p0, _format_p1, /, *_format_args, name, **_format_kwargs)
+        params = []
+        if self.positional:
+            params.extend(
+                "_format_p{}".format(i) for i in range(max(self.positional) + 1)
+            )
+            params.append("/")
+        params.append("*_format_args")
+        params.extend(name for key, name in self.keywords.items() if key == name)
+        params.append("**_format_kwargs")
+        lines = ["def _format({}):".format(", ".join(params))]
+        for key, name in self.keywords.items():
+            if key != name:
+                lines.append(
+                    "    {} = _format_kwargs[{}]".format(name, self.const(key))
+                )
+        lines.append("    return {}".format(" ".join(pieces) if pieces else "''"))
+        namespace = dict(self.consts)
+        exec("\n".join(lines), namespace)
+        func = namespace["_format"]
+        func.template = self.template
+        return func
+
+
+@lru_cache(maxsize=256)
+def compile_format(template: str) -> Callable[..., str]:
+    # compiled(*args, **kwargs) == template.format(*args, **kwargs)
+    # except missing argument raises TypeError (not IndexError / KeyError).
+    return _Compiler(template).compile()
+
+
+def format_rows(
+    template: str,
+    rows: Iterable[Any],
+    end: str = "\n",
+    out: Optional[TextIO] = None,
+) -> Optional[str]:
+    # rows of sequence : template.format(*row), rows of mapping : template.format(**row).
+    # all rows are written into one buffer (out, or new StringIO returned as str).
+    fmt = compile_format(template + end.replace("{", "{{").replace("}", "}}"))
+    buf = io.StringIO() if out is None else out
+    rows = iter(rows)
+    for first in rows:
+        rows = itertools.chain((first,), rows)
+        if isinstance(first, Mapping):
+            buf.writelines(fmt(**row) for row in rows)
+        else:
+            buf.writelines(itertools.starmap(fmt, rows))
+        break
+    return buf.getvalue() if out is None else None  # type: ignore
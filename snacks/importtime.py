@@ -0,0 +1,226 @@
+# "python -X importtime" output parser, import time tree and regression gate.
+# ref: https://docs.python.org/ja/3/using/cmdline.html#id5 (-X importtime)
+#
+# usage:
+#   python -m snacks.importtime --tree
+#   python -m snacks.importtime --baseline importtime_baseline.json --update-baseline
+#   python -m snacks.importtime --baseline importtime_baseline.json  # exit 1 on regression
+#                                                    # (exit 2 if baseline does not exist)
+#
+# output example (stderr, children are printed before their parent):
+#   import time: self [us] | cumulative | imported package
+#   import time:       140 |        140 |   snacks.mypkgdemo1._batch
+#   import time:       345 |        485 | snacks.mypkgdemo1
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+_PREFIX = "import time:"
+
+DEFAULT_MODULES = [
+    "snacks.mypkgdemo1",
+    # imports module1 twice: "import ... as module1" and "from .module1 import ..."
+    "snacks.mypkgdemo1.module2",
+    "tests.snacks",
+    "tests.snacks.mypkgdemo1",
+    "tests.snacks.mypkgdemo2",
+]
+
+
+class ImportTimeEntry(NamedTuple):
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> List[ImportTimeEntry]:
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith(_PREFIX):
+            continue
+        columns = line.partition(_PREFIX)[2].split("|")
+        if len(columns) != 3 or not columns[0].strip().isdigit():
+            # header line
+            continue
+        name_column = columns[2]
+        # one space after "|", then 2 spaces per nesting level
+        indent = len(name_column) - len(name_column.lstrip(" ")) - 1
+        entries.append(
+            ImportTimeEntry(
+                name=name_column.strip(),
+                self_us=int(columns[0]),
+                cumulative_us=int(columns[1]),
+                depth=indent // 2,
+            )
+        )
+    return entries
+
+
+def run_importtime(
+    statement: str, cwd: Optional[str] = None, python: str = sys.executable
+) -> List[ImportTimeEntry]:
+    # run statement (e.g. "import snacks.mypkgdemo1") in a fresh interpreter.
+    # -I is not used: PYTHONPATH / cwd must be kept to find the packages.
+    proc = subprocess.run(
+        [python, "-X", "importtime", "-c", statement],
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    return parse_importtime(proc.stderr)
+
+
+def total_us(entries: List[ImportTimeEntry], prefix: str = "") -> int:
+    # sum of self time of modules whose name starts with prefix
+    return sum(e.self_us for e in entries if e.name.startswith(prefix))
+
+
+@dataclass
+class ImportTimeNode:
+    name: str
+    self_us: int
+    cumulative_us: int
+    children: List["ImportTimeNode"] = field(default_factory=list)
+
+    def walk(self, depth: int = 0):
+        yield depth, self
+        for child in self.children:
+            yield from child.walk(depth + 1)
+
+
+def build_tree(entries: Sequence[ImportTimeEntry]) -> List[ImportTimeNode]:
+    # children are printed before their parent, so keep finished nodes per depth
+    # until the parent (depth - 1) line appears.
+    pending: Dict[int, List[ImportTimeNode]] = {}
+    for entry in entries:
+        node = ImportTimeNode(entry.name, entry.self_us, entry.cumulative_us)
+        node.children = pending.pop(entry.depth + 1, [])
+        pending.setdefault(entry.depth, []).append(node)
+    return pending.get(0, [])
+
+
+def format_tree(roots: Sequence[ImportTimeNode]) -> str:
+    lines = ["{:>10} {:>10}  module".format("self[us]", "cumul[us]")]
+    for root in roots:
+        for depth, node in root.walk():
+            lines.append(
+                "{:>10} {:>10}  {}{}".format(
+                    node.self_us, node.cumulative_us, "  " * depth, node.name
+                )
+            )
+    return "\n".join(lines)
+
+
+def import_cost_us(entries: Sequence[ImportTimeEntry], module: str) -> int:
+    # cumulative time of top level entries belonging to module.
+    # parent packages are usually nested under module itself (imported first by it),
+    # but are summed too when they appear as separate top level entries.
+    parts = module.split(".")
+    names = {".".join(parts[: i + 1]) for i in range(len(parts))}
+    return sum(e.cumulative_us for e in entries if e.depth == 0 and e.name in names)
+
+
+def measure(
+    modules: Sequence[str], runs: int = 5, cwd: Optional[str] = None
+) -> Dict[str, int]:
+    # median over fresh interpreters, one interpreter per module and run.
+    result = {}
+    for module in modules:
+        samples = [
+            import_cost_us(run_importtime("import " + module, cwd=cwd), module)
+            for _ in range(runs)
+        ]
+        result[module] = int(statistics.median(samples))
+    return result
+
+
+def compare(
+    baseline: Dict[str, int],
+    current: Dict[str, int],
+    threshold: float = 0.2,
+    min_delta_us: int = 1000,
+) -> List[str]:
+    # regression = slower than baseline by threshold ratio AND by min_delta_us.
+    # (min_delta_us absorbs the noise of sub-millisecond imports)
+    regressions = []
+    for module, current_us in sorted(current.items()):
+        if module not in baseline:
+            continue
+        baseline_us = baseline[module]
+        delta = current_us - baseline_us
+        if delta > min_delta_us and current_us > baseline_us * (1 + threshold):
+            regressions.append(
+                "{}: {}us -> {}us (+{:.0%})".format(
+                    module, baseline_us, current_us, delta / max(baseline_us, 1)
+                )
+            )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m snacks.importtime")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--tree", action="store_true", help="print import tree")
+    parser.add_argument("--baseline", help="baseline JSON file")
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="write baseline instead of checking",
+    )
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--min-delta-us", type=int, default=1000)
+    args = parser.parse_args(argv)
+    if args.update_baseline and not args.baseline:
+        parser.error("--update-baseline requires --baseline")
+    cwd = os.getcwd()
+
+    if args.tree:
+        for module in args.modules:
+            entries = run_importtime("import " + module, cwd=cwd)
+            top_package = module.split(".")[0]
+            roots = [
+                root
+                for root in build_tree(entries)
+                if root.name.split(".")[0] == top_package
+            ]
+            print("# import " + module)
+            print(format_tree(roots))
+
+    current = measure(args.modules, args.runs, cwd)
+    for module, us in current.items():
+        print("{:>10}us  {}".format(us, module))
+    if not args.baseline:
+        return 0
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf8") as f:
+            json.dump(current, f, indent=2, sort_keys=True)
+        print("baseline written: " + args.baseline)
+        return 0
+    if not os.path.exists(args.baseline):
+        # not written silently : mistyped path would make the gate always pass
+        print(
+            "baseline not found: {} (write it with --update-baseline)".format(
+                args.baseline
+            ),
+            file=sys.stderr,
+        )
+        return 2
+    with open(args.baseline, "r", encoding="utf8") as f:
+        baseline = json.load(f)
+    regressions = compare(baseline, current, args.threshold, args.min_delta_us)
+    for regression in regressions:
+        print("REGRESSION " + regression, file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,23 @@
+from operator import add as _add
+
+from ._batch import is_ndarray, check_same_length
+
+
 def mypkgdemo1_add(n1, n2):
     return n1 + n2
 
 
+def mypkgdemo1_add_batch(ns1, ns2):
+    # batch version of mypkgdemo1_add(): accepts sequences, array.array, memoryview
+    # (or any other 1-D buffer/sized iterable) and returns list.
+    # if numpy.ndarray is given, numpy's vectorized "+" is used and ndarray is returned.
+    # lengths are checked first : numpy would broadcast a length 1 operand.
+    check_same_length(ns1, ns2)
+    if is_ndarray(ns1) or is_ndarray(ns2):
+        return ns1 + ns2
+    return list(map(_add, ns1, ns2))
+
+
 class MyPkgDemo1a:
     def __init__(self, n1):
         self.n1 = n1
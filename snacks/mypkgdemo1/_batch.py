@@ -0,0 +1,32 @@
+# helpers shared by the *_add_batch() functions.
+# numpy is NOT imported here: an ndarray can only exist if numpy is already imported,
+# so it's looked up in sys.modules and "import snacks.mypkgdemo1" stays as light as before
+# for non-numpy users.
+import sys
+
+
+def is_ndarray(obj) -> bool:
+    # ndarray or its subclass (numpy.matrix, numpy.ma.MaskedArray, ...)
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(obj, numpy.ndarray)
+
+
+def as_ndarrays(*operands):
+    # None if no operand is ndarray, else all operands as ndarray :
+    # "[1, 2] + (3, 4) + ndarray" would concatenate the list and tuple first.
+    if not any(map(is_ndarray, operands)):
+        return None
+    asarray = sys.modules["numpy"].asarray
+    return [asarray(operand) for operand in operands]
+
+
+def check_same_length(*operands) -> int:
+    # zip()/map() silently stop at the shortest operand, scalar version can't do that.
+    # also called before numpy "+", which would broadcast a length 1 operand.
+    n = len(operands[0])
+    for operand in operands[1:]:
+        if len(operand) != n:
+            raise ValueError(
+                "operand length mismatch: {} != {}".format(n, len(operand))
+            )
+    return n
@@ -1,7 +1,20 @@
+from ._batch import as_ndarrays, check_same_length
+
+
 def module1_add(n1, n2, n3):
     return n1 + n2 + n3
 
 
+def module1_add_batch(ns1, ns2, ns3):
+    check_same_length(ns1, ns2, ns3)
+    arrays = as_ndarrays(ns1, ns2, ns3)
+    if arrays is not None:
+        a1, a2, a3 = arrays
+        return a1 + a2 + a3
+    # same evaluation order as module1_add() : (n1 + n2) + n3
+    return [n1 + n2 + n3 for n1, n2, n3 in zip(ns1, ns2, ns3)]
+
+
 class ClassInModule1:
     @staticmethod
     def add(n1, n2, n3):
@@ -1,11 +1,22 @@
 import snacks.mypkgdemo1.module1 as module1
 from .module1 import module1_add as add1
+from ._batch import as_ndarrays, check_same_length
 
 
 def module2_add(n1, n2, n3):
     return module1.module1_add(n1, n2, n3) + 1
 
 
+def module2_add_batch(ns1, ns2, ns3):
+    check_same_length(ns1, ns2, ns3)
+    arrays = as_ndarrays(ns1, ns2, ns3)
+    if arrays is not None:
+        a1, a2, a3 = arrays
+        return a1 + a2 + a3 + 1
+    # inlined "module1_add() + 1" : no python function call per element.
+    return [n1 + n2 + n3 + 1 for n1, n2, n3 in zip(ns1, ns2, ns3)]
+
+
 class ClassInModule2:
     @staticmethod
     def add(n1, n2, n3):
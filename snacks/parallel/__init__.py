@@ -0,0 +1,178 @@
+# process pool map/reduce runner.
+# ref: https://docs.python.org/ja/3/library/multiprocessing.html
+# ref: https://docs.python.org/ja/3/library/multiprocessing.html#contexts-and-start-methods
+#
+# func must be picklable (module level function or staticmethod), because "spawn" and
+# "forkserver" start methods re-import it in the child process.
+import functools
+import multiprocessing
+from typing import Any, Callable, Iterable, List, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+START_METHODS = ("fork", "spawn", "forkserver")
+
+
+def _star(func: Callable[..., R], args: Sequence[Any]) -> R:
+    return func(*args)
+
+
+def _reduce_chunk(
+    func: Callable[..., Any], reducer: Callable[[Any, Any], Any], star: bool, chunk
+):
+    it = iter(chunk)
+    acc = _star(func, next(it)) if star else func(next(it))
+    for item in it:
+        acc = reducer(acc, _star(func, item) if star else func(item))
+    return acc
+
+
+def _chunks(items: Sequence[T], chunksize: int) -> List[Sequence[T]]:
+    chunks = []
+    for start in range(0, len(items), chunksize):
+        end = start + chunksize
+        chunks.append(items[start:end])
+    return chunks
+
+
+# multiprocessing.Pool wrapper with map / starmap / map_reduce.
+# usage:
+#   with ProcessPoolRunner(processes=2, start_method="spawn") as runner:
+#       runner.starmap(module1_add, [(1, 2, 3), (4, 5, 6)])  # -> [6, 15]
+class ProcessPoolRunner:
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        start_method: Optional[str] = None,
+        chunksize: Optional[int] = None,
+    ):
+        if start_method is not None and start_method not in START_METHODS:
+            raise ValueError(
+                "start_method must be one of {}: {!r}".format(
+                    START_METHODS, start_method
+                )
+            )
+        self.processes = processes or multiprocessing.cpu_count()
+        self.context = multiprocessing.get_context(start_method)
+        self.chunksize = chunksize
+        self._pool = None
+
+    def __enter__(self) -> "ProcessPoolRunner":
+        self._pool = self.context.Pool(self.processes)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # on error, pending tasks are dropped instead of waited for
+        if exc_type is not None:
+            self.terminate()
+        else:
+            self.close()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def terminate(self) -> None:
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            raise RuntimeError("ProcessPoolRunner is not started, use 'with' block")
+        return self._pool
+
+    def _chunksize(self, n: int) -> int:
+        if self.chunksize:
+            return self.chunksize
+        # same heuristic as Pool.map(): about 4 chunks per worker
+        return max(1, -(-n // (self.processes * 4)))
+
+    def map(
+        self, func: Callable[[T], R], items: Iterable[T], ordered: bool = True
+    ) -> List[R]:
+        items = list(items)
+        chunksize = self._chunksize(len(items))
+        if ordered:
+            return self.pool.map(func, items, chunksize)
+        return list(self.pool.imap_unordered(func, items, chunksize))
+
+    def starmap(
+        self,
+        func: Callable[..., R],
+        args_list: Iterable[Sequence[Any]],
+        ordered: bool = True,
+    ) -> List[R]:
+        args_list = list(args_list)
+        chunksize = self._chunksize(len(args_list))
+        if ordered:
+            return self.pool.starmap(func, args_list, chunksize)
+        return list(
+            self.pool.imap_unordered(
+                functools.partial(_star, func), args_list, chunksize
+            )
+        )
+
+    def map_reduce(
+        self,
+        func: Callable[..., Any],
+        items: Iterable[Any],
+        reducer: Callable[[Any, Any], Any],
+        initial: Any,
+        star: bool = False,
+    ) -> Any:
+        # each chunk is reduced in the worker, only partial results come back.
+        # reducer must be associative and commutative : partial results are combined in
+        # completion order (imap_unordered), not in chunk order.
+        items = list(items)
+        if not items:
+            return initial
+        partial_reduce = functools.partial(_reduce_chunk, func, reducer, star)
+        acc = initial
+        chunks = _chunks(items, self._chunksize(len(items)))
+        for partial_result in self.pool.imap_unordered(partial_reduce, chunks):
+            acc = reducer(acc, partial_result)
+        return acc
+
+
+def parallel_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    processes: Optional[int] = None,
+    start_method: Optional[str] = None,
+    chunksize: Optional[int] = None,
+    ordered: bool = True,
+) -> List[R]:
+    with ProcessPoolRunner(processes, start_method, chunksize) as runner:
+        return runner.map(func, items, ordered)
+
+
+def parallel_starmap(
+    func: Callable[..., R],
+    args_list: Iterable[Sequence[Any]],
+    processes: Optional[int] = None,
+    start_method: Optional[str] = None,
+    chunksize: Optional[int] = None,
+    ordered: bool = True,
+) -> List[R]:
+    with ProcessPoolRunner(processes, start_method, chunksize) as runner:
+        return runner.starmap(func, args_list, ordered)
+
+
+def parallel_map_reduce(
+    func: Callable[..., Any],
+    items: Iterable[Any],
+    reducer: Callable[[Any, Any], Any],
+    initial: Any,
+    star: bool = False,
+    processes: Optional[int] = None,
+    start_method: Optional[str] = None,
+    chunksize: Optional[int] = None,
+) -> Any:
+    with ProcessPoolRunner(processes, start_method, chunksize) as runner:
+        return runner.map_reduce(func, items, reducer, initial, star)
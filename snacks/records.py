@@ -0,0 +1,179 @@
+# __slots__ based record type with the same field()/default/default_factory/frozen
+# semantics as @dataclass, and a columnar RecordBatch container.
+# ref: https://docs.python.org/ja/3/reference/datamodel.html#slots
+# ref: https://docs.python.org/ja/3/library/dataclasses.html
+# ref: https://docs.python.org/ja/3/library/array.html
+#
+# NOTE: unlike @dataclass, a field with default value is NOT readable as class variable
+# (MyData4.str2 style), because the class attribute is replaced by the slot descriptor.
+# ClassVar fields are kept as class variables.
+import array
+import dataclasses
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+
+def _add_slots(cls):
+    field_names = tuple(f.name for f in dataclasses.fields(cls))
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = field_names
+    for name in field_names:
+        # default values are already captured by the generated __init__
+        cls_dict.pop(name, None)
+    cls_dict.pop("__dict__", None)
+    cls_dict.pop("__weakref__", None)
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    new_cls.__qualname__ = cls.__qualname__
+    if (
+        cls_dict.get("__dataclass_params__") is not None
+        and new_cls.__dataclass_params__.frozen
+    ):
+        # frozen instance has no __dict__, so pickle needs explicit state
+        new_cls.__getstate__ = _frozen_getstate
+        new_cls.__setstate__ = _frozen_setstate
+    return new_cls
+
+
+def _frozen_getstate(self):
+    return [getattr(self, f.name) for f in dataclasses.fields(self)]
+
+
+def _frozen_setstate(self, state):
+    for f, value in zip(dataclasses.fields(self), state):
+        object.__setattr__(self, f.name, value)
+
+
+def record(cls=None, *, frozen: bool = False, eq: bool = True, repr: bool = True):
+    # usage (same as @dataclass):
+    #   @record
+    #   class R1:
+    #       str1: str
+    #       strings: List[str] = field(default_factory=lambda: ["aa", "bb"])
+    #
+    #   @record(frozen=True)
+    #   class R2: ...
+    def wrap(cls):
+        return _add_slots(dataclasses.dataclass(cls, frozen=frozen, eq=eq, repr=repr))
+
+    if cls is None:
+        return wrap
+    return wrap(cls)
+
+
+class RowView:
+    # lightweight view of one row in RecordBatch (no copy of values)
+    __slots__ = ("_batch", "_index")
+
+    def __init__(self, batch: "RecordBatch", index: int):
+        self._batch = batch
+        self._index = index
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            column = self._batch.columns[name]
+        except KeyError:
+            raise AttributeError(
+                "{!r} row has no attribute {!r}".format(
+                    self._batch.record_cls.__name__, name
+                )
+            ) from None
+        return column[self._index]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in RowView.__slots__:
+            object.__setattr__(self, name, value)
+            return
+        self._batch.set_value(self._index, name, value)
+
+    def __repr__(self) -> str:
+        return "RowView({!r})".format(self._batch.record(self._index))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, RowView):
+            return self.astuple() == other.astuple()
+        return NotImplemented
+
+    def astuple(self) -> Tuple[Any, ...]:
+        return tuple(column[self._index] for column in self._batch.columns.values())
+
+
+class RecordBatch:
+    # columnar storage of @record / @dataclass instances.
+    # typecodes : field name -> array.array typecode ("i", "d", ...),
+    #             other fields are stored in list column.
+    #
+    #   batch = RecordBatch(MyData5, typecodes={"int1": "q"})
+    #   batch.append("hello", 100)
+    #   batch[0].int1  # -> 100
+    def __init__(self, record_cls, typecodes: Optional[Dict[str, str]] = None):
+        self.record_cls = record_cls
+        self.fields = dataclasses.fields(record_cls)
+        typecodes = typecodes or {}
+        unknown = set(typecodes) - {f.name for f in self.fields}
+        if unknown:
+            raise ValueError("unknown field(s): {}".format(", ".join(sorted(unknown))))
+        self.columns: Dict[str, Union[array.array, List[Any]]] = {}
+        for f in self.fields:
+            if f.name in typecodes:
+                self.columns[f.name] = array.array(typecodes[f.name])
+            else:
+                self.columns[f.name] = []
+        self._frozen = record_cls.__dataclass_params__.frozen
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> RowView:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("RecordBatch index out of range")
+        return RowView(self, index)
+
+    def __iter__(self) -> Iterator[RowView]:
+        for index in range(self._length):
+            yield RowView(self, index)
+
+    def append(self, *args, **kwargs) -> None:
+        # arguments are passed to record_cls(), so defaults, default_factory and
+        # __post_init__ are applied exactly as the record class does.
+        self.append_record(self.record_cls(*args, **kwargs))
+
+    def append_record(self, rec) -> None:
+        appended = []
+        try:
+            for f in self.fields:
+                column = self.columns[f.name]
+                column.append(getattr(rec, f.name))
+                appended.append(column)
+        except BaseException:
+            # e.g. OverflowError/TypeError from array.array : keep columns aligned
+            for column in appended:
+                column.pop()
+            raise
+        self._length += 1
+
+    def extend(self, records: Iterable[Any]) -> None:
+        for rec in records:
+            self.append_record(rec)
+
+    def record(self, index: int):
+        # materialize one row as record_cls instance
+        rec = object.__new__(self.record_cls)
+        for f in self.fields:
+            object.__setattr__(rec, f.name, self.columns[f.name][index])
+        return rec
+
+    def set_value(self, index: int, name: str, value: Any) -> None:
+        if self._frozen:
+            raise dataclasses.FrozenInstanceError(
+                "cannot assign to field {!r}".format(name)
+            )
+        if name not in self.columns:
+            raise AttributeError(
+                "{!r} row has no attribute {!r}".format(self.record_cls.__name__, name)
+            )
+        self.columns[name][index] = value
+
+    def column(self, name: str) -> Union[array.array, List[Any]]:
+        return self.columns[name]
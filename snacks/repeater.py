@@ -0,0 +1,58 @@
+# repeat() with per-member LRU cache, for StringRepeater style enums.
+# (see test_custom_init_attr_method / test_custom_new_method in test_enum_demo.py)
+#
+#   class StringRepeater(CachedRepeater, Enum):
+#       ONE_DOT = (1, ",")
+#       TWO_COLON = (2, ":")
+#
+#       def __init__(self, count: int, joiner: str):
+#           self.count = count
+#           self.joiner = joiner
+#
+#   StringRepeater.TWO_COLON.repeat("abc")            # -> "abc:abc"
+#   StringRepeater.TWO_COLON.repeat_many(["a", "b"])  # -> ["a:a", "b:b"]
+from functools import lru_cache
+from typing import Callable, Iterable, List
+
+
+def build_repeat(target: str, count: int, joiner: str) -> str:
+    # no per-iteration append : one list multiplication + join
+    if not joiner:
+        return target * count
+    return joiner.join([target] * count)
+
+
+class CachedRepeater:
+    # members must have "count" and "joiner" attributes.
+    # cache size per member. override in a CachedRepeater subclass used as mixin,
+    # not in the Enum body (it would become an enum member there).
+    repeat_cache_size = 256
+
+    count: int
+    joiner: str
+
+    def _repeat_func(self) -> Callable[[str], str]:
+        try:
+            return self._repeat_cached  # type: ignore
+        except AttributeError:
+            pass
+        count = self.count
+        joiner = self.joiner
+
+        @lru_cache(maxsize=self.repeat_cache_size)
+        def cached(target: str) -> str:
+            return build_repeat(target, count, joiner)
+
+        self._repeat_cached = cached
+        return cached
+
+    def repeat(self, target: str) -> str:
+        return self._repeat_func()(target)
+
+    def repeat_many(self, targets: Iterable[str]) -> List[str]:
+        # cache function is looked up once for the whole batch
+        cached = self._repeat_func()
+        return [cached(target) for target in targets]
+
+    def repeat_cache_info(self):
+        return self._repeat_func().cache_info()  # type: ignore
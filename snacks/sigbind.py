@@ -0,0 +1,157 @@
+# signature binder compiled once per function, instead of inspect.signature(func).bind() per call.
+# (see test_keyword_arg_demo / test_special_params_demo / test_arbitrary_arg_list_demo
+#  in test_function_definition_demo.py)
+# ref: https://docs.python.org/ja/3/library/inspect.html#inspect.Signature.bind
+#
+# binder functions are generated (exec) with the same parameters as target function,
+# so argument binding is done by the interpreter itself and TypeError messages are
+# the same as calling target function (e.g. "f2() got multiple values for argument 'name'").
+#
+#   def f2(prefix, *strings, sep=",", postfix):
+#       ...
+#   binder = get_binder(f2)
+#   binder.bind("abc", "d", postfix="z")
+#   # -> {"prefix": "abc", "strings": ("d",), "sep": ",", "postfix": "z"}
+#   binder.call_dict({"prefix": "abc", "strings": ["d"], "postfix": "z"})  # f2("abc", "d", postfix="z")
+#   binder.call_many([{"prefix": "a", "postfix": "z"}, {"prefix": "b", "postfix": "y"}])
+import inspect
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+from weakref import WeakKeyDictionary, WeakMethod, ref
+
+_cache: "WeakKeyDictionary[Callable[..., Any], SignatureBinder]" = WeakKeyDictionary()
+
+_P = inspect.Parameter
+
+
+class SignatureBinder:
+    # bind(*args, **kwargs) : same parameters as func, returns {name: value} of all parameters
+    #                         (defaults applied, like BoundArguments.apply_defaults()).
+    # bind_dict(mapping) / call_dict(mapping) : flat mapping of parameter name -> value,
+    #   value of *args parameter is a sequence, unknown names go to **kwargs parameter
+    #   (so bind() result with **kwargs parameter is not a valid input as is).
+    # call_many(mappings) : [call_dict(m) for m in mappings]
+    #
+    # func is weakly referenced (WeakMethod for bound method), so binder cached by
+    # get_binder() keeps neither func nor instance of bound method alive.
+
+    def __init__(self, func: Callable[..., Any]):
+        self._func = _weak_target(func)
+        self.signature = inspect.signature(func)
+        params = list(self.signature.parameters.values())
+        namespace: Dict[str, Any] = {}
+        name = getattr(func, "__name__", "")
+        if not name.isidentifier():
+            name = "_sigbind"
+        for i, param in enumerate(params):
+            if param.default is not _P.empty:
+                namespace["_sigbind_d{}".format(i)] = param.default
+        arguments = (
+            "{" + ", ".join("{!r}: {}".format(p.name, p.name) for p in params) + "}"
+        )
+        call_args = []
+        for param in params:
+            if param.kind in (_P.POSITIONAL_ONLY, _P.POSITIONAL_OR_KEYWORD):
+                call_args.append(param.name)
+            elif param.kind == _P.VAR_POSITIONAL:
+                call_args.append("*" + param.name)
+            elif param.kind == _P.KEYWORD_ONLY:
+                call_args.append("{0}={0}".format(param.name))
+            else:
+                call_args.append("**" + param.name)
+        source = "\n".join(
+            [
+                "def {}({}):".format(name, _parameters(params, False)),
+                "    return " + arguments,
+                "def {}_dict({}):".format(name, _parameters(params, True)),
+                "    return " + arguments,
+                "def {}_call(_sigbind_func, /, {}):".format(
+                    name, _parameters(params, True)
+                ),
+                "    return _sigbind_func({})".format(", ".join(call_args)),
+            ]
+        )
+        exec(source, namespace)
+        qualname = getattr(func, "__qualname__", name)
+        self.bind = _rename(namespace[name], qualname)
+        self._bind_dict = _rename(namespace[name + "_dict"], qualname)
+        self._call_dict = _rename(namespace[name + "_call"], qualname)
+
+    @property
+    def func(self) -> Optional[Callable[..., Any]]:
+        # None if target function is already collected
+        return self._func()
+
+    def _target(self) -> Callable[..., Any]:
+        func = self._func()
+        if func is None:
+            raise ReferenceError("target function of binder no longer exists")
+        return func
+
+    def bind_dict(self, mapping: Mapping[str, Any]) -> Dict[str, Any]:
+        return self._bind_dict(**mapping)
+
+    def call_dict(self, mapping: Mapping[str, Any]) -> Any:
+        return self._call_dict(self._target(), **mapping)
+
+    def call_many(self, mappings: Iterable[Mapping[str, Any]]) -> List[Any]:
+        call = self._call_dict
+        func = self._target()
+        return [call(func, **mapping) for mapping in mappings]
+
+
+def _weak_target(func: Callable[..., Any]) -> Callable[[], Any]:
+    if inspect.ismethod(func):
+        return WeakMethod(func)
+    try:
+        return ref(func)
+    except TypeError:
+        # not weak referenceable : held strongly (not cached by get_binder() either)
+        return lambda: func
+
+
+def _parameters(params: List[inspect.Parameter], from_dict: bool) -> str:
+    # from_dict : positional only parameters accept keywords,
+    #             *args parameter becomes keyword only parameter with () default.
+    pieces = []
+    keyword_only = False
+    for i, param in enumerate(params):
+        default = "" if param.default is _P.empty else "=_sigbind_d{}".format(i)
+        if param.kind == _P.POSITIONAL_ONLY:
+            pieces.append(param.name + default)
+            last = i + 1 == len(params) or params[i + 1].kind != _P.POSITIONAL_ONLY
+            if last and not from_dict:
+                pieces.append("/")
+        elif param.kind == _P.POSITIONAL_OR_KEYWORD:
+            pieces.append(param.name + default)
+        elif param.kind == _P.VAR_POSITIONAL:
+            keyword_only = True
+            pieces.extend(
+                ["*", param.name + "=()"] if from_dict else ["*" + param.name]
+            )
+        elif param.kind == _P.KEYWORD_ONLY:
+            if not keyword_only:
+                keyword_only = True
+                pieces.append("*")
+            pieces.append(param.name + default)
+        else:
+            pieces.append("**" + param.name)
+    return ", ".join(pieces)
+
+
+def _rename(func: Callable[..., Any], qualname: str) -> Callable[..., Any]:
+    # TypeError message uses __qualname__ (Python 3.10+) : same as target function
+    func.__qualname__ = qualname
+    return func
+
+
+def get_binder(func: Callable[..., Any]) -> SignatureBinder:
+    try:
+        return _cache[func]
+    except KeyError:
+        pass
+    except TypeError:
+        # not weak referenceable : not cached
+        return SignatureBinder(func)
+    binder = SignatureBinder(func)
+    _cache[func] = binder
+    return binder
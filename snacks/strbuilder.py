@@ -0,0 +1,90 @@
+# string builder (list + join) and argument trace formatter, instead of "r += ..." in loop.
+# (see test_arg_type_mixin_demo / test_unpack_arg_list_demo in test_function_definition_demo.py)
+# ref: https://docs.python.org/ja/3/faq/programming.html (most efficient way to concatenate strings)
+#
+# NOTE: CPython resizes "r += s" in place while r has no other reference, so += is often
+# linear, but it's implementation detail (and breaks when r is referenced elsewhere).
+#
+#   sb = StringBuilder(">>")
+#   sb.append(",x").append_format(",*a[{}]=[{}]", 0, 10)
+#   sb.getvalue()                                   # -> ">>,x,*a[0]=[10]"
+#   arg_trace(">>", ",<<", 10, 20, kw1="aa")        # -> ">>,*a[0]=[10],*a[1]=[20],**kw[kw1]=[aa],<<"
+import threading
+from typing import Any, Iterable, List, Mapping, Sequence
+
+from snacks.formatting import compile_format
+
+# preformatted ",*a[{i}]=[" pieces, extended on demand up to ARG_PREFIX_CACHE_SIZE
+ARG_PREFIX_CACHE_SIZE = 100_000
+_arg_prefixes: List[str] = []
+_arg_prefixes_lock = threading.Lock()
+
+
+class StringBuilder:
+    __slots__ = ("_parts",)
+
+    def __init__(self, initial: str = ""):
+        self._parts: List[str] = [initial] if initial else []
+
+    def append(self, s: str) -> "StringBuilder":
+        self._parts.append(s)
+        return self
+
+    def append_format(
+        self, template: str, *args: Any, **kwargs: Any
+    ) -> "StringBuilder":
+        # template is compiled once and cached (see formatting.compile_format)
+        self._parts.append(compile_format(template)(*args, **kwargs))
+        return self
+
+    def extend(self, parts: Iterable[str]) -> "StringBuilder":
+        self._parts.extend(parts)
+        return self
+
+    def clear(self) -> None:
+        self._parts.clear()
+
+    def getvalue(self) -> str:
+        # joined result is kept as one part : repeated getvalue() does not re-join
+        parts = self._parts
+        if len(parts) > 1:
+            parts[:] = ["".join(parts)]
+        return parts[0] if parts else ""
+
+    def __str__(self) -> str:
+        return self.getvalue()
+
+    def __len__(self) -> int:
+        return len(self.getvalue())
+
+
+def arg_prefixes(n: int) -> List[str]:
+    # [",*a[0]=[", ",*a[1]=[", ...], at least n items.
+    # extended in place (callers only read the first n items they asked for), under lock
+    # so that two threads never append the same range twice.
+    size = len(_arg_prefixes)
+    if size < n and size < ARG_PREFIX_CACHE_SIZE:
+        with _arg_prefixes_lock:
+            size = len(_arg_prefixes)
+            stop = min(n, ARG_PREFIX_CACHE_SIZE)
+            if size < stop:
+                _arg_prefixes.extend([",*a[{}]=[".format(i) for i in range(size, stop)])
+            size = len(_arg_prefixes)
+    if size < n:
+        return _arg_prefixes + [",*a[{}]=[".format(i) for i in range(size, n)]
+    return _arg_prefixes
+
+
+def format_arg_trace(
+    prefix: str, suffix: str, args: Sequence[Any], kwargs: Mapping[str, Any]
+) -> str:
+    parts = [prefix]
+    parts += [f"{p}{arg}]" for p, arg in zip(arg_prefixes(len(args)), args)]
+    parts += [f",**kw[{kw}]=[{kwarg}]" for kw, kwarg in kwargs.items()]
+    parts.append(suffix)
+    return "".join(parts)
+
+
+def arg_trace(prefix: str, suffix: str, *args: Any, **kwargs: Any) -> str:
+    # drop-in for f1() of test_arg_type_mixin_demo
+    return format_arg_trace(prefix, suffix, args, kwargs)
@@ -0,0 +1,149 @@
+# compiled switch/dispatch table : exact keys, prefix keys and range keys.
+# (generalization of if/elif and dispatch dict in test_switch_alternative_demo.py)
+#
+#   builder = SwitchBuilder(default="xx")
+#   builder.case(["aa", "bb"], "aa or bb")
+#   builder.case(["cc", "dd"], "cc or dd")
+#   builder.case("ee", "ee")
+#   builder.prefix("op_", "operator")
+#   builder.range(0x80, 0x100, "high")
+#   switch = builder.compile()
+#   switch("bb")  # -> "aa or bb" : one dict.get() for exact keys
+#
+# values are results, not callables: no lambda per case, equal values are merged
+# into one shared object.
+from bisect import bisect_right
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Tuple, Union
+
+_MISS = object()
+
+
+class SwitchBuilder:
+    def __init__(self, default: Any = None):
+        self.default = default
+        self._exact: Dict[Hashable, Any] = {}
+        self._prefixes: Dict[str, Any] = {}
+        self._ranges: List[Tuple[Any, Any, Any]] = []
+        # (type, value) -> shared value object (merge equivalent cases).
+        # type is part of key : 1, True and 1.0 are equal but not the same result.
+        self._values: Dict[Tuple[type, Any], Any] = {}
+
+    def _intern(self, value: Any) -> Any:
+        try:
+            return self._values.setdefault((type(value), value), value)
+        except TypeError:
+            # unhashable value : can't be merged, stored as is
+            return value
+
+    def case(
+        self, keys: Union[Hashable, Iterable[Hashable]], value: Any
+    ) -> "SwitchBuilder":
+        # keys : single key, or list/tuple/set of keys sharing the value
+        if isinstance(keys, (list, tuple, set, frozenset)):
+            key_list = list(keys)
+        else:
+            key_list = [keys]
+        # validate all keys before insert : builder is unchanged on error
+        seen = set()
+        for key in key_list:
+            if key in self._exact or key in seen:
+                raise ValueError("duplicate case: {!r}".format(key))
+            seen.add(key)
+        value = self._intern(value)
+        for key in key_list:
+            self._exact[key] = value
+        return self
+
+    def prefix(self, prefix: str, value: Any) -> "SwitchBuilder":
+        # longest matching prefix wins
+        if not prefix:
+            raise ValueError("empty prefix, use default instead")
+        if prefix in self._prefixes:
+            raise ValueError("duplicate prefix: {!r}".format(prefix))
+        self._prefixes[prefix] = self._intern(value)
+        return self
+
+    def range(self, start: Any, stop: Any, value: Any) -> "SwitchBuilder":
+        # half open range : start <= key < stop
+        if not start < stop:
+            raise ValueError("empty range: {!r} - {!r}".format(start, stop))
+        self._ranges.append((start, stop, self._intern(value)))
+        return self
+
+    def compile(self) -> Callable[[Any], Any]:
+        # lookup order : exact key -> longest prefix -> range -> default
+        default = self.default
+        get = dict(self._exact).get
+
+        prefix_levels = _prefix_levels(self._prefixes)
+        range_indexes = _range_indexes(self._ranges)
+
+        if not prefix_levels and not range_indexes:
+
+            def switch_exact(key: Any) -> Any:
+                return get(key, default)
+
+            return switch_exact
+
+        def switch(key: Any) -> Any:
+            value = get(key, _MISS)
+            if value is not _MISS:
+                return value
+            if prefix_levels and type(key) is str:
+                key_length = len(key)
+                for length, level in prefix_levels:
+                    if length <= key_length:
+                        value = level.get(key[:length], _MISS)
+                        if value is not _MISS:
+                            return value
+            for starts, stops, range_values in range_indexes:
+                try:
+                    i = bisect_right(starts, key) - 1
+                    if i >= 0 and key < stops[i]:
+                        return range_values[i]
+                except TypeError:
+                    # key is not comparable to this group of range boundaries
+                    pass
+            return default
+
+        return switch
+
+
+def _prefix_levels(prefixes: Dict[str, Any]) -> List[Tuple[int, Dict[str, Any]]]:
+    # one dict per prefix length, longest first : at most (number of distinct
+    # lengths) dict lookups instead of scanning every prefix.
+    levels: Dict[int, Dict[str, Any]] = {}
+    for prefix, value in prefixes.items():
+        levels.setdefault(len(prefix), {})[prefix] = value
+    return sorted(levels.items(), reverse=True)
+
+
+def _range_indexes(
+    ranges: List[Tuple[Any, Any, Any]],
+) -> List[Tuple[List[Any], List[Any], List[Any]]]:
+    # sorted (starts, stops, values) for bisect, one index per boundary type
+    # (int and str ranges can't be sorted together).
+    groups: Dict[type, List[Tuple[Any, Any, Any]]] = {}
+    for r in ranges:
+        groups.setdefault(type(r[0]), []).append(r)
+    indexes = []
+    for group in groups.values():
+        group.sort(key=lambda r: r[0])
+        for (_, stop, _), (next_start, _, _) in zip(group, group[1:]):
+            if next_start < stop:
+                raise ValueError("overlapping ranges at {!r}".format(next_start))
+        indexes.append(
+            ([r[0] for r in group], [r[1] for r in group], [r[2] for r in group])
+        )
+    return indexes
+
+
+def compile_switch(
+    cases: Dict[Hashable, Any],
+    default: Any = None,
+) -> Callable[[Any], Any]:
+    # shortcut for exact keys only : {"aa": "aa or bb", "bb": "aa or bb", ...}
+    builder = SwitchBuilder(default)
+    for key, value in cases.items():
+        builder.case([key], value)
+    return builder.compile()
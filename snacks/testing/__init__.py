@@ -0,0 +1,3 @@
+# test running helpers : parallel sharded unittest runner and its utilities.
+#
+#   python -m snacks.testing.runner -j 8
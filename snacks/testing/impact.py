@@ -0,0 +1,403 @@
+# test impact analysis : record which project source files each test depends on, then run
+# only tests affected by files changed since recording (git diff).
+# ref: https://docs.python.org/ja/3/library/sys.html#sys.setprofile
+# ref: https://docs.python.org/ja/3/library/ast.html
+#
+#   python -m snacks.testing.impact --record        # full run, write .test_impact.json
+#   python -m snacks.testing.impact --list          # print affected test ids / modules
+#   python -m snacks.testing.impact                 # run affected tests
+#
+# dependencies of a test (project files under top level directory only) :
+# - static : import statements (also in functions) of test module, transitively, with parent
+#   package __init__.py (e.g. test_package_module_demo.py -> snacks/mypkgdemo1/*,
+#   tests/snacks/mypkgdemo1/__init__.py, tests/snacks/mypkgdemo2/__init__.py)
+# - dynamic : files of functions called between startTest() and stopTest() (sys.setprofile,
+#   also in threads started by test), e.g. module3.py loaded by PEP 562 __getattr__ of
+#   mypkgdemo2. code run in setUpClass() or subprocesses is not traced.
+#
+# changed files are "git diff <recorded commit>" + untracked files. full suite is run when :
+# no map / recorded commit is unknown (rebased, not a git repository), changed or new python
+# file is not in map (map is stale), or changed non-python file is not a known dependency
+# (setup.cfg, requirements.txt, ...) except IGNORE_PATTERNS.
+# changed test module runs whole module (new tests are not in map yet), deleted one is dropped.
+import argparse
+import ast
+import fnmatch
+import json
+import os
+import subprocess
+import sys
+import threading
+import types
+import unittest
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+from snacks.testing.runner import is_failed_load, iter_tests, load_shard
+
+DEFAULT_MAP = ".test_impact.json"
+# ImpactMixin.stopTest() is called while profiling
+_THIS_FILE = os.path.abspath(__file__)
+MAP_VERSION = 1
+
+# changed files matching these never cause full run
+IGNORE_PATTERNS = ["*.md", "*.rst", ".gitignore", "LICENSE*", DEFAULT_MAP]
+
+
+class Selection(NamedTuple):
+    full: bool
+    reason: str
+    names: List[str]  # test ids and test module names (empty if full)
+
+
+def module_name(path: str, root: str) -> Optional[str]:
+    # "tests/snacks/test_x.py" -> "tests.snacks.test_x", None if not under root
+    relpath = os.path.relpath(os.path.abspath(path), root)
+    if relpath.startswith(os.pardir) or not relpath.endswith(".py"):
+        return None
+    parts = relpath[:-3].split(os.sep)
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def module_file(name: str, root: str) -> Optional[str]:
+    # relative path of module / package under root, None if not a project module
+    base = os.path.join(*name.split("."))
+    for relpath in (base + ".py", os.path.join(base, "__init__.py")):
+        if os.path.isfile(os.path.join(root, relpath)):
+            return relpath
+    return None
+
+
+class StaticImports:
+    # transitive import closure by AST, cached per module
+    def __init__(self, root: str):
+        self.root = root
+        self._direct: Dict[str, Set[str]] = {}
+        self._closures: Dict[str, Set[str]] = {}
+
+    def direct(self, name: str) -> Set[str]:
+        try:
+            return self._direct[name]
+        except KeyError:
+            pass
+        relpath = module_file(name, self.root)
+        found: Set[str] = set()
+        self._direct[name] = found
+        if relpath is None:
+            return found
+        with open(os.path.join(self.root, relpath), "rb") as f:
+            try:
+                tree = ast.parse(f.read(), relpath)
+            except SyntaxError:
+                return found
+        is_package = relpath.endswith("__init__.py")
+        package = name if is_package else name.rpartition(".")[0]
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                found.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                base = node.module or ""
+                if node.level:
+                    parent = package.rsplit(".", node.level - 1)[0]
+                    base = parent + "." + base if base else parent
+                found.add(base)
+                # "from package import submodule"
+                found.update(base + "." + alias.name for alias in node.names)
+        # importing a.b.c runs a/__init__.py and a/b/__init__.py
+        for imported in list(found):
+            parts = imported.split(".")
+            found.update(".".join(parts[:i]) for i in range(1, len(parts)))
+        found.discard(name)
+        found.difference_update([n for n in found if not module_file(n, self.root)])
+        return found
+
+    def closure(self, name: str) -> Set[str]:
+        # relative paths of name and modules it imports, transitively.
+        # modules of names in loaded module's namespace are added too : names imported
+        # through PEP 562 __getattr__ (e.g. "from .mypkgdemo2 import module3_sub") are not
+        # visible as import statements.
+        try:
+            return self._closures[name]
+        except KeyError:
+            pass
+        parts = name.split(".")
+        seen = {".".join(parts[:i]) for i in range(1, len(parts) + 1)}
+        seen.update(n for n in namespace_modules(name) if module_file(n, self.root))
+        pending = list(seen)
+        while pending:
+            for imported in self.direct(pending.pop()):
+                if imported not in seen:
+                    seen.add(imported)
+                    pending.append(imported)
+        relpaths = (module_file(n, self.root) for n in seen)
+        closure = self._closures[name] = {relpath for relpath in relpaths if relpath}
+        return closure
+
+
+def namespace_modules(name: str) -> Set[str]:
+    # defining modules of module attributes (module not loaded : empty)
+    module = sys.modules.get(name)
+    if module is None:
+        return set()
+    found = set()
+    for value in list(vars(module).values()):
+        if isinstance(value, types.ModuleType):
+            found.add(value.__name__)
+        else:
+            defined = getattr(value, "__module__", None)
+            if isinstance(defined, str):
+                found.add(defined)
+    return found
+
+
+class ImpactMixin:
+    # mix into unittest.TestResult subclass (before it), like timing.TimingMixin.
+    # self.dependencies : test id -> relative paths of files called during test
+    impact_root = os.getcwd()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)  # type: ignore
+        self.dependencies: Dict[str, Set[str]] = {}
+        self._called: Set[str] = set()
+        self._relpaths: Dict[str, Optional[str]] = {}
+
+    def _profile(self, frame, event, arg):
+        if event == "call":
+            self._called.add(frame.f_code.co_filename)
+
+    def startTest(self, test):
+        super().startTest(test)  # type: ignore
+        self._called = set()
+        threading.setprofile(self._profile)
+        sys.setprofile(self._profile)
+
+    def stopTest(self, test):
+        sys.setprofile(None)
+        threading.setprofile(None)  # type: ignore
+        self.dependencies[test.id()] = {
+            p for p in map(self._relpath, self._called) if p is not None
+        }
+        super().stopTest(test)  # type: ignore
+
+    def _relpath(self, filename: str) -> Optional[str]:
+        try:
+            return self._relpaths[filename]
+        except KeyError:
+            pass
+        relpath: Optional[str] = None
+        if filename.endswith(".py") and filename != _THIS_FILE:
+            relpath = os.path.relpath(os.path.abspath(filename), self.impact_root)
+            if relpath.startswith(os.pardir) or "site-packages" in relpath:
+                relpath = None
+        self._relpaths[filename] = relpath
+        return relpath
+
+
+class ImpactTextResult(ImpactMixin, unittest.TextTestResult):
+    pass
+
+
+def _git(root: str, *args: str) -> Optional[str]:
+    try:
+        completed = subprocess.run(
+            ["git", *args],
+            cwd=root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+        )
+    except OSError:
+        return None
+    return completed.stdout if completed.returncode == 0 else None
+
+
+def head_commit(root: str) -> Optional[str]:
+    out = _git(root, "rev-parse", "--verify", "HEAD")
+    return out.strip() if out else None
+
+
+def changed_files(root: str, base: str) -> Optional[List[str]]:
+    # paths relative to root, None if diff is not available (unknown commit etc.)
+    diff = _git(root, "diff", "--name-only", "--relative", base, "--")
+    untracked = _git(root, "ls-files", "--others", "--exclude-standard")
+    if diff is None or untracked is None:
+        return None
+    paths = set(diff.splitlines()) | set(untracked.splitlines())
+    return sorted(os.path.normpath(p) for p in paths if p)
+
+
+def build_map(
+    dependencies: Dict[str, Set[str]], commit: Optional[str], pattern: str
+) -> dict:
+    files = sorted(set().union(*dependencies.values())) if dependencies else []
+    index = {path: i for i, path in enumerate(files)}
+    return {
+        "version": MAP_VERSION,
+        "commit": commit,
+        "pattern": pattern,
+        "files": files,
+        "tests": {
+            test_id: sorted(index[p] for p in paths)
+            for test_id, paths in sorted(dependencies.items())
+        },
+    }
+
+
+def load_map(path: str) -> Optional[dict]:
+    try:
+        with open(path) as f:
+            impact_map = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if impact_map.get("version") != MAP_VERSION:
+        return None
+    return impact_map
+
+
+def select(
+    impact_map: Optional[dict],
+    changed: Optional[Iterable[str]],
+    root: str,
+    ignore: Iterable[str] = IGNORE_PATTERNS,
+) -> Selection:
+    if impact_map is None:
+        return Selection(True, "no dependency map", [])
+    if changed is None:
+        return Selection(True, "no git diff from recorded commit", [])
+    files: List[str] = impact_map["files"]
+    dependents: Dict[str, List[str]] = {path: [] for path in files}
+    test_modules: Set[str] = set()
+    for test_id, indexes in impact_map["tests"].items():
+        for i in indexes:
+            dependents[files[i]].append(test_id)
+    pattern = impact_map.get("pattern", "test*.py")
+    ignore = list(ignore)
+    names: Set[str] = set()
+    deleted_modules: Set[str] = set()
+    for path in changed:
+        name = module_name(os.path.join(root, path), root)
+        exists = os.path.isfile(os.path.join(root, path))
+        if fnmatch.fnmatch(os.path.basename(path), pattern) and name:
+            # test module, new or changed : whole module.
+            # deleted : its tests are gone, not selected.
+            if exists:
+                test_modules.add(name)
+                names.update(dependents.get(path, []))
+            else:
+                deleted_modules.add(name)
+        elif path in dependents:
+            names.update(dependents[path])
+        elif path.endswith(".py"):
+            if exists:
+                # new (or never traced) source file : map does not know who uses it
+                return Selection(True, "source file not in dependency map: " + path, [])
+        elif not any(fnmatch.fnmatch(path, p) for p in ignore):
+            return Selection(True, "unknown dependency changed: " + path, [])
+    # test ids in selected modules are covered by module name
+    covered = test_modules | deleted_modules
+    names = {n for n in names if not _in_modules(n, covered)}
+    return Selection(False, "affected by changes", sorted(test_modules | names))
+
+
+def _in_modules(name: str, modules: Set[str]) -> bool:
+    # name is one of modules, or test id in one of them
+    parts = name.split(".")
+    return any(".".join(parts[:i]) in modules for i in range(1, len(parts) + 1))
+
+
+def record(
+    start_dir: str = ".",
+    pattern: str = "test*.py",
+    top_level_dir: Optional[str] = None,
+    map_path: str = DEFAULT_MAP,
+    verbosity: int = 1,
+) -> unittest.TestResult:
+    # full run with dependency tracing, then write map
+    root = os.path.abspath(top_level_dir or os.getcwd())
+    suite = unittest.TestLoader().discover(start_dir, pattern, top_level_dir)
+    # before run : TestSuite drops tests after run
+    test_modules = {}
+    for test in iter_tests(suite):
+        if is_failed_load(test):
+            # import error of test module : module name as test id (loadable by name)
+            name = test.id().split("._FailedTest.", 1)[1]
+            test_modules[name] = name
+        else:
+            test_modules[test.id()] = type(test).__module__
+
+    class RecordingResult(ImpactTextResult):
+        impact_root = root
+
+    result = unittest.TextTestRunner(
+        verbosity=verbosity, resultclass=RecordingResult
+    ).run(suite)
+    static = StaticImports(root)
+    dependencies = result.dependencies  # type: ignore
+    dependencies = {
+        test_id: dependencies.get(test_id, set()) | static.closure(name)
+        for test_id, name in test_modules.items()
+    }
+    with open(map_path, "w") as f:
+        json.dump(build_map(dependencies, head_commit(root), pattern), f, indent=1)
+    return result
+
+
+def select_changed(
+    map_path: str = DEFAULT_MAP,
+    top_level_dir: Optional[str] = None,
+    base: Optional[str] = None,
+) -> Selection:
+    # base : diff base, default is recorded commit
+    root = os.path.abspath(top_level_dir or os.getcwd())
+    impact_map = load_map(map_path)
+    base = base or (impact_map or {}).get("commit")
+    changed = changed_files(root, base) if base else None
+    return select(impact_map, changed, root)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="run tests affected by changes")
+    parser.add_argument("--map", default=DEFAULT_MAP)
+    parser.add_argument(
+        "--record", action="store_true", help="run all tests, write dependency map"
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="print affected tests, do not run"
+    )
+    parser.add_argument("--base", help="git diff base (default: recorded commit)")
+    parser.add_argument("-v", "--verbose", action="store_const", const=2, default=1)
+    parser.add_argument("-s", "--start-directory", default=".")
+    parser.add_argument("-p", "--pattern", default="test*.py")
+    parser.add_argument("-t", "--top-level-directory", default=None)
+    args = parser.parse_args(argv)
+    if args.record:
+        result = record(
+            args.start_directory,
+            args.pattern,
+            args.top_level_directory,
+            args.map,
+            args.verbose,
+        )
+        return 0 if result.wasSuccessful() else 1
+    selection = select_changed(args.map, args.top_level_directory, args.base)
+    print(
+        "{}: {}".format("full run" if selection.full else "impact", selection.reason),
+        file=sys.stderr,
+    )
+    if args.list:
+        for name in selection.names:
+            print(name)
+        return 0
+    if selection.full:
+        suite = unittest.TestLoader().discover(
+            args.start_directory, args.pattern, args.top_level_directory
+        )
+    else:
+        suite = load_shard(selection.names)
+    result = unittest.TextTestRunner(verbosity=args.verbose).run(suite)
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
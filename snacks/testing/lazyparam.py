@@ -0,0 +1,419 @@
+# lazy parameterized tests : cases from iterables / generators, test per case created at load
+# time (load_tests protocol) while iterating, instead of parameterized.expand() /
+# parameterized_class() materializing every case at import time
+# (see test_unittest_parameterized_demo.py).
+# ref: https://docs.python.org/ja/3/library/unittest.html#load-tests-protocol
+# ref: https://github.com/wolever/parameterized
+#
+#   from snacks.testing.lazyparam import expand, expand_class, load_tests, module_getattr  # noqa: F401
+#
+#   __getattr__ = module_getattr(__name__)   # case ids loadable by "python -m unittest <id>"
+#
+#   def add_cases():
+#       for x in range(100_000):
+#           yield (x, 1, x + 1)              # tuple / param(...) / single value
+#
+#   class TestAdd(TestCase):
+#       @expand(add_cases, sample=1000)      # TestAdd_test_add.test_add_0, TestAdd_test_add.test_add_17,
+#                                            # ... (index in all cases)
+#       def test_add(self, x, y, expected):
+#           self.assertEqual(x + y, expected)
+#
+#   @expand_class(lambda: ({"x": x} for x in range(10)))  # TestX_0, TestX_1, ...
+#   class TestX(TestCase):
+#       x = 0
+#
+# - cases : reiterable (list, range, ...), or callable returning iterable (generator function).
+#   callable is called on each iteration. one-shot iterator (generator object) is rejected
+#   by TypeError : cases are iterated more than once (countTestCases(), run, ...).
+# - cases are never stored : selection (shard / sample) and test creation are done while
+#   iterating, sample keeps sample size cases only (reservoir sampling, deterministic by seed).
+# - selection from environment when not given in decorator :
+#     SNACKS_PARAM_SHARD=0/4 (cases with index % 4 == 0), SNACKS_PARAM_SAMPLE=1000, SNACKS_PARAM_SEED=0
+# - without load_tests in module (e.g. pytest), decorated test runs all cases as subTests,
+#   with setUp() / tearDown() per case.
+# - cases of @expand method are instances of "Class_method" subclass (created per iteration,
+#   not a module attribute), so setUpClass() / tearDownClass() run again for them.
+#   "Class_method" and "Class_0" names are resolved by module's __getattr__ (PEP 562) made
+#   by module_getattr(), standard loader does not know load_tests generated names.
+import functools
+import os
+import random
+import sys
+import unittest
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+Cases = Union[Iterable[Any], Callable[[], Iterable[Any]]]
+NameFunc = Callable[[Any, int, "param"], str]
+
+
+class param:
+    # same as parameterized.param : param(1, 2, z=3)
+    __slots__ = ("args", "kwargs")
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        self.args = args
+        self.kwargs = kwargs
+
+    def __repr__(self) -> str:
+        items = [repr(a) for a in self.args]
+        items += ["{}={!r}".format(k, v) for k, v in self.kwargs.items()]
+        return "param({})".format(", ".join(items))
+
+
+def to_param(case: Any) -> param:
+    # param / parameterized.param (args and kwargs) as is, tuple as args, dict as kwargs
+    # (expand_class), other value as single argument
+    if hasattr(case, "args") and hasattr(case, "kwargs"):
+        return case
+    if isinstance(case, tuple):
+        return param(*case)
+    if isinstance(case, dict):
+        return param(**case)
+    return param(case)
+
+
+def _parse_shard(value: str) -> Tuple[int, int]:
+    index, _, count = value.partition("/")
+    shard = (int(index), int(count))
+    if not 0 <= shard[0] < shard[1]:
+        raise ValueError("invalid shard (index/count): {}".format(value))
+    return shard
+
+
+def select_cases(
+    cases: Iterable[Any],
+    sample: Optional[int] = None,
+    seed: int = 0,
+    shard: Optional[Tuple[int, int]] = None,
+) -> Iterator[Tuple[int, param]]:
+    # (index in all cases, param), index order
+    indexed: Iterator[Tuple[int, Any]] = enumerate(cases)
+    if shard is not None:
+        shard_index, shard_count = shard
+        indexed = (item for item in indexed if item[0] % shard_count == shard_index)
+    if sample is None:
+        return ((index, to_param(case)) for index, case in indexed)
+    # reservoir sampling (algorithm R)
+    rng = random.Random(seed)
+    reservoir: List[Tuple[int, Any]] = []
+    for n, item in enumerate(indexed):
+        if n < sample:
+            reservoir.append(item)
+        else:
+            j = rng.randrange(n + 1)
+            if j < sample:
+                reservoir[j] = item
+    reservoir.sort(key=lambda item: item[0])
+    return ((index, to_param(case)) for index, case in reservoir)
+
+
+def default_name_func(func: Any, index: int, p: param) -> str:
+    return "{}_{}".format(func.__name__, index)
+
+
+class _Expansion:
+    def __init__(
+        self,
+        func: Any,
+        cases: Cases,
+        name_func: Optional[NameFunc],
+        sample: Optional[int],
+        seed: Optional[int],
+        shard: Optional[Tuple[int, int]],
+    ):
+        if not callable(cases) and iter(cases) is cases:
+            raise TypeError(
+                "cases of {} is one-shot iterator, "
+                "pass generator function or reiterable instead".format(
+                    func.__qualname__
+                )
+            )
+        self.func = func
+        self.cases = cases
+        self.name_func = name_func or default_name_func
+        env = os.environ
+        if sample is None and env.get("SNACKS_PARAM_SAMPLE"):
+            sample = int(env["SNACKS_PARAM_SAMPLE"])
+        if seed is None:
+            seed = int(env.get("SNACKS_PARAM_SEED") or 0)
+        if shard is None and env.get("SNACKS_PARAM_SHARD"):
+            shard = _parse_shard(env["SNACKS_PARAM_SHARD"])
+        self.sample = sample
+        self.seed = seed
+        self.shard = shard
+
+    def __iter__(self) -> Iterator[Tuple[str, param]]:
+        # (name, param) of selected cases
+        cases = self.cases() if callable(self.cases) else self.cases
+        selected = select_cases(cases, self.sample, self.seed, self.shard)
+        name_func = self.name_func
+        for index, p in selected:
+            yield name_func(self.func, index, p), p
+
+
+def _make_case(
+    cls: type, name: str, func: Any, template: Any, p: param
+) -> unittest.TestCase:
+    # test instance with per case method as instance attribute (TestCase.__init__() looks up
+    # methodName by getattr(), so no class attribute is added per case)
+    test = cls.__new__(cls)
+
+    @functools.wraps(template)
+    def case_method():
+        return func(test, *p.args, **p.kwargs)
+
+    setattr(test, name, case_method)
+    test.__init__(name)
+    return test
+
+
+def _run_subtests(
+    test: unittest.TestCase, cases: Iterable[Tuple[str, Callable[[], None]]]
+) -> None:
+    # fallback without load_tests : each case runs in new instance (setUp() / tearDown()
+    # by TestCase.debug()), as subTest of decorated test
+    for name, run_case in cases:
+        with test.subTest(case=name):
+            run_case()
+
+
+def _debug_class(cls: type, method_name: str) -> None:
+    cls.setUpClass()  # type: ignore
+    try:
+        cls(method_name).debug()
+    finally:
+        cls.tearDownClass()  # type: ignore
+
+
+def expand(
+    cases: Cases,
+    name_func: Optional[NameFunc] = None,
+    sample: Optional[int] = None,
+    seed: Optional[int] = None,
+    shard: Optional[Tuple[int, int]] = None,
+) -> Callable[[Any], Any]:
+    def decorator(func):
+        expansion = _Expansion(func, cases, name_func, sample, seed, shard)
+
+        @functools.wraps(func)
+        def lazy_method(self):
+            cls = type(self)
+            _run_subtests(
+                self,
+                (
+                    (name, _make_case(cls, name, func, lazy_method, p).debug)
+                    for name, p in expansion
+                ),
+            )
+
+        lazy_method.lazyparam_expansion = expansion  # type: ignore
+        return lazy_method
+
+    return decorator
+
+
+def expand_class(
+    cases: Cases,
+    name_func: Optional[NameFunc] = None,
+    sample: Optional[int] = None,
+    seed: Optional[int] = None,
+    shard: Optional[Tuple[int, int]] = None,
+) -> Callable[[type], type]:
+    # cases : dict (or param with keyword arguments) of class attributes
+    def name_class(cls: type, index: int, p: param) -> str:
+        return "{}_{}".format(cls.__name__, index)
+
+    def decorator(cls):
+        expansion = _Expansion(cls, cases, name_func or name_class, sample, seed, shard)
+        loader = unittest.TestLoader()
+        methods = {
+            name: cls.__dict__[name]
+            for name in loader.getTestCaseNames(cls)
+            if name in cls.__dict__
+        }
+
+        def subclasses() -> Iterator[Tuple[str, type]]:
+            for name, p in expansion:
+                if p.args:
+                    raise TypeError(
+                        "case of {} must be keyword arguments (dict): {!r}".format(
+                            cls.__qualname__, p
+                        )
+                    )
+                attrs: Dict[str, Any] = dict(methods)
+                attrs.update(p.kwargs)
+                attrs["__module__"] = cls.__module__
+                attrs["__qualname__"] = name
+                attrs["lazyparam_class"] = None
+                yield name, type(name, (cls,), attrs)
+
+        def make_lazy_method(method_name):
+            @functools.wraps(methods[method_name])
+            def lazy_method(self):
+                _run_subtests(
+                    self,
+                    (
+                        (name, functools.partial(_debug_class, subclass, method_name))
+                        for name, subclass in subclasses()
+                    ),
+                )
+
+            return lazy_method
+
+        for method_name in methods:
+            setattr(cls, method_name, make_lazy_method(method_name))
+        cls.lazyparam_class = subclasses
+        return cls
+
+    return decorator
+
+
+class LazySuite(unittest.TestSuite):
+    # tests are created on each iteration, and dropped after run (not kept in suite)
+    def __init__(self, factory: Callable[[], Iterator[unittest.TestCase]]):
+        super().__init__()
+        self._factory = factory
+
+    def __iter__(self) -> Iterator[unittest.TestCase]:
+        return self._factory()
+
+    def countTestCases(self) -> int:
+        return sum(test.countTestCases() for test in self)
+
+    def _removeTestAtIndex(self, index: int) -> None:
+        pass
+
+
+def _iter_flat(suite: Iterable[Any]) -> Iterator[Any]:
+    for test in suite:
+        if isinstance(test, unittest.TestSuite) and not isinstance(test, LazySuite):
+            yield from _iter_flat(test)
+        else:
+            yield test
+
+
+def _case_class_name(cls: type, name: str) -> str:
+    return "{}_{}".format(cls.__name__, name)
+
+
+def _expand_method(cls: type, name: str) -> Iterator[unittest.TestCase]:
+    method = getattr(cls, name)
+    expansion = getattr(method, "lazyparam_expansion", None)
+    if expansion is None:
+        yield cls(name)
+        return
+    # test id : "module.Class_method.case_name", see module_getattr()
+    class_name = _case_class_name(cls, name)
+    case_class = type(
+        class_name,
+        (cls,),
+        {"__module__": cls.__module__, "__qualname__": class_name},
+    )
+    for case_name, p in expansion:
+        yield _make_case(case_class, case_name, expansion.func, method, p)
+
+
+def _expand_class(
+    loader: unittest.TestLoader, subclasses: Callable[[], Iterator[Tuple[str, type]]]
+) -> Iterator[unittest.TestCase]:
+    for _, subclass in subclasses():
+        for name in loader.getTestCaseNames(subclass):
+            yield from _expand_method(subclass, name)
+
+
+class _MethodCases:
+    # module_getattr() result for "Class_method" : attribute of each case name is
+    # TestSuite of the case (returned as is by TestLoader.loadTestsFromName())
+    def __init__(self, cls: type, name: str):
+        self._cls = cls
+        self._name = name
+
+    def __getattr__(self, case_name: str) -> unittest.TestSuite:
+        if not case_name.startswith("__"):
+            for test in _expand_method(self._cls, self._name):
+                if test._testMethodName == case_name:
+                    return unittest.TestSuite([test])
+        raise AttributeError(
+            "{} has no case {!r}".format(
+                _case_class_name(self._cls, self._name), case_name
+            )
+        )
+
+
+def _find_lazy(cls: type, name: str) -> Any:
+    # generated class "Class_0" of expand_class, or cases of "Class_method"
+    subclasses = cls.__dict__.get("lazyparam_class")
+    if subclasses is not None:
+        for subclass_name, subclass in subclasses():
+            if subclass_name == name:
+                return subclass
+            if name.startswith(subclass_name + "_"):
+                found = _find_lazy(subclass, name)
+                if found is not None:
+                    return found
+        return None
+    for method_name in unittest.TestLoader().getTestCaseNames(cls):
+        if _case_class_name(cls, method_name) == name and hasattr(
+            getattr(cls, method_name), "lazyparam_expansion"
+        ):
+            return _MethodCases(cls, method_name)
+    return None
+
+
+def module_getattr(module_name: str) -> Callable[[str], Any]:
+    # __getattr__ = module_getattr(__name__) in test module : ids of lazy cases
+    # ("module.Class_method.test_0", "module.Class_0.test") are loadable by
+    # "python -m unittest <id>" and TestLoader.loadTestsFromName().
+    def __getattr__(name: str) -> Any:
+        module = sys.modules[module_name]
+        for value in list(vars(module).values()):
+            if (
+                isinstance(value, type)
+                and issubclass(value, unittest.TestCase)
+                and name.startswith(value.__name__ + "_")
+            ):
+                found = _find_lazy(value, name)
+                if found is not None:
+                    return found
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(module_name, name)
+        )
+
+    return __getattr__
+
+
+def load_tests(
+    loader: unittest.TestLoader, tests: unittest.TestSuite, pattern: Optional[str]
+) -> unittest.TestSuite:
+    # load_tests protocol : replace lazy decorated tests of module with LazySuite
+    suite = unittest.TestSuite()
+    expanded: Set[type] = set()
+    for test in _iter_flat(tests):
+        cls = type(test)
+        subclasses = cls.__dict__.get("lazyparam_class")
+        if subclasses is not None:
+            if cls not in expanded:
+                expanded.add(cls)
+                suite.addTest(
+                    LazySuite(functools.partial(_expand_class, loader, subclasses))
+                )
+            continue
+        name = test.id().rpartition(".")[2]
+        method = getattr(cls, name, None)
+        if hasattr(method, "lazyparam_expansion"):
+            suite.addTest(LazySuite(functools.partial(_expand_method, cls, name)))
+        else:
+            suite.addTest(test)
+    return suite
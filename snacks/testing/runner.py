@@ -0,0 +1,434 @@
+# parallel, sharded version of "python -m unittest discover".
+# ref: https://docs.python.org/ja/3/library/unittest.html#test-discovery
+# ref: https://docs.python.org/ja/3/library/unittest.html#unittest.TextTestRunner
+#
+#   python -m snacks.testing.runner -j 8 -v
+#   python -m snacks.testing.runner -j 8 --durations durations.json  # balance by last run
+#   python -m snacks.testing.runner -j 8 --timing-db .test_timing.sqlite  # see timing.py
+#
+# - test cases are grouped by TestCase class (setUpClass / class level @skip are kept
+#   in one process), classes are distributed to shards by LPT (longest processing time
+#   first) using recorded per test durations.
+# - each shard runs in a worker process, results (including subTest failures and skips)
+#   are sent back as plain records and replayed into one unittest.TextTestResult,
+#   so the report is the same format as "python -m unittest discover".
+import argparse
+import heapq
+import importlib
+import json
+import multiprocessing
+import os
+import sys
+import unittest
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from snacks.testing.timing import TestTiming, TimingDB, TimingMixin, format_report
+
+DEFAULT_DURATION = 0.01
+
+
+class SubTestRecord(NamedTuple):
+    description: str
+    short_description: Optional[str]
+    outcome: str  # failure, error
+    detail: str  # formatted traceback
+
+
+class TestRecord(NamedTuple):
+    test_id: str
+    description: str
+    short_description: Optional[str]
+    # success, failure, error, skip, expected_failure, unexpected_success,
+    # or "" (no outcome : only subtests failed)
+    outcome: str
+    detail: str  # formatted traceback or skip reason
+    duration: float
+    subtests: Tuple[SubTestRecord, ...]  # failed subtests
+    cpu: float = 0.0
+    peak_memory: int = 0
+
+
+class _RecordingResult(TimingMixin, unittest.TestResult):
+    # collects picklable TestRecord in worker process, one record per test
+    def __init__(self, trace_memory: bool = False):
+        super().__init__()
+        self.trace_memory = trace_memory
+        self.records: List[TestRecord] = []
+        self._outcome = ("", "")
+        self._subtests: List[SubTestRecord] = []
+
+    def startTest(self, test):
+        super().startTest(test)
+        self._outcome = ("", "")
+        self._subtests = []
+
+    def stopTest(self, test):
+        super().stopTest(test)
+        outcome, detail = self._outcome
+        timing = self.timings[-1]
+        self.records.append(
+            TestRecord(
+                test.id(),
+                str(test),
+                test.shortDescription(),
+                outcome,
+                detail,
+                timing.wall,
+                tuple(self._subtests),
+                timing.cpu,
+                timing.peak_memory,
+            )
+        )
+
+    def addSuccess(self, test):
+        super().addSuccess(test)
+        self._outcome = ("success", "")
+
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self._outcome = ("failure", self.failures[-1][1])
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        self._outcome = ("error", self.errors[-1][1])
+
+    def addSkip(self, test, reason):
+        super().addSkip(test, reason)
+        self._outcome = ("skip", reason)
+
+    def addExpectedFailure(self, test, err):
+        super().addExpectedFailure(test, err)
+        self._outcome = ("expected_failure", self.expectedFailures[-1][1])
+
+    def addUnexpectedSuccess(self, test):
+        super().addUnexpectedSuccess(test)
+        self._outcome = ("unexpected_success", "")
+
+    def addSubTest(self, test, subtest, err):
+        # only failed subtests are reported, same as unittest.TestResult
+        super().addSubTest(test, subtest, err)
+        if err is not None:
+            if issubclass(err[0], test.failureException):
+                outcome, detail = "failure", self.failures[-1][1]
+            else:
+                outcome, detail = "error", self.errors[-1][1]
+            self._subtests.append(
+                SubTestRecord(str(subtest), subtest.shortDescription(), outcome, detail)
+            )
+
+
+class _ReplayedTest:
+    # stands for a test (or subtest) run in worker process, for TextTestResult output
+    failureException = AssertionError
+
+    def __init__(
+        self, test_id: str, description: str, short_description: Optional[str]
+    ):
+        self.test_id = test_id
+        self.description = description
+        self.short_description = short_description
+
+    def id(self) -> str:
+        return self.test_id
+
+    def shortDescription(self) -> Optional[str]:
+        return self.short_description
+
+    def __str__(self) -> str:
+        return self.description
+
+
+class _ReplayResult(unittest.TextTestResult):
+    # traceback is already formatted in worker process : err is (type, str, None)
+    def _exc_info_to_string(self, err, test):
+        if isinstance(err[1], str):
+            return err[1]
+        return super()._exc_info_to_string(err, test)
+
+
+def replay(result: unittest.TestResult, records: List[TestRecord]) -> None:
+    # result must accept formatted traceback string as err (see _ReplayResult)
+    for record in records:
+        test = _ReplayedTest(
+            record.test_id, record.description, record.short_description
+        )
+        result.startTest(test)  # type: ignore
+        for sub in record.subtests:
+            subtest = _ReplayedTest(
+                record.test_id, sub.description, sub.short_description
+            )
+            exc_type = AssertionError if sub.outcome == "failure" else Exception
+            result.addSubTest(test, subtest, (exc_type, sub.detail, None))  # type: ignore
+        outcome = record.outcome
+        err = (AssertionError, record.detail, None)
+        if outcome == "success":
+            result.addSuccess(test)  # type: ignore
+        elif outcome == "failure":
+            result.addFailure(test, err)  # type: ignore
+        elif outcome == "error":
+            result.addError(test, (Exception, record.detail, None))  # type: ignore
+        elif outcome == "skip":
+            result.addSkip(test, record.detail)  # type: ignore
+        elif outcome == "expected_failure":
+            result.addExpectedFailure(test, err)  # type: ignore
+        elif outcome == "unexpected_success":
+            result.addUnexpectedSuccess(test)  # type: ignore
+        result.stopTest(test)  # type: ignore
+
+
+def iter_tests(suite: unittest.TestSuite) -> Iterator[unittest.TestCase]:
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from iter_tests(test)
+        else:
+            yield test  # type: ignore
+
+
+def is_failed_load(test: unittest.TestCase) -> bool:
+    # import error etc. in discovery (unittest.loader._FailedTest)
+    return type(test).__module__ == "unittest.loader"
+
+
+def group_by_class(tests: List[unittest.TestCase]) -> Dict[str, List[str]]:
+    # "module.Class" -> [test id, ...]
+    groups: Dict[str, List[str]] = {}
+    for test in tests:
+        cls = type(test)
+        groups.setdefault(cls.__module__ + "." + cls.__qualname__, []).append(test.id())
+    return groups
+
+
+def plan_shards(
+    groups: Mapping[str, List[str]],
+    shards: int,
+    durations: Optional[Mapping[str, float]] = None,
+) -> List[List[str]]:
+    # LPT : heaviest class first, into currently lightest shard.
+    # unknown test duration : mean of known durations (or DEFAULT_DURATION)
+    durations = durations or {}
+    known = [d for d in durations.values() if d > 0]
+    default = sum(known) / len(known) if known else DEFAULT_DURATION
+    costs = [
+        (sum(durations.get(test_id, default) for test_id in test_ids), key, test_ids)
+        for key, test_ids in groups.items()
+    ]
+    costs.sort(key=lambda cost: (-cost[0], cost[1]))
+    heap: List[Tuple[float, int]] = [(0.0, i) for i in range(max(1, shards))]
+    planned: List[List[str]] = [[] for _ in heap]
+    for cost, _, test_ids in costs:
+        load, index = heapq.heappop(heap)
+        planned[index].extend(test_ids)
+        heapq.heappush(heap, (load + cost, index))
+    return [shard for shard in planned if shard]
+
+
+def _init_worker(top_level_dir: str) -> None:
+    if top_level_dir not in sys.path:
+        sys.path.insert(0, top_level_dir)
+
+
+def _start_worker(top_level_dir: str) -> None:
+    # initializer of shard worker process : tests may start their own child processes
+    # (multiprocessing demo), which daemonic process is not allowed to do.
+    # ProcessPoolExecutor workers are not daemonic (unlike multiprocessing.Pool), this
+    # makes it explicit for any Python version / start method.
+    multiprocessing.current_process().daemon = False
+    _init_worker(top_level_dir)
+
+
+def _module_name(test_id: str) -> Optional[str]:
+    # longest importable prefix of test id
+    parts = test_id.split(".")
+    for i in range(len(parts) - 1, 0, -1):
+        name = ".".join(parts[:i])
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+        return name
+    return None
+
+
+def load_shard(test_ids: List[str]) -> unittest.TestSuite:
+    # tests generated by module's load_tests (e.g. lazyparam.py without module_getattr())
+    # are not loadable by name : such ids are picked from module's load_tests result.
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    unresolved: Dict[str, List[str]] = {}
+    for test_id in test_ids:
+        tests = loader.loadTestsFromName(test_id)
+        module_name = None
+        if any(is_failed_load(test) for test in iter_tests(tests)):
+            module_name = _module_name(test_id)
+        if module_name is None:
+            suite.addTest(tests)
+        else:
+            unresolved.setdefault(module_name, []).append(test_id)
+    for module_name, ids in unresolved.items():
+        wanted = set(ids)
+        module_tests = loader.loadTestsFromModule(importlib.import_module(module_name))
+        for test in iter_tests(module_tests):
+            if test.id() in wanted:
+                wanted.discard(test.id())
+                suite.addTest(test)
+        for test_id in ids:
+            if test_id in wanted:
+                suite.addTest(loader.loadTestsFromName(test_id))  # load error
+    return suite
+
+
+def run_shard(test_ids: List[str], trace_memory: bool = False) -> List[TestRecord]:
+    suite = load_shard(test_ids)
+    result = _RecordingResult(trace_memory)
+    result.startTestRun()
+    try:
+        suite.run(result)
+    finally:
+        result.stopTestRun()
+    return result.records
+
+
+class ParallelSuite:
+    # callable like TestSuite : suite(result) runs shards in process pool and replays
+    # records into result. usable with unittest.TextTestRunner.run().
+    def __init__(
+        self,
+        suite: unittest.TestSuite,
+        processes: Optional[int] = None,
+        durations: Optional[Mapping[str, float]] = None,
+        top_level_dir: Optional[str] = None,
+        start_method: Optional[str] = None,
+        trace_memory: bool = False,
+    ):
+        tests = list(iter_tests(suite))
+        self.local_tests = [test for test in tests if is_failed_load(test)]
+        self.processes = processes or multiprocessing.cpu_count()
+        self.shards = plan_shards(
+            group_by_class([test for test in tests if not is_failed_load(test)]),
+            self.processes,
+            durations,
+        )
+        self.top_level_dir = os.path.abspath(top_level_dir or os.getcwd())
+        self.context = multiprocessing.get_context(start_method)
+        self.trace_memory = trace_memory
+        self.records: List[TestRecord] = []
+
+    def countTestCases(self) -> int:
+        return sum(len(shard) for shard in self.shards) + len(self.local_tests)
+
+    def __call__(self, result: unittest.TestResult) -> unittest.TestResult:
+        for test in self.local_tests:
+            test(result)
+        if not self.shards:
+            return result
+        # not multiprocessing.Pool : its workers are daemonic (see _start_worker())
+        processes = min(self.processes, len(self.shards))
+        with ProcessPoolExecutor(
+            processes, self.context, _start_worker, (self.top_level_dir,)
+        ) as executor:
+            futures = [
+                executor.submit(run_shard, shard, self.trace_memory)
+                for shard in self.shards
+            ]
+            for future in as_completed(futures):
+                records = future.result()
+                self.records.extend(records)
+                replay(result, records)
+        return result
+
+    def durations(self) -> Dict[str, float]:
+        return {r.test_id: r.duration for r in self.records if r.outcome != "skip"}
+
+    def timings(self) -> List[TestTiming]:
+        return [
+            TestTiming(r.test_id, r.duration, r.cpu, r.peak_memory)
+            for r in self.records
+        ]
+
+
+def run(
+    start_dir: str = ".",
+    pattern: str = "test*.py",
+    top_level_dir: Optional[str] = None,
+    processes: Optional[int] = None,
+    durations: Optional[Mapping[str, float]] = None,
+    verbosity: int = 1,
+    stream: Any = None,
+    on_finished: Optional[Callable[[ParallelSuite], None]] = None,
+    trace_memory: bool = False,
+) -> unittest.TestResult:
+    top_level_dir = os.path.abspath(top_level_dir or os.getcwd())
+    _init_worker(top_level_dir)
+    suite = unittest.TestLoader().discover(start_dir, pattern, top_level_dir)
+    parallel = ParallelSuite(
+        suite, processes, durations, top_level_dir, trace_memory=trace_memory
+    )
+    runner = unittest.TextTestRunner(
+        stream=stream, verbosity=verbosity, resultclass=_ReplayResult
+    )
+    result = runner.run(parallel)  # type: ignore
+    if on_finished is not None:
+        on_finished(parallel)
+    return result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="parallel unittest discover")
+    parser.add_argument("-j", "--processes", type=int, default=None)
+    parser.add_argument("-v", "--verbose", action="store_const", const=2, default=1)
+    parser.add_argument("-s", "--start-directory", default=".")
+    parser.add_argument("-p", "--pattern", default="test*.py")
+    parser.add_argument("-t", "--top-level-directory", default=None)
+    parser.add_argument(
+        "--durations", help="JSON file of per test durations, read and updated"
+    )
+    parser.add_argument(
+        "--timing-db", help="SQLite timing database (see timing.py), read and updated"
+    )
+    parser.add_argument("--memory", action="store_true", help="trace peak memory")
+    parser.add_argument("--top", type=int, default=10, help="slow tests in report")
+    args = parser.parse_args(argv)
+    durations: Dict[str, float] = {}
+    if args.durations and os.path.exists(args.durations):
+        with open(args.durations) as f:
+            durations = json.load(f)
+    if args.timing_db:
+        with TimingDB(args.timing_db) as db:
+            durations.update(db.durations())
+
+    def save_durations(parallel: ParallelSuite) -> None:
+        if args.durations:
+            durations.update(parallel.durations())
+            with open(args.durations, "w") as f:
+                json.dump(durations, f, indent=2, sort_keys=True)
+        if args.timing_db:
+            with TimingDB(args.timing_db) as db:
+                db.record_run(parallel.timings())
+                print(format_report(db, args.top), file=sys.stderr)
+
+    result = run(
+        args.start_directory,
+        args.pattern,
+        args.top_level_directory,
+        args.processes,
+        durations,
+        args.verbose,
+        on_finished=save_durations,
+        trace_memory=args.memory,
+    )
+    return 0 if result.wasSuccessful() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,281 @@
+# per test timing (wall time, CPU time, tracemalloc peak memory) stored in SQLite across runs,
+# with slow test / regression report. durations feed shard planning of runner.py.
+# ref: https://docs.python.org/ja/3/library/sqlite3.html
+# ref: https://docs.python.org/ja/3/library/tracemalloc.html
+#
+#   python -m snacks.testing.timing --db .test_timing.sqlite --memory   # serial run + report
+#   python -m snacks.testing.timing --db .test_timing.sqlite --report   # report only
+#   python -m snacks.testing.runner -j 8 --timing-db .test_timing.sqlite
+#
+# timing of a test is from startTest() to stopTest(), so it includes setUp() / tearDown()
+# fixture cost (e.g. 3 tempdirs of TestUnittestSetupTeardown), but not setUpClass().
+import argparse
+import sqlite3
+import statistics
+import sys
+import time
+import tracemalloc
+import unittest
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+DEFAULT_DB = ".test_timing.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS timings (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id),
+    test_id TEXT NOT NULL,
+    wall REAL NOT NULL,
+    cpu REAL NOT NULL,
+    peak_memory INTEGER NOT NULL,
+    PRIMARY KEY (run_id, test_id)
+);
+CREATE INDEX IF NOT EXISTS timings_test_id ON timings(test_id, run_id);
+"""
+
+
+class TestTiming(NamedTuple):
+    test_id: str
+    wall: float  # seconds
+    cpu: float  # seconds, process CPU time
+    peak_memory: int  # bytes, 0 if memory is not traced
+
+    __test__ = False  # not a test class for pytest collection
+
+
+class Regression(NamedTuple):
+    test_id: str
+    baseline: float  # median wall time of previous runs
+    latest: float
+
+
+class TimingMixin:
+    # mix into unittest.TestResult subclass (before it) :
+    #   class TimingTextResult(TimingMixin, unittest.TextTestResult): ...
+    # trace_memory : tracemalloc peak per test (slows down tests, off by default).
+    # tracemalloc started by this result is stopped by stopTestRun().
+    trace_memory = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)  # type: ignore
+        self.timings: List[TestTiming] = []
+        self._timing_start = (0.0, 0.0, 0)
+        self._started_tracemalloc = False
+
+    def startTest(self, test):
+        memory_base = 0
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            _reset_peak()
+            memory_base = tracemalloc.get_traced_memory()[0]
+        self._timing_start = (time.perf_counter(), time.process_time(), memory_base)
+        super().startTest(test)  # type: ignore
+
+    def stopTest(self, test):
+        super().stopTest(test)  # type: ignore
+        wall_start, cpu_start, memory_base = self._timing_start
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        peak = 0
+        if self.trace_memory:
+            peak = max(0, tracemalloc.get_traced_memory()[1] - memory_base)
+        self.timings.append(TestTiming(test.id(), wall, cpu, peak))
+
+    def stopTestRun(self):
+        super().stopTestRun()  # type: ignore
+        if self._started_tracemalloc:
+            self._started_tracemalloc = False
+            tracemalloc.stop()
+
+
+def _reset_peak() -> None:
+    # tracemalloc.reset_peak() is Python 3.9+, clear_traces() resets peak too
+    reset_peak = getattr(tracemalloc, "reset_peak", None)
+    if reset_peak is not None:
+        reset_peak()
+    else:
+        tracemalloc.clear_traces()
+
+
+class TimingTextResult(TimingMixin, unittest.TextTestResult):
+    pass
+
+
+class MemoryTimingTextResult(TimingMixin, unittest.TextTestResult):
+    trace_memory = True
+
+
+class TimingDB:
+    def __init__(self, path: str = DEFAULT_DB):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "TimingDB":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def record_run(self, timings: Iterable[TestTiming]) -> int:
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO runs (started) VALUES (?)", (time.time(),)
+            )
+            run_id = cursor.lastrowid
+            # same test id twice in a run (re-run) : last one wins
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO timings VALUES (?, ?, ?, ?, ?)",
+                [(run_id, t.test_id, t.wall, t.cpu, t.peak_memory) for t in timings],
+            )
+        return run_id  # type: ignore
+
+    def run_ids(self, last: Optional[int] = None) -> List[int]:
+        # newest first
+        sql = "SELECT run_id FROM runs ORDER BY run_id DESC"
+        if last is not None:
+            sql += " LIMIT {:d}".format(last)
+        return [row[0] for row in self.conn.execute(sql)]
+
+    def run_timings(self, run_id: Optional[int] = None) -> List[TestTiming]:
+        if run_id is None:
+            run_ids = self.run_ids(1)
+            if not run_ids:
+                return []
+            run_id = run_ids[0]
+        rows = self.conn.execute(
+            "SELECT test_id, wall, cpu, peak_memory FROM timings WHERE run_id = ?",
+            (run_id,),
+        )
+        return [TestTiming(*row) for row in rows]
+
+    def _walls(self, run_ids: List[int]) -> Dict[str, List[float]]:
+        walls: Dict[str, List[float]] = {}
+        if not run_ids:
+            return walls
+        placeholders = ", ".join("?" * len(run_ids))
+        rows = self.conn.execute(
+            "SELECT test_id, wall FROM timings WHERE run_id IN ({})".format(
+                placeholders
+            ),
+            run_ids,
+        )
+        for test_id, wall in rows:
+            walls.setdefault(test_id, []).append(wall)
+        return walls
+
+    def durations(self, runs: int = 5) -> Dict[str, float]:
+        # median wall time of last runs, for runner.plan_shards()
+        return {
+            test_id: statistics.median(walls)
+            for test_id, walls in self._walls(self.run_ids(runs)).items()
+        }
+
+    def slowest(self, n: int = 10, run_id: Optional[int] = None) -> List[TestTiming]:
+        return sorted(self.run_timings(run_id), key=lambda t: t.wall, reverse=True)[:n]
+
+    def regressions(
+        self, threshold: float = 0.5, min_delta: float = 0.01, runs: int = 5
+    ) -> List[Regression]:
+        # latest run vs median of previous runs :
+        # slower by more than threshold (ratio) and more than min_delta seconds
+        run_ids = self.run_ids(runs + 1)
+        if len(run_ids) < 2:
+            return []
+        baseline = self._walls(run_ids[1:])
+        found = []
+        for timing in self.run_timings(run_ids[0]):
+            walls = baseline.get(timing.test_id)
+            if not walls:
+                continue
+            median = statistics.median(walls)
+            if timing.wall > max(median * (1 + threshold), median + min_delta):
+                found.append(Regression(timing.test_id, median, timing.wall))
+        found.sort(key=lambda r: r.latest - r.baseline, reverse=True)
+        return found
+
+
+def format_report(
+    db: TimingDB, top: int = 10, threshold: float = 0.5, min_delta: float = 0.01
+) -> str:
+    lines = ["slowest {} tests (wall / cpu / peak memory):".format(top)]
+    for t in db.slowest(top):
+        lines.append(
+            "  {:8.3f}s {:8.3f}s {:10,d}B  {}".format(
+                t.wall, t.cpu, t.peak_memory, t.test_id
+            )
+        )
+    regressions = db.regressions(threshold, min_delta)
+    lines.append(
+        "regressions (> {:.0%} and > {}s slower than median of previous runs):".format(
+            threshold, min_delta
+        )
+    )
+    for r in regressions:
+        lines.append(
+            "  {:8.3f}s -> {:8.3f}s  {}".format(r.baseline, r.latest, r.test_id)
+        )
+    if not regressions:
+        lines.append("  (none)")
+    return "\n".join(lines)
+
+
+def run(
+    start_dir: str = ".",
+    pattern: str = "test*.py",
+    top_level_dir: Optional[str] = None,
+    trace_memory: bool = False,
+    verbosity: int = 1,
+) -> Tuple[unittest.TestResult, List[TestTiming]]:
+    # serial run with timing (see runner.py for parallel run)
+    suite = unittest.TestLoader().discover(start_dir, pattern, top_level_dir)
+    resultclass = MemoryTimingTextResult if trace_memory else TimingTextResult
+    result = unittest.TextTestRunner(verbosity=verbosity, resultclass=resultclass).run(
+        suite
+    )
+    return result, getattr(result, "timings", [])
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="unittest discover with timing database"
+    )
+    parser.add_argument("--db", default=DEFAULT_DB)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument(
+        "--memory", action="store_true", help="trace peak memory per test"
+    )
+    parser.add_argument(
+        "--report", action="store_true", help="report only, do not run tests"
+    )
+    parser.add_argument("-v", "--verbose", action="store_const", const=2, default=1)
+    parser.add_argument("-s", "--start-directory", default=".")
+    parser.add_argument("-p", "--pattern", default="test*.py")
+    parser.add_argument("-t", "--top-level-directory", default=None)
+    args = parser.parse_args(argv)
+    status = 0
+    with TimingDB(args.db) as db:
+        if not args.report:
+            result, timings = run(
+                args.start_directory,
+                args.pattern,
+                args.top_level_directory,
+                args.memory,
+                args.verbose,
+            )
+            db.record_run(timings)
+            status = 0 if result.wasSuccessful() else 1
+        print(format_report(db, args.top), file=sys.stderr)
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
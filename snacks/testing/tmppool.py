@@ -0,0 +1,198 @@
+# pooled temporary directories for test fixtures, instead of tempfile.TemporaryDirectory()
+# created and rmtree'd in every setUp() / tearDown() (see TestUnittestSetupTeardown in
+# test_unittest_demo.py).
+# ref: https://docs.python.org/ja/3/library/tempfile.html#tempfile.TemporaryDirectory
+# ref: https://docs.python.org/ja/3/library/os.html#os.scandir
+#
+#   class TestWithTempDirs(TestCase):
+#       def setUp(self):
+#           self.tempdir1 = pooled_tempdir(self)                       # released by addCleanup()
+#           self.tempdir2 = get_pool().temporary_directory("_suffix0_")  # .name / .cleanup()
+#
+# released directory is emptied (its entries are removed, directory itself is kept) and
+# handed out again by next acquire() with same suffix / prefix.
+# tmpfs (/dev/shm) is opt-in : use_shm=True or SNACKS_TMPPOOL_SHM=1 (docker default /dev/shm
+# is only 64MB).
+# each process has its own pool root directory (get_pool() checks pid), so directories are
+# never shared between worker processes of runner.py, even with fork start method.
+import multiprocessing.util
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+import weakref
+from typing import Dict, List, Optional, Set, Tuple
+
+_SHM_DIR = "/dev/shm"
+
+_pool: Optional["TempDirPool"] = None
+_pool_pid = 0
+_pool_lock = threading.Lock()
+
+
+def default_base_dir(use_shm: Optional[bool] = None) -> str:
+    # use_shm : tmpfs (/dev/shm) if available, no disk I/O for create / remove.
+    # None : SNACKS_TMPPOOL_SHM=1 in environment
+    if use_shm is None:
+        use_shm = os.environ.get("SNACKS_TMPPOOL_SHM") == "1"
+    if use_shm and os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK | os.X_OK):
+        return _SHM_DIR
+    return tempfile.gettempdir()
+
+
+def clear_directory(path: str) -> None:
+    # remove all entries in path, keep path itself
+    with os.scandir(path) as it:
+        entries = list(it)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path)
+        else:
+            os.unlink(entry.path)
+
+
+def _remove_root(root: str, pid: int) -> None:
+    # forked child drops inherited pool (see get_pool()) : root belongs to parent
+    if os.getpid() == pid:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+class TempDirPool:
+    def __init__(
+        self,
+        size: int = 0,
+        base_dir: Optional[str] = None,
+        prefix: str = "snacks_pool_",
+        use_shm: Optional[bool] = None,
+    ):
+        # size : number of directories created up front (without suffix / prefix)
+        # use_shm : see default_base_dir(), ignored if base_dir is given
+        self.base_dir = base_dir or default_base_dir(use_shm)
+        self.root = tempfile.mkdtemp(
+            prefix="{}{}_".format(prefix, os.getpid()), dir=self.base_dir
+        )
+        self._free: Dict[Tuple[str, str], List[str]] = {}
+        self._keys: Dict[str, Tuple[str, str]] = {}  # path -> (suffix, prefix)
+        self._in_use: Set[str] = set()
+        self._lock = threading.Lock()
+        self._finalizer = weakref.finalize(self, _remove_root, self.root, os.getpid())
+        self.prefill(size)
+
+    def _create(self, key: Tuple[str, str], in_use: bool) -> str:
+        path = tempfile.mkdtemp(key[0], key[1], self.root)
+        with self._lock:
+            self._keys[path] = key
+            if in_use:
+                self._in_use.add(path)
+        return path
+
+    def prefill(
+        self, n: int, suffix: Optional[str] = None, prefix: Optional[str] = None
+    ) -> None:
+        key = (suffix or "", prefix or "tmp")
+        paths = [self._create(key, False) for _ in range(n)]
+        with self._lock:
+            self._free.setdefault(key, []).extend(paths)
+
+    def acquire(
+        self, suffix: Optional[str] = None, prefix: Optional[str] = None
+    ) -> str:
+        # suffix / prefix : same as tempfile.TemporaryDirectory()
+        key = (suffix or "", prefix or "tmp")
+        with self._lock:
+            free = self._free.get(key)
+            if free:
+                path = free.pop()
+                self._in_use.add(path)
+                return path
+        return self._create(key, True)
+
+    def release(self, path: str) -> None:
+        # released twice : ValueError (would be handed out to two callers)
+        with self._lock:
+            key = self._keys.get(path)
+            if key is None:
+                raise ValueError("not a directory of this pool: {}".format(path))
+            if path not in self._in_use:
+                raise ValueError("directory is already released: {}".format(path))
+            self._in_use.discard(path)
+        try:
+            clear_directory(path)
+        except OSError:
+            # removed by test itself, or not removable : not reused
+            shutil.rmtree(path, ignore_errors=True)
+            with self._lock:
+                del self._keys[path]
+            return
+        with self._lock:
+            self._free.setdefault(key, []).append(path)
+
+    def temporary_directory(
+        self, suffix: Optional[str] = None, prefix: Optional[str] = None
+    ) -> "PooledTemporaryDirectory":
+        return PooledTemporaryDirectory(self, self.acquire(suffix, prefix))
+
+    def free_count(self) -> int:
+        with self._lock:
+            return sum(len(paths) for paths in self._free.values())
+
+    def close(self) -> None:
+        self._finalizer()
+
+    def __enter__(self) -> "TempDirPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class PooledTemporaryDirectory:
+    # same interface as tempfile.TemporaryDirectory : name / cleanup() / with statement
+    __slots__ = ("pool", "name")
+
+    def __init__(self, pool: TempDirPool, name: str):
+        self.pool: Optional[TempDirPool] = pool
+        self.name = name
+
+    def cleanup(self) -> None:
+        # released once, second cleanup() does nothing (like TemporaryDirectory)
+        pool, self.pool = self.pool, None
+        if pool is not None:
+            pool.release(self.name)
+
+    def __enter__(self) -> str:
+        return self.name
+
+    def __exit__(self, *exc) -> None:
+        self.cleanup()
+
+
+def get_pool(use_shm: Optional[bool] = None) -> TempDirPool:
+    # pool of current process (new one after fork).
+    # use_shm : see default_base_dir(), used when the pool is created (first call)
+    global _pool, _pool_pid
+    pid = os.getpid()
+    pool = _pool
+    if pool is not None and _pool_pid == pid:
+        return pool
+    with _pool_lock:
+        if _pool is None or _pool_pid != pid:
+            _pool = TempDirPool(use_shm=use_shm)
+            _pool_pid = pid
+            # worker processes of multiprocessing / concurrent.futures exit by os._exit()
+            # without atexit handlers (weakref.finalize), but run multiprocessing finalizers
+            multiprocessing.util.Finalize(_pool, _pool.close, exitpriority=0)
+        return _pool
+
+
+def pooled_tempdir(
+    testcase: unittest.TestCase,
+    suffix: Optional[str] = None,
+    prefix: Optional[str] = None,
+) -> str:
+    # directory path released after tearDown() by testcase.addCleanup()
+    pool = get_pool()
+    path = pool.acquire(suffix, prefix)
+    testcase.addCleanup(pool.release, path)
+    return path
@@ -0,0 +1,129 @@
+# lazy (generator) version of str.split() / str.splitlines(), for str, bytes and mmap.
+# text is split block by block (block_size), so peak memory is bounded by block size
+# instead of whole result list.
+# (see test_split_join in test_string_demo.py)
+# ref: https://docs.python.org/ja/3/library/stdtypes.html#str.splitlines
+# ref: https://docs.python.org/ja/3/library/mmap.html
+#
+#   list(isplit("a,b,,c,", ",", 2))   # -> ["a", "b", ",c,"]
+#   with open_mmap("big.log") as m:
+#       for line in isplitlines(m):   # bytes lines, file is not read into memory at once
+#           ...
+import mmap
+import re
+from contextlib import contextmanager
+from typing import AnyStr, Iterator, Optional, Union
+
+Text = Union[str, bytes, bytearray, mmap.mmap]
+
+_WHITESPACE_STR = re.compile(r"\S+")
+_WHITESPACE_BYTES = re.compile(rb"\S+")
+# line boundaries of str.splitlines() / bytes.splitlines() except "\r" (see isplitlines())
+_LINE_ENDS_STR = "\n\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+_LINE_ENDS_BYTES = b"\n"
+
+DEFAULT_BLOCK_SIZE = 64 * 1024
+
+
+def isplit(
+    text: Text,
+    sep: Optional[AnyStr] = None,
+    maxsplit: int = -1,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> Iterator[AnyStr]:
+    if sep is not None and not sep:
+        raise ValueError("empty separator")
+    if maxsplit >= 0:
+        # at most maxsplit + 1 items : no need to split block by block
+        if sep is None:
+            yield from _isplit_whitespace(text, maxsplit)
+        else:
+            yield from _isplit_find(text, sep, maxsplit)
+        return
+    size = len(text)
+    if not size:
+        if sep is not None:
+            yield text[:0]
+        return
+    empty = text[:0]
+    carry = empty
+    pos = 0
+    while pos < size:
+        # carry (incomplete last item) is joined to next block.
+        # block grows with carry, so very long item is not re-split many times.
+        end = pos + max(block_size, len(carry))
+        block = carry + text[pos:end]
+        pos = end
+        if sep is None:
+            items = block.split()
+            complete = pos >= size or not items or block[-1:].isspace()
+        else:
+            items = block.split(sep)
+            complete = pos >= size
+        carry = empty if complete else items.pop()
+        yield from items
+
+
+def _isplit_find(text: Text, sep: AnyStr, maxsplit: int) -> Iterator[AnyStr]:
+    find = text.find
+    step = len(sep)
+    start = 0
+    while maxsplit:
+        index = find(sep, start)
+        if index < 0:
+            break
+        yield text[start:index]
+        start = index + step
+        maxsplit -= 1
+    yield text[start:]
+
+
+def _isplit_whitespace(text: Text, maxsplit: int) -> Iterator[AnyStr]:
+    pattern = _WHITESPACE_STR if isinstance(text, str) else _WHITESPACE_BYTES
+    for match in pattern.finditer(text):
+        if not maxsplit:
+            # rest of text from here, trailing whitespaces are kept like str.split()
+            start = match.start()
+            yield text[start:]
+            return
+        yield match.group()
+        maxsplit -= 1
+
+
+def isplitlines(
+    text: Text, keepends: bool = False, block_size: int = DEFAULT_BLOCK_SIZE
+) -> Iterator[AnyStr]:
+    # block by block splitlines(). block ending with "\r" is treated as incomplete,
+    # "\r\n" may be split at block boundary.
+    if isinstance(text, str):
+        line_ends, cr = _LINE_ENDS_STR, "\r"
+    else:
+        line_ends, cr = _LINE_ENDS_BYTES, b"\r"
+    size = len(text)
+    empty = text[:0]
+    carry = empty
+    pos = 0
+    while pos < size:
+        end = pos + max(block_size, len(carry))
+        block = carry + text[pos:end]
+        pos = end
+        lines = block.splitlines(keepends)
+        carry = empty
+        if pos < size:
+            last = block[-1:]
+            if last not in line_ends:
+                carry = lines.pop()
+                if last == cr and not keepends:
+                    carry += cr
+        yield from lines
+
+
+@contextmanager
+def open_mmap(path: str) -> Iterator[Union[mmap.mmap, bytes]]:
+    # read only mmap of whole file (empty file can't be mmap-ed : b"" instead)
+    with open(path, "rb") as f:
+        if not f.seek(0, 2):
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            yield m
@@ -0,0 +1,116 @@
+# streaming (chunk by chunk) decode / encode / transcode using codecs incremental codecs.
+# (see test_string_lietral_byte_array_conversion_unicode_demo in test_string_demo.py)
+# ref: https://docs.python.org/ja/3/library/codecs.html#incremental-encoding-and-decoding
+#
+# multi-byte sequence split at chunk boundary (e.g. 3 byte utf-8 character) is kept
+# in the incremental decoder until next chunk arrives, so result is same as whole decode.
+#
+#   with open("in.log", "rb") as src, open("out.log", "wb") as dst:
+#       transcode_file(src, dst, "latin_1", "utf_8")
+import codecs
+from typing import BinaryIO, Iterable, Iterator, Tuple, Union
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def iter_chunks(
+    source: Union[BytesLike, BinaryIO], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[memoryview]:
+    # bytes-like source : zero copy memoryview slices.
+    # binary file source : readinto() one reusable buffer, memory is constant.
+    #   NOTE: yielded view is valid only until next iteration (buffer is reused).
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive: {}".format(chunk_size))
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        view = memoryview(source).cast("B")
+        for start in range(0, len(view), chunk_size):
+            end = start + chunk_size
+            yield view[start:end]
+        return
+    buf = bytearray(chunk_size)
+    view = memoryview(buf)
+    readinto = getattr(source, "readinto", None)
+    while True:
+        if readinto is not None:
+            n = readinto(view)
+        else:
+            data = source.read(chunk_size)
+            n = len(data)
+            view[:n] = data
+        if not n:
+            return
+        yield view[:n]
+
+
+def iter_decode(
+    chunks: Iterable[BytesLike], encoding: str, errors: str = "strict"
+) -> Iterator[str]:
+    decoder = codecs.getincrementaldecoder(encoding)(errors)
+    decode = decoder.decode
+    for chunk in chunks:
+        text = decode(chunk)
+        if text:
+            yield text
+    # flush : incomplete trailing sequence raises (or replaced) here
+    text = decode(b"", True)
+    if text:
+        yield text
+
+
+def iter_encode(
+    texts: Iterable[str], encoding: str, errors: str = "strict"
+) -> Iterator[bytes]:
+    encoder = codecs.getincrementalencoder(encoding)(errors)
+    encode = encoder.encode
+    for text in texts:
+        data = encode(text)
+        if data:
+            yield data
+    data = encode("", True)
+    if data:
+        yield data
+
+
+def iter_transcode(
+    chunks: Iterable[BytesLike],
+    from_encoding: str,
+    to_encoding: str,
+    errors: str = "strict",
+) -> Iterator[bytes]:
+    return iter_encode(iter_decode(chunks, from_encoding, errors), to_encoding, errors)
+
+
+def decode_stream(
+    source: Union[BytesLike, BinaryIO],
+    encoding: str,
+    errors: str = "strict",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    return iter_decode(iter_chunks(source, chunk_size), encoding, errors)
+
+
+def transcode_file(
+    src: BinaryIO,
+    dst: BinaryIO,
+    from_encoding: str,
+    to_encoding: str,
+    errors: str = "strict",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Tuple[int, int]:
+    # returns (bytes read, bytes written)
+    bytes_in = 0
+    bytes_out = 0
+
+    def counted() -> Iterator[memoryview]:
+        nonlocal bytes_in
+        for chunk in iter_chunks(src, chunk_size):
+            bytes_in += len(chunk)
+            yield chunk
+
+    write = dst.write
+    for data in iter_transcode(counted(), from_encoding, to_encoding, errors):
+        bytes_out += len(data)
+        write(data)
+    return bytes_in, bytes_out
@@ -0,0 +1,107 @@
+# cached typing.get_type_hints() with precomputed get_origin()/get_args().
+# ref: https://docs.python.org/ja/3/library/typing.html#typing.get_type_hints
+# ref: https://docs.python.org/ja/3/library/weakref.html#weakref.WeakKeyDictionary
+#
+# cache is keyed by the class/function object itself with weak reference, so classes
+# defined at runtime can still be garbage collected.
+# NOTE: a hint referencing its own owner (e.g. "next: Optional['Node']" in Node) keeps
+# the owner alive from the cache value. call cache_clear() if that matters.
+import inspect
+import types
+import weakref
+from typing import (
+    Any,
+    Dict,
+    Mapping,
+    NamedTuple,
+    Tuple,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+
+class HintInfo(NamedTuple):
+    hint: Any
+    # List[str] -> list, Union[str, int] -> Union, str -> None
+    origin: Any
+    # List[str] -> (str,), Union[str, int] -> (str, int), str -> ()
+    args: Tuple[Any, ...]
+
+
+class ResolvedHints(NamedTuple):
+    hints: Mapping[str, Any]
+    infos: Mapping[str, HintInfo]
+
+
+_cache: "weakref.WeakKeyDictionary[Any, ResolvedHints]" = weakref.WeakKeyDictionary()
+
+
+def _key(obj: Any) -> Any:
+    # o1.some_method / MyTypeDemo2.some_class_method are new bound method objects on
+    # every attribute access, use the underlying function as key.
+    if isinstance(obj, types.MethodType):
+        return obj.__func__
+    return obj
+
+
+def _resolve(obj: Any) -> ResolvedHints:
+    hints = get_type_hints(obj)
+    infos = {
+        name: HintInfo(hint, get_origin(hint), get_args(hint))
+        for name, hint in hints.items()
+    }
+    return ResolvedHints(types.MappingProxyType(hints), types.MappingProxyType(infos))
+
+
+def resolve(obj: Any) -> ResolvedHints:
+    key = _key(obj)
+    try:
+        return _cache[key]
+    except KeyError:
+        pass
+    except TypeError:
+        # not weak referenceable (or unhashable) : no cache
+        return _resolve(key)
+    resolved = _resolve(key)
+    _cache[key] = resolved
+    return resolved
+
+
+def get_hints(obj: Any) -> Mapping[str, Any]:
+    # same result as get_type_hints(obj), but read-only and cached.
+    return resolve(obj).hints
+
+
+def get_hint_infos(obj: Any) -> Mapping[str, HintInfo]:
+    return resolve(obj).infos
+
+
+def warmup_module(module: types.ModuleType) -> int:
+    # resolve all classes/functions defined in module (and methods of the classes).
+    # returns number of resolved objects.
+    count = 0
+    for _, obj in inspect.getmembers(module):
+        if getattr(obj, "__module__", None) != module.__name__:
+            continue
+        if inspect.isclass(obj):
+            resolve(obj)
+            count += 1
+            for attr in vars(obj).values():
+                if isinstance(attr, (classmethod, staticmethod)):
+                    attr = attr.__func__
+                if inspect.isfunction(attr):
+                    resolve(attr)
+                    count += 1
+        elif inspect.isfunction(obj):
+            resolve(obj)
+            count += 1
+    return count
+
+
+def cache_info() -> Dict[str, int]:
+    return {"size": len(_cache)}
+
+
+def cache_clear() -> None:
+    _cache.clear()
@@ -0,0 +1,228 @@
+# dataclass payload validator/coercer compiled from type hints.
+# each dataclass's hints are compiled once into nested checker closures,
+# so validating a payload does not walk get_type_hints() results per object.
+#
+# supported hints : str, int, float (int is coerced to float), bool, None, Any,
+#                   List[T], Dict[K, V], Union[...] (Optional), nested dataclass.
+#
+#   validate = compile_validator(MyTypeDemo2)
+#   validate({"str1": "hello", "int1": 1})  # -> MyTypeDemo2("hello", 1, [])
+#   validate_many(MyTypeDemo2, payloads)    # -> [MyTypeDemo2, ...]
+#
+# compiled validators are cached per dataclass in a WeakKeyDictionary (same as
+# typehints.resolve()), validators refer their dataclass weakly, so dynamically created
+# dataclasses are not kept alive by the cache.
+import dataclasses
+import weakref
+from typing import Any, Callable, Iterable, List, Union, get_args, get_origin
+
+from snacks.typehints import HintInfo, get_hint_infos
+
+# checker(value) -> validated (coerced) value, or raise ValidationError
+Checker = Callable[[Any], Any]
+
+
+class ValidationError(ValueError):
+    # error location is built only when validation fails:
+    # nested checkers re-raise with the parent path segment prepended.
+    def __init__(self, message: str, path: str = ""):
+        super().__init__(message, path)
+        self.message = message
+        self.path = path
+
+    def __str__(self) -> str:
+        return "${}: {}".format(self.path, self.message)
+
+    def prefixed(self, segment: str) -> "ValidationError":
+        return ValidationError(self.message, segment + self.path)
+
+
+_EXACT = (str, int, bool, type(None))
+
+
+def _type_name(t: Any) -> str:
+    return getattr(t, "__name__", str(t))
+
+
+def _mismatch(expected: str, value: Any) -> ValidationError:
+    return ValidationError("expected {}, got {}".format(expected, type(value).__name__))
+
+
+def _check_exact(t: type) -> Checker:
+    # exact type match : bool is not accepted as int, like JSON schema "integer"
+    def check(value):
+        if type(value) is t:
+            return value
+        raise _mismatch(t.__name__, value)
+
+    return check
+
+
+def _check_float(value):
+    t = type(value)
+    if t is float:
+        return value
+    if t is int:
+        return float(value)
+    raise _mismatch("float", value)
+
+
+def _check_any(value):
+    return value
+
+
+def _compile_list(item_hint: Any) -> Checker:
+    if item_hint in _EXACT:
+        # fast path : no per item python call, list is returned as is
+        def check_exact_list(value):
+            if type(value) is not list:
+                raise _mismatch("list", value)
+            for i, item in enumerate(value):
+                if type(item) is not item_hint:
+                    raise _mismatch(item_hint.__name__, item).prefixed("[{}]".format(i))
+            return value
+
+        return check_exact_list
+
+    check_item = compile_hint(item_hint)
+
+    def check_list(value):
+        if type(value) is not list:
+            raise _mismatch("list", value)
+        result = []
+        for i, item in enumerate(value):
+            try:
+                result.append(check_item(item))
+            except ValidationError as e:
+                raise e.prefixed("[{}]".format(i)) from None
+        return result
+
+    return check_list
+
+
+def _compile_dict(key_hint: Any, value_hint: Any) -> Checker:
+    check_key = compile_hint(key_hint)
+    check_value = compile_hint(value_hint)
+
+    def check_dict(value):
+        if type(value) is not dict:
+            raise _mismatch("dict", value)
+        result = {}
+        for k, v in value.items():
+            try:
+                result[check_key(k)] = check_value(v)
+            except ValidationError as e:
+                raise e.prefixed("[{!r}]".format(k)) from None
+        return result
+
+    return check_dict
+
+
+def _compile_union(member_hints: Iterable[Any]) -> Checker:
+    member_hints = tuple(member_hints)
+    exact_types = frozenset(t for t in member_hints if t in _EXACT)
+    checkers = [compile_hint(t) for t in member_hints if t not in exact_types]
+    expected = " | ".join(_type_name(t) for t in member_hints)
+
+    def check_union(value):
+        if type(value) in exact_types:
+            return value
+        for check in checkers:
+            try:
+                return check(value)
+            except ValidationError:
+                pass
+        raise _mismatch(expected, value)
+
+    return check_union
+
+
+def _compile_dataclass(cls: type) -> Checker:
+    # resolved at call time : allows self referencing dataclass.
+    cls_ref = weakref.ref(cls)
+
+    def check_dataclass(value):
+        return compile_validator(cls_ref())(value)  # type: ignore
+
+    return check_dataclass
+
+
+def _compile_info(info: HintInfo) -> Checker:
+    hint, origin, args = info
+    if hint is Any:
+        return _check_any
+    if hint is float:
+        return _check_float
+    if hint in _EXACT:
+        return _check_exact(hint)
+    if origin is list:
+        return _compile_list(args[0] if args else Any)
+    if origin is dict:
+        return _compile_dict(*(args or (Any, Any)))
+    if origin is Union:
+        return _compile_union(args)
+    if dataclasses.is_dataclass(hint):
+        return _compile_dataclass(hint)
+    raise TypeError("unsupported type hint: {!r}".format(hint))
+
+
+def compile_hint(hint: Any) -> Checker:
+    return _compile_info(HintInfo(hint, get_origin(hint), get_args(hint)))
+
+
+_validators: "weakref.WeakKeyDictionary[type, Callable[[Any], Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def compile_validator(cls: type) -> Callable[[Any], Any]:
+    # compiled validator is cached per dataclass.
+    try:
+        return _validators[cls]
+    except KeyError:
+        pass
+    if not dataclasses.is_dataclass(cls):
+        raise TypeError("{!r} is not a dataclass".format(cls))
+    infos = get_hint_infos(cls)
+    init_fields = [f for f in dataclasses.fields(cls) if f.init]
+    checkers = {f.name: _compile_info(infos[f.name]) for f in init_fields}
+    required = frozenset(
+        f.name
+        for f in init_fields
+        if f.default is dataclasses.MISSING
+        and f.default_factory is dataclasses.MISSING  # type: ignore
+    )
+    items = tuple(checkers.items())
+    cls_ref = weakref.ref(cls)
+
+    def validate(payload: Any) -> Any:
+        if type(payload) is not dict:
+            raise _mismatch("dict", payload)
+        kwargs = {}
+        for name, check in items:
+            if name in payload:
+                try:
+                    kwargs[name] = check(payload[name])
+                except ValidationError as e:
+                    raise e.prefixed("." + name) from None
+            elif name in required:
+                raise ValidationError("missing required field", "." + name)
+        if len(kwargs) != len(payload):
+            unknown = sorted(map(str, set(payload) - set(checkers)))
+            raise ValidationError("unknown field(s): {}".format(", ".join(unknown)))
+        return cls_ref()(**kwargs)  # type: ignore
+
+    _validators[cls] = validate
+    return validate
+
+
+def validate_many(cls: type, payloads: Iterable[Any]) -> List[Any]:
+    validate = compile_validator(cls)
+    result = []
+    append = result.append
+    for i, payload in enumerate(payloads):
+        try:
+            append(validate(payload))
+        except ValidationError as e:
+            raise e.prefixed("[{}]".format(i)) from None
+    return result
@@ -1,8 +1,4 @@
-import os
-import glob
-from . import module3
-from . import module4
-from . import module5
+import importlib
 
 # demonstration package for start import (import *, from xxx import *)
 
@@ -10,18 +6,6 @@ from . import module5
 # - Python パッケージ作成: __init__.py の __all__ を手作業でメンテナンスしたくない - Qiita
 #   - https://qiita.com/suzuki-kei/items/8fea67655abf216a5013
 
-# except __init__.py
-glob_module_py_pattern = os.path.join(os.path.dirname(__file__), "[a-zA-Z0-9]*.py")
-module_py_files = []
-for file in glob.glob(glob_module_py_pattern):
-    module_py_files.append(file)
-
-all_module_names = []
-for fullpath in module_py_files:
-    module_basename = os.path.basename(fullpath)
-    module_name = os.path.splitext(module_basename)[0]
-    all_module_names.append(module_name)
-
 # __all__ = all_module_names
 # -> 実際に試してみたところ、__all__ を動的に生成すると vscode 側で認識できず、自動補完などに支障が出る。
 __all__ = ["module3", "module4", "module5"]
@@ -31,9 +15,45 @@ __all__ = ["module3", "module4", "module5"]
 
 # star import があまり歓迎されてない雰囲気。
 # -> 利用する側の import を少しでも軽量にするため、パッケージ側でエイリアスを作ってみる。
-module3_sub = module3.module3_sub
-ClassInModule3 = module3.ClassInModule3
-module4_sub = module4.module4_sub
-ClassInModule4 = module4.ClassInModule4
-module5_sub = module5.module5_sub
-ClassInModule5 = module5.ClassInModule5
+# -> さらに PEP 562 の module __getattr__ で、サブモジュールとエイリアスを初回アクセス時に import する。
+#    (以前は import 時に glob.glob() でモジュールを走査し、module3-5 を全て import していた)
+# ref: https://www.python.org/dev/peps/pep-0562/
+_aliases = {
+    "module3_sub": ("module3", "module3_sub"),
+    "ClassInModule3": ("module3", "ClassInModule3"),
+    "module4_sub": ("module4", "module4_sub"),
+    "ClassInModule4": ("module4", "ClassInModule4"),
+    "module5_sub": ("module5", "module5_sub"),
+    "ClassInModule5": ("module5", "ClassInModule5"),
+}
+
+
+def _all_module_names():
+    # except __init__.py
+    import glob
+    import os
+
+    glob_module_py_pattern = os.path.join(os.path.dirname(__file__), "[a-zA-Z0-9]*.py")
+    return [
+        os.path.splitext(os.path.basename(fullpath))[0]
+        for fullpath in glob.glob(glob_module_py_pattern)
+    ]
+
+
+def __getattr__(name):
+    if name in __all__:
+        value = importlib.import_module("." + name, __name__)
+    elif name in _aliases:
+        module_name, attr_name = _aliases[name]
+        value = getattr(__getattr__(module_name), attr_name)
+    elif name == "all_module_names":
+        value = _all_module_names()
+    else:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    # cache : next access does not call __getattr__()
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | set(_aliases))
@@ -0,0 +1,48 @@
+import sys
+from unittest import TestCase
+
+from snacks.byteconv import as_ints, from_ints, iter_ints
+
+# bulk version of int.from_bytes() / to_bytes() in test_string_demo.py
+
+
+class TestByteConvDemo(TestCase):
+    def test_as_ints(self):
+        b00_to_ff = bytes(range(256))
+        self.assertEqual(as_ints(b00_to_ff).tolist(), list(range(256)))
+        for width in (1, 2, 4, 8):
+            for byteorder in ("little", "big"):
+                for signed in (False, True):
+                    with self.subTest(width=width, byteorder=byteorder, signed=signed):
+                        bounds = zip(range(0, 256, width), range(width, 257, width))
+                        expected = [
+                            int.from_bytes(b00_to_ff[i:j], byteorder, signed=signed)
+                            for i, j in bounds
+                        ]
+                        self.assertEqual(
+                            as_ints(b00_to_ff, width, byteorder, signed).tolist(),
+                            expected,
+                        )
+                        self.assertEqual(
+                            list(iter_ints(b00_to_ff, width, byteorder, signed)),
+                            expected,
+                        )
+                        self.assertEqual(
+                            from_ints(expected, width, byteorder, signed), b00_to_ff
+                        )
+
+    def test_native_byteorder_is_zero_copy(self):
+        buf = bytearray(8)
+        ints = as_ints(buf, 4, sys.byteorder)
+        ints[1] = 0x01020304
+        self.assertEqual(bytes(buf[4:]), (0x01020304).to_bytes(4, sys.byteorder))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            as_ints(b"\x00\x01\x02", 2)
+        with self.assertRaises(ValueError):
+            as_ints(b"\x00\x01\x02", 3)
+        with self.assertRaises(ValueError):
+            from_ints([1], 1, "middle")
+        with self.assertRaises(OverflowError):
+            from_ints([256], 1)
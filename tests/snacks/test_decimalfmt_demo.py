@@ -0,0 +1,56 @@
+import decimal
+from decimal import Decimal
+from unittest import TestCase
+
+from snacks.decimalfmt import DecimalFormatter, exponent, format_decimals
+
+# bulk version of Decimal formatting in test_f_string of test_string_demo.py
+
+
+class TestDecimalFormatDemo(TestCase):
+    def test_exponent(self):
+        self.assertEqual(exponent(2), Decimal("0.01"))
+        self.assertIs(exponent(4), exponent(4))
+        with self.assertRaises(ValueError):
+            exponent(-1)
+
+    def test_same_as_format(self):
+        values = [
+            Decimal("12.34567"),
+            Decimal("2.675"),
+            Decimal("0.125"),
+            Decimal("-0.001"),
+            Decimal("1E+20"),
+            Decimal("1E-9"),
+            Decimal("-1234567.5"),
+            Decimal("NaN"),
+        ]
+        for places in (0, 2, 4, 8):
+            for width in (0, 15):
+                for thousands in (False, True):
+                    spec = ">{}{}.{}f".format(
+                        width or "", "," if thousands else "", places
+                    )
+                    with self.subTest(spec=spec):
+                        self.assertEqual(
+                            format_decimals(values, places, width, thousands=thousands),
+                            [format(v, spec) for v in values],
+                        )
+
+    def test_rounding_and_context(self):
+        values = [Decimal("2.5"), Decimal("3.5"), Decimal("-2.5")]
+        self.assertEqual(format_decimals(values, 0), ["2", "4", "-2"])
+        self.assertEqual(
+            format_decimals(values, 0, rounding=decimal.ROUND_HALF_UP), ["3", "4", "-3"]
+        )
+        # thread local context does not change the result
+        with decimal.localcontext() as ctx:
+            ctx.rounding = decimal.ROUND_DOWN
+            ctx.prec = 3
+            self.assertEqual(format_decimals([Decimal("12345.675")], 2), ["12345.68"])
+
+    def test_infinity(self):
+        formatter = DecimalFormatter(2, 10)
+        values = [Decimal("1.005"), Decimal("-Infinity")]
+        self.assertEqual(formatter.format_column(values), ["      1.00", " -Infinity"])
+        self.assertEqual(formatter.format(Decimal("Infinity")), "  Infinity")
@@ -0,0 +1,196 @@
+import gc
+import weakref
+from unittest import TestCase
+from collections.abc import Sequence
+
+from snacks import dispatch
+from snacks.dispatch import typedispatch, dispatchmethod, BoundDispatcher
+
+# demonstration of cached single dispatch (see test_method_overload_demo.py)
+
+
+@typedispatch
+def dispatch_func_demo(dispatch_arg) -> str:
+    return "unsupported type:" + str(dispatch_arg)
+
+
+@dispatch_func_demo.register
+def dispatch_func_demo_str(dispatch_arg: str) -> str:
+    return "string:" + dispatch_arg
+
+
+@dispatch_func_demo.register(int)
+def dispatch_func_demo_int(dispatch_arg) -> str:
+    return "int:" + str(dispatch_arg)
+
+
+class C1:
+    f1: int = 100
+
+    def __init__(self, attr1: int):
+        self.attr1 = attr1
+
+    @dispatchmethod
+    def add(self, arg1) -> str:
+        return "unsupported type:" + str(arg1) + ":" + str(self.attr1)
+
+    @add.register
+    def _add_str(self, arg1: str) -> str:
+        return arg1 + str(self.attr1)
+
+    @add.register
+    def _add_int(self, arg1: int) -> str:
+        return str(arg1 + self.attr1)
+
+    # works, unlike singledispatchmethod + classmethod (bpo-39679)
+    @dispatchmethod
+    @classmethod
+    def bigger(cls, arg1) -> str:
+        return "unsupported type:" + str(arg1) + ":" + str(cls.f1)
+
+    @bigger.register
+    @classmethod
+    def _bigger_str(cls, arg1: str) -> str:
+        return (arg1 + str(cls.f1)).upper()
+
+    @bigger.register(int)
+    @classmethod
+    def _bigger_int(cls, arg1) -> str:
+        return str(arg1 + cls.f1)
+
+    @dispatchmethod
+    @staticmethod
+    def kind(arg1) -> str:
+        return "other"
+
+    @kind.register
+    @staticmethod
+    def _kind_str(arg1: str) -> str:
+        return "str"
+
+
+class C2(C1):
+    f1: int = 200
+
+
+class TestTypeDispatcherDemo(TestCase):
+    def test_func(self):
+        self.assertEqual(dispatch_func_demo("hello"), "string:hello")
+        self.assertEqual(dispatch_func_demo(100), "int:100")
+        # bool -> int handler by MRO, then cached for bool itself
+        self.assertEqual(dispatch_func_demo(True), "int:True")
+        self.assertIs(
+            dispatch_func_demo.dispatcher._cache[bool], dispatch_func_demo_int
+        )
+        self.assertEqual(
+            dispatch_func_demo([10, 20, 30]), "unsupported type:[10, 20, 30]"
+        )
+        self.assertEqual(dispatch_func_demo.__name__, "dispatch_func_demo")
+
+    def test_register_clears_cache(self):
+        @typedispatch
+        def f(arg) -> str:
+            return "default"
+
+        self.assertEqual(f([1]), "default")
+        f.register(list, lambda arg: "list")
+        self.assertEqual(f([1]), "list")
+
+    def test_cache_does_not_keep_class(self):
+        @typedispatch
+        def f(arg) -> str:
+            return "default"
+
+        size = dispatch.CACHE_SIZE
+        try:
+            dispatch.CACHE_SIZE = 3
+            classes = [type("Dynamic{}".format(i), (), {}) for i in range(5)]
+            for cls in classes:
+                self.assertEqual(f(cls()), "default")
+            # cleared at 3 types, only types dispatched after that are kept
+            self.assertEqual(list(f.dispatcher._cache), classes[3:])
+        finally:
+            dispatch.CACHE_SIZE = size
+
+    def test_abc_register(self):
+        @typedispatch
+        def f(arg) -> str:
+            return "default"
+
+        @f.register
+        def _f_seq(arg: Sequence) -> str:
+            return "sequence"
+
+        class MySeq:
+            pass
+
+        self.assertEqual(f(MySeq()), "default")
+        Sequence.register(MySeq)
+        # ABC cache token changed : cached "default" is not used
+        self.assertEqual(f(MySeq()), "sequence")
+
+    def test_dispatch_many(self):
+        items = ["aa", 1, [2], "bb", 3]
+        self.assertEqual(
+            dispatch_func_demo.dispatch_many(items),
+            [dispatch_func_demo(item) for item in items],
+        )
+        self.assertEqual(dispatch_func_demo.dispatch_many([]), [])
+
+
+class TestDispatchMethodDemo(TestCase):
+    def test_method(self):
+        o1 = C1(10)
+        self.assertIsInstance(o1.add, BoundDispatcher)
+        self.assertEqual(o1.add("hello"), "hello10")
+        self.assertEqual(o1.add(20), "30")
+        self.assertEqual(o1.add([1, 2]), "unsupported type:[1, 2]:10")
+        # dispatch table is shared by all instances
+        o2 = C1(20)
+        self.assertIs(o1.add._dispatcher, o2.add._dispatcher)
+        self.assertEqual(
+            o2.add.dispatch_many([1, "x", 2.0]),
+            ["21", "x20", "unsupported type:2.0:20"],
+        )
+
+    def test_classmethod(self):
+        self.assertEqual(C1.bigger("hello"), "HELLO100")
+        self.assertEqual(C1.bigger(20), "120")
+        self.assertEqual(C1.bigger([1, 2]), "unsupported type:[1, 2]:100")
+        # called via instance : still bound to the class
+        self.assertEqual(C1(10).bigger("abc"), "ABC100")
+        # bound to subclass, not to the class defining the method
+        self.assertEqual(C2.bigger(20), "220")
+        self.assertEqual(C2(10).bigger.dispatch_many(["x", 1]), ["X200", "201"])
+        # bound dispatcher is cached per class
+        self.assertIs(C1.bigger, C1.bigger)
+        self.assertIs(C1.bigger, C1(1).bigger)
+        self.assertIsNot(C1.bigger, C2.bigger)
+        # cached by the class itself : dynamically created subclass is not kept alive
+        subclass = weakref.ref(type("C3", (C1,), {}))
+        self.assertEqual(subclass().bigger(1), "101")
+        gc.collect()
+        self.assertIsNone(subclass())
+        # registered classmethod object is kept in the class body
+        self.assertEqual(C1._bigger_str("abc"), "ABC100")
+
+    def test_staticmethod(self):
+        self.assertEqual(C1.kind("a"), "str")
+        self.assertEqual(C1(1).kind(1), "other")
+
+    def test_register_kind_mismatch(self):
+        with self.assertRaises(TypeError) as cm:
+
+            class C3:
+                @dispatchmethod
+                @classmethod
+                def f(cls, arg1) -> str:
+                    return ""
+
+                @f.register
+                def _f_int(self, arg1: int) -> str:
+                    return ""
+
+        self.assertEqual(
+            str(cm.exception), "cannot register method to classmethod dispatcher 'f'"
+        )
@@ -0,0 +1,102 @@
+from unittest import TestCase
+from enum import Enum, unique, auto
+
+from snacks.fastenum import FastEnum
+
+# demonstration of FastEnum (see test_enum_demo.py for plain Enum)
+
+
+class Animals(FastEnum):
+    CAT = 1
+    DOG = 2
+    BIRD = 3
+    FISH = 5
+    TURTLE = 10
+    SNAKE = 4
+    NEKO = 1  # alias of CAT
+
+
+class TestFastEnumDemo(TestCase):
+    def test_lookup(self):
+        self.assertIsInstance(Animals.CAT, Enum)
+        self.assertIs(Animals.from_value(4), Animals.SNAKE)
+        self.assertIs(Animals.from_value(4), Animals(4))
+        self.assertIs(Animals.from_name("FISH"), Animals["FISH"])
+        # alias
+        self.assertIs(Animals.from_value(1), Animals.CAT)
+        self.assertIs(Animals.from_name("NEKO"), Animals.CAT)
+
+        with self.assertRaises(ValueError) as cm1:
+            Animals.from_value(999)
+        self.assertEqual(str(cm1.exception), "999 is not a valid Animals")
+        with self.assertRaises(ValueError):
+            Animals.from_value([1])
+        with self.assertRaises(KeyError) as cm2:
+            Animals.from_name("ABC")
+        self.assertEqual(str(cm2.exception), "'ABC'")
+
+    def test_iteration_and_ordinal(self):
+        expected = [
+            Animals.CAT,
+            Animals.DOG,
+            Animals.BIRD,
+            Animals.FISH,
+            Animals.TURTLE,
+            Animals.SNAKE,
+        ]
+        self.assertEqual(list(Animals), expected)
+        self.assertEqual(Animals.members(), tuple(expected))
+        self.assertEqual(list(reversed(Animals)), expected[::-1])
+        self.assertEqual(len(Animals), 6)
+        self.assertEqual([a.ordinal for a in Animals], list(range(6)))
+        self.assertIs(Animals.from_ordinal(3), Animals.FISH)
+
+    def test_enum_features(self):
+        with self.assertRaises(ValueError):
+
+            @unique
+            class DuplicateValueEnum2(FastEnum):
+                XX = 1
+                YY = 1
+
+        class NamedValueEnum(FastEnum):
+            def _generate_next_value_(name, start, count, last_values):
+                return name
+
+        class News(NamedValueEnum):
+            NORTH = auto()
+            SOUTH = auto()
+
+        self.assertIs(News.from_value("SOUTH"), News.SOUTH)
+
+        class StringRepeater2(FastEnum):
+            count: int
+            joiner: str
+
+            ONE_DOT = (1, ",")
+            TWO_COLON = (2, ":")
+
+            def __new__(cls, count: int, joiner: str):
+                obj = object.__new__(cls)
+                obj._value_ = count
+                obj.count = count
+                obj.joiner = joiner
+                return obj
+
+        self.assertIs(StringRepeater2.from_value(2), StringRepeater2.TWO_COLON)
+        self.assertEqual(StringRepeater2.from_name("ONE_DOT").joiner, ",")
+
+    def test_missing_hook(self):
+        class Color(FastEnum):
+            RED = "red"
+
+            @classmethod
+            def _missing_(cls, value):
+                if isinstance(value, str):
+                    # not from_value() : unknown value would call _missing_() again
+                    return cls._fast_by_value_.get(value.lower())
+                return None
+
+        self.assertIs(Color.from_value("RED"), Color.RED)
+        with self.assertRaises(ValueError):
+            Color.from_value("blue")
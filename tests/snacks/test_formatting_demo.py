@@ -0,0 +1,74 @@
+import decimal
+import io
+from types import SimpleNamespace
+from unittest import TestCase
+
+from snacks.formatting import compile_format, format_rows
+
+# precompiled version of test_format / test_f_string in test_string_demo.py
+
+
+class TestFormattingDemo(TestCase):
+    def test_compile_format(self):
+        v = decimal.Decimal("12.34567")
+        o = SimpleNamespace(x=3, y=[1, 2])
+        cases = [
+            ("{},{},{}", (1, 2, 3), {}),
+            ("{2},{0},{1}", (1, 2, 3), {}),
+            ("{n1},{n2},{n3}", (), dict(n1=1, n3=3, n2=2)),
+            ("{0},{1[0]},{1[1]},{l1[0]},{l1[1]}", (1, [2, 3]), dict(l1=[4, 5])),
+            ("{0:@<5},{0:@>5},{0:@^5}", ("aaa",), {}),
+            ("{0:b},{0:d},{0:o},{0:x},{0:X},{0:#x},{0:#X}", (45,), {}),
+            ("{0:>8b},{0:0>8b},{0:0>5d}", (45,), {}),
+            ("{:+,.2f},{:+,.2f}", (1234.567, -1234.567), {}),
+            ("result: {v:{width}.{precision}}", (), dict(v=v, width=10, precision=4)),
+            ("{{x}} {0.x} {0.y[1]} {0!r:>30} {1[k]}", (o, {"k": "'\\"}), {}),
+            ("{0:\\>5} '\" \\ \n", ("a",), {}),
+            (
+                "{a-b} {_format_p0} {args} {kwargs} {class}",
+                (),
+                {"a-b": 1, "_format_p0": 2, "args": 3, "kwargs": 4, "class": 5},
+            ),
+            ("{1} {0}", (1, 2, 3), {"extra": 4}),
+            # non canonical field numbers / index keys : same as str.format()
+            ("{00} {01} {1}", (5, 6), {}),
+            ("{\u0663} {0[01]} {0[\u00b2]}", ({1: "i", "\u00b2": "s"}, 1, 2, 3), {}),
+            # non ASCII names : not NFKC normalized like identifiers in source
+            ("{\ufb01} {\u00e9}", (), {"\ufb01": 1, "fi": 2, "\u00e9": 3}),
+            ("{0.\ufb01}", (SimpleNamespace(**{"\ufb01": 1, "fi": 2}),), {}),
+            ("", (), {}),
+        ]
+        for template, args, kwargs in cases:
+            with self.subTest(template=template):
+                fmt = compile_format(template)
+                self.assertEqual(fmt(*args, **kwargs), template.format(*args, **kwargs))
+                self.assertEqual(fmt.template, template)
+        self.assertIs(compile_format("{}"), compile_format("{}"))
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            compile_format("{}{0}")
+        with self.assertRaises(ValueError):
+            compile_format("{0}{}")
+        with self.assertRaises(ValueError):
+            compile_format("{!x}")
+        # missing argument : TypeError from function call
+        with self.assertRaises(TypeError):
+            compile_format("{1}")(0)
+        with self.assertRaises(TypeError):
+            compile_format("{a}")(b=1)
+        with self.assertRaises(KeyError):
+            compile_format("{a-b}")(b=1)
+
+    def test_format_rows(self):
+        self.assertEqual(
+            format_rows("{}:{:>5}", [("a", 1), ("b", 2)]), "a:    1\nb:    2\n"
+        )
+        self.assertEqual(
+            format_rows("{x}", ({"x": i} for i in range(3)), end="{}"), "0{}1{}2{}"
+        )
+        self.assertEqual(format_rows("{}", []), "")
+        out = io.StringIO()
+        out.write("header\n")
+        self.assertIsNone(format_rows("{0:0>3d}", [(1,), (2,)], out=out))
+        self.assertEqual(out.getvalue(), "header\n001\n002\n")
@@ -0,0 +1,154 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from unittest import TestCase
+
+import tests.snacks.test_package_module_demo  # noqa: F401 (loaded module for namespace_modules)
+from snacks.testing.impact import (
+    ImpactTextResult,
+    StaticImports,
+    build_map,
+    changed_files,
+    head_commit,
+    module_name,
+    select,
+)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+PACKAGE_DEMO = "tests.snacks.test_package_module_demo"
+
+
+class TestImpactDemo(TestCase):
+    def test_static_imports(self):
+        self.assertEqual(
+            module_name(os.path.join(ROOT, "tests", "snacks", "__init__.py"), ROOT),
+            "tests.snacks",
+        )
+        closure = StaticImports(ROOT).closure(PACKAGE_DEMO)
+        for relpath in [
+            "tests/snacks/test_package_module_demo.py",
+            "tests/__init__.py",
+            "snacks/mypkgdemo1/__init__.py",
+            "snacks/mypkgdemo1/_batch.py",
+            "snacks/mypkgdemo1/module1.py",
+            "snacks/mypkgdemo1/module2.py",
+            "tests/snacks/mypkgdemo1/__init__.py",
+            "tests/snacks/mypkgdemo2/__init__.py",
+            # "from .mypkgdemo2 import module3_sub" : PEP 562 __getattr__, by namespace
+            "tests/snacks/mypkgdemo2/module3.py",
+        ]:
+            self.assertIn(os.path.normpath(relpath), closure)
+        self.assertNotIn(os.path.normpath("snacks/strbuilder.py"), closure)
+
+    def test_recording(self):
+        class TestCallsStrBuilder(TestCase):
+            def test_trace(self):
+                from snacks.strbuilder import arg_trace
+
+                self.assertEqual(arg_trace("<", ">", 1), "<,*a[0]=[1]>")
+
+        class Result(ImpactTextResult):
+            impact_root = ROOT
+
+        suite = unittest.TestLoader().loadTestsFromTestCase(TestCallsStrBuilder)
+        with open(os.devnull, "w") as stream:
+            result = unittest.TextTestRunner(stream=stream, resultclass=Result).run(
+                suite
+            )
+        (dependencies,) = result.dependencies.values()
+        self.assertIn(os.path.normpath("snacks/strbuilder.py"), dependencies)
+        self.assertIn(
+            os.path.normpath("tests/snacks/test_impact_demo.py"), dependencies
+        )
+        self.assertNotIn(os.path.normpath("snacks/testing/impact.py"), dependencies)
+
+    def test_select(self):
+        module = "tests.snacks.test_x"
+        impact_map = build_map(
+            {
+                module + ".TestX.test_a": {"snacks/a.py", "tests/snacks/test_x.py"},
+                module + ".TestX.test_b": {"snacks/b.py", "tests/snacks/test_x.py"},
+                "tests.snacks.test_y.TestY.test_c": {
+                    "snacks/a.py",
+                    "tests/snacks/test_y.py",
+                },
+            },
+            "0" * 40,
+            "test*.py",
+        )
+        self.assertTrue(select(None, [], ROOT).full)
+        self.assertTrue(select(impact_map, None, ROOT).full)
+        self.assertEqual(
+            select(impact_map, ["snacks/b.py", "README.md"], ROOT).names,
+            [module + ".TestX.test_b"],
+        )
+        self.assertEqual(
+            select(impact_map, ["snacks/a.py"], ROOT).names,
+            [module + ".TestX.test_a", "tests.snacks.test_y.TestY.test_c"],
+        )
+        # deleted, not in map : no test used it
+        self.assertEqual(select(impact_map, ["snacks/unused.py"], ROOT).names, [])
+        # existing source file not in map : map is stale
+        selection = select(impact_map, ["snacks/a.py", "snacks/switch.py"], ROOT)
+        self.assertEqual(
+            (selection.full, selection.reason),
+            (True, "source file not in dependency map: snacks/switch.py"),
+        )
+        # deleted test module (tests/snacks/test_x.py does not exist) : its tests dropped
+        self.assertEqual(
+            select(impact_map, ["tests/snacks/test_x.py", "snacks/a.py"], ROOT).names,
+            ["tests.snacks.test_y.TestY.test_c"],
+        )
+        selection = select(impact_map, ["setup.cfg"], ROOT)
+        self.assertEqual(
+            (selection.full, selection.reason),
+            (True, "unknown dependency changed: setup.cfg"),
+        )
+        # changed test module (exists) : whole module, its test ids are not listed
+        selection = select(
+            impact_map, ["snacks/a.py", "tests/snacks/test_impact_demo.py"], ROOT
+        )
+        self.assertEqual(
+            selection.names,
+            [
+                "tests.snacks.test_impact_demo",
+                module + ".TestX.test_a",
+                "tests.snacks.test_y.TestY.test_c",
+            ],
+        )
+
+    @unittest.skipUnless(shutil.which("git"), "requires git")
+    def test_changed_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+
+            def git(*args):
+                subprocess.run(
+                    [
+                        "git",
+                        "-c",
+                        "user.name=demo",
+                        "-c",
+                        "user.email=demo@example.com",
+                        *args,
+                    ],
+                    cwd=tmpdir,
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                )
+
+            for name in ("a.py", "b.py"):
+                with open(os.path.join(tmpdir, name), "w") as f:
+                    f.write("x = 1\n")
+            git("init", "-q")
+            git("add", "a.py", "b.py")
+            git("commit", "-q", "-m", "init")
+            commit = head_commit(tmpdir)
+            self.assertEqual(changed_files(tmpdir, commit), [])
+            with open(os.path.join(tmpdir, "b.py"), "a") as f:
+                f.write("y = 2\n")
+            with open(os.path.join(tmpdir, "c.py"), "w") as f:
+                f.write("z = 3\n")
+            self.assertEqual(changed_files(tmpdir, commit), ["b.py", "c.py"])
+            self.assertIsNone(changed_files(tmpdir, "0" * 40))
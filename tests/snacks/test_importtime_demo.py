@@ -0,0 +1,88 @@
+from unittest import TestCase
+import contextlib
+import io
+import os
+import tempfile
+
+from snacks.importtime import (
+    ImportTimeEntry,
+    parse_importtime,
+    build_tree,
+    import_cost_us,
+    run_importtime,
+    compare,
+    main,
+)
+
+# demonstration of "python -X importtime" analysis
+# ref: https://docs.python.org/ja/3/using/cmdline.html#id5
+
+STDERR_DEMO = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     snacks
+import time:        50 |         50 |     snacks.mypkgdemo1._batch
+import time:       200 |        350 |   snacks.mypkgdemo1
+import time:        30 |         30 |   snacks.mypkgdemo1.module1
+import time:        40 |        420 | snacks.mypkgdemo1.module2
+import time:         5 |          5 | other
+"""
+
+
+class TestImportTimeDemo(TestCase):
+    def test_parse(self):
+        entries = parse_importtime("some warning\n" + STDERR_DEMO)
+        self.assertEqual(len(entries), 6)
+        self.assertEqual(entries[0], ImportTimeEntry("snacks", 100, 100, 2))
+        self.assertEqual(
+            entries[4], ImportTimeEntry("snacks.mypkgdemo1.module2", 40, 420, 0)
+        )
+
+    def test_build_tree(self):
+        entries = parse_importtime(STDERR_DEMO)
+        roots = build_tree(entries)
+        self.assertEqual(
+            [r.name for r in roots], ["snacks.mypkgdemo1.module2", "other"]
+        )
+        self.assertEqual(
+            [(depth, node.name) for depth, node in roots[0].walk()],
+            [
+                (0, "snacks.mypkgdemo1.module2"),
+                (1, "snacks.mypkgdemo1"),
+                (2, "snacks"),
+                (2, "snacks.mypkgdemo1._batch"),
+                (1, "snacks.mypkgdemo1.module1"),
+            ],
+        )
+        self.assertEqual(import_cost_us(entries, "snacks.mypkgdemo1.module2"), 420)
+
+    def test_module2_imports_module1_once(self):
+        # "import snacks.mypkgdemo1.module1 as module1" and "from .module1 import ..."
+        # -> second import is a sys.modules hit, not shown in the tree.
+        root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        entries = run_importtime("import snacks.mypkgdemo1.module2", cwd=root)
+        module2 = [
+            r for r in build_tree(entries) if r.name == "snacks.mypkgdemo1.module2"
+        ][0]
+        names = [node.name for _, node in module2.walk()]
+        self.assertEqual(names.count("snacks.mypkgdemo1.module1"), 1)
+        self.assertIn("snacks.mypkgdemo1", names)
+
+    def test_compare(self):
+        baseline = {"a": 10000, "b": 100, "c": 10000}
+        current = {"a": 13000, "b": 300, "c": 11000, "d": 99999}
+        # b : +200% but under min_delta_us, c : +10% under threshold, d : no baseline
+        self.assertEqual(compare(baseline, current), ["a: 10000us -> 13000us (+30%)"])
+        self.assertEqual(compare(baseline, current, threshold=0.5), [])
+
+    def test_main_baseline(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "baseline.json")
+            args = ["json", "--runs", "1", "--baseline", path]
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out), contextlib.redirect_stderr(out):
+                # missing baseline is an error, not written silently
+                self.assertEqual(main(args), 2)
+                self.assertFalse(os.path.exists(path))
+                self.assertEqual(main(args + ["--update-baseline"]), 0)
+            self.assertTrue(os.path.exists(path))
+            self.assertIn("baseline not found: " + path, out.getvalue())
@@ -0,0 +1,222 @@
+import unittest
+from unittest import TestCase
+
+from snacks.testing.lazyparam import (
+    LazySuite,
+    expand,
+    expand_class,
+    load_tests,
+    module_getattr,
+    param,
+    select_cases,
+)
+from snacks.testing.runner import load_shard
+
+# test_unittest_parameterized_demo.py with lazy cases.
+# "python -m unittest" : one test per case by load_tests below,
+# pytest (no load_tests protocol) : one test, cases as subTests.
+# case ids ("TestLazyExpandDemo_test_add_xyz.test_add_xyz_3") loadable by name :
+__getattr__ = module_getattr(__name__)
+
+
+def add_cases():
+    for x in range(1, 6):
+        yield (x, x * 10, x * 100, x * 111)
+
+
+class TestLazyExpandDemo(TestCase):
+    @expand(add_cases)
+    def test_add_xyz(self, x, y, z, expected):
+        self.assertEqual(x + y + z, expected)
+
+    @expand(
+        [
+            param(1, 2, 3, 6),
+            param(10, 20, expected=130),
+            param(10, 20, 70),
+            param(20, 30, z=50),
+            param(0, 0),
+        ]
+    )
+    def test_add_xyz_with_param(self, x, y, z=100, expected=100):
+        self.assertEqual(x + y + z, expected)
+
+
+@expand_class(
+    [
+        {"x": 1, "y": 2, "z": 3, "expected": 6},
+        {"x": 10, "y": 20, "expected": 330},
+        {"expected": 600},
+    ]
+)
+class TestLazyClassDemo(TestCase):
+    x: int = 100
+    y: int = 200
+    z: int = 300
+
+    def test_add_xyz(self):
+        self.assertEqual(self.x + self.y + self.z, self.expected)
+
+
+def case_names(suite, parts=1):
+    # last parts of test ids : "test_add_xyz_0" / "TestLazyClassDemo_1.test_add_xyz"
+    return [".".join(test.id().split(".")[-parts:]) for test in iter_cases(suite)]
+
+
+def iter_cases(suite):
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from iter_cases(test)
+        else:
+            yield test
+
+
+class TestLazyParamDemo(TestCase):
+    def test_select_cases(self):
+        cases = range(100)
+        self.assertEqual(
+            [i for i, _ in select_cases(cases, shard=(1, 3))], list(range(1, 100, 3))
+        )
+        sampled = [i for i, p in select_cases(cases, sample=10, seed=1)]
+        self.assertEqual(len(sampled), 10)
+        self.assertEqual(sampled, sorted(sampled))
+        self.assertEqual(
+            sampled, [i for i, _ in select_cases(cases, sample=10, seed=1)]
+        )
+        self.assertNotEqual(
+            sampled, [i for i, _ in select_cases(cases, sample=10, seed=2)]
+        )
+        (_, p), *_ = select_cases([{"a": 1}])
+        self.assertEqual((p.args, p.kwargs), ((), {"a": 1}))
+
+    def test_load_tests(self):
+        loader = unittest.TestLoader()
+        tests = unittest.TestSuite(
+            [
+                loader.loadTestsFromTestCase(TestLazyExpandDemo),
+                loader.loadTestsFromTestCase(TestLazyClassDemo),
+            ]
+        )
+        suite = load_tests(loader, tests, None)
+        names = case_names(suite)
+        self.assertEqual(names[:2], ["test_add_xyz_0", "test_add_xyz_1"])
+        self.assertIn("test_add_xyz_with_param_4", names)
+        self.assertEqual(len(names), 5 + 5 + 3)
+        self.assertEqual(suite.countTestCases(), len(names))
+        result = unittest.TestResult()
+        suite.run(result)
+        self.assertTrue(result.wasSuccessful())
+        self.assertEqual(result.testsRun, len(names))
+
+    def test_lazy_iteration(self):
+        consumed = []
+
+        def cases():
+            for i in range(1_000_000):
+                consumed.append(i)
+                yield i
+
+        class TestHuge(TestCase):
+            @expand(cases, sample=None, shard=None)
+            def test_huge(self, i):
+                pass
+
+        suite = load_tests(
+            unittest.TestLoader(),
+            unittest.TestLoader().loadTestsFromTestCase(TestHuge),
+            None,
+        )
+        (lazy,) = suite
+        self.assertIsInstance(lazy, LazySuite)
+        tests = iter(lazy)
+        self.assertEqual(
+            [next(tests).id().rpartition(".")[2] for _ in range(3)],
+            ["test_huge_0", "test_huge_1", "test_huge_2"],
+        )
+        self.assertEqual(len(consumed), 3)
+
+    def test_one_shot_iterator(self):
+        with self.assertRaises(TypeError):
+            expand(iter([1, 2]))(lambda self, i: None)
+        with self.assertRaises(TypeError):
+            expand_class(x for x in [{"x": 1}])(TestCase)
+
+        class TestTwice(TestCase):
+            @expand([1, 2])
+            def test_twice(self, i):
+                pass
+
+        suite = load_tests(
+            unittest.TestLoader(),
+            unittest.TestLoader().loadTestsFromTestCase(TestTwice),
+            None,
+        )
+        self.assertEqual(suite.countTestCases(), 2)
+        self.assertEqual(suite.countTestCases(), 2)
+        result = unittest.TestResult()
+        suite.run(result)
+        self.assertEqual(result.testsRun, 2)
+
+    def test_expand_class_positional_args(self):
+        @expand_class([param(1)])
+        class TestPositional(TestCase):
+            def test_nothing(self):
+                pass
+
+        suite = load_tests(
+            unittest.TestLoader(),
+            unittest.TestLoader().loadTestsFromTestCase(TestPositional),
+            None,
+        )
+        with self.assertRaises(TypeError):
+            suite.countTestCases()
+
+    def test_load_shard(self):
+        prefix = TestLazyParamDemo.__module__ + "."
+        suite = load_shard(
+            [
+                prefix + "TestLazyExpandDemo_test_add_xyz.test_add_xyz_3",
+                prefix + "TestLazyClassDemo_1.test_add_xyz",
+                prefix + "TestLazyParamDemo.test_select_cases",
+            ]
+        )
+        self.assertEqual(
+            sorted(case_names(suite, 2)),
+            [
+                "TestLazyClassDemo_1.test_add_xyz",
+                "TestLazyExpandDemo_test_add_xyz.test_add_xyz_3",
+                "TestLazyParamDemo.test_select_cases",
+            ],
+        )
+        result = unittest.TestResult()
+        suite.run(result)
+        self.assertTrue(result.wasSuccessful())
+
+    def test_load_by_name(self):
+        # ids reported by load_tests are loadable by standard loader ("python -m unittest <id>")
+        loader = unittest.TestLoader()
+        suite = load_tests(
+            loader,
+            unittest.TestSuite(
+                [
+                    loader.loadTestsFromTestCase(TestLazyExpandDemo),
+                    loader.loadTestsFromTestCase(TestLazyClassDemo),
+                ]
+            ),
+            None,
+        )
+        ids = [test.id() for test in iter_cases(suite)]
+        self.assertIn(__name__ + ".TestLazyExpandDemo_test_add_xyz.test_add_xyz_3", ids)
+        self.assertIn(__name__ + ".TestLazyClassDemo_1.test_add_xyz", ids)
+        for test_id in ids:
+            with self.subTest(test_id=test_id):
+                loaded = loader.loadTestsFromName(test_id)
+                self.assertEqual([test.id() for test in iter_cases(loaded)], [test_id])
+                result = unittest.TestResult()
+                loaded.run(result)
+                self.assertTrue(result.wasSuccessful())
+                self.assertEqual(result.testsRun, 1)
+        self.assertFalse(loader.errors)
+        # unknown case : load error as usual
+        loader.loadTestsFromName(__name__ + ".TestLazyExpandDemo_test_add_xyz.test_x")
+        self.assertEqual(len(loader.errors), 1)
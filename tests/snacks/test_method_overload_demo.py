@@ -90,6 +90,7 @@ class TestMethodOverloadDemo(TestCase):
                 return str(arg1 + self.attr1)
 
             # do not work, see: https://bugs.python.org/issue39679
+            # -> snacks.dispatch.dispatchmethod supports classmethod, see test_dispatch_demo.py
             """
             @singledispatchmethod
             @classmethod
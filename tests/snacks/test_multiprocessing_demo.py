@@ -1,7 +1,117 @@
-# TODO
+from unittest import TestCase
+import operator
+
+from snacks.mypkgdemo1 import mypkgdemo1_add
+from snacks.mypkgdemo1.module1 import module1_add, ClassInModule1
+from snacks.mypkgdemo1.module2 import module2_add, ClassInModule2
+from snacks.parallel import (
+    ProcessPoolRunner,
+    parallel_map,
+    parallel_starmap,
+    parallel_map_reduce,
+)
+from snacks.benchmarks import percentile
+from snacks.benchmarks.concurrency import MODELS, WORKLOADS, run_benchmark
+
 # demonstration fo multiprocess
 # ref: https://docs.python.org/ja/3/library/multiprocessing.html
 # ref: https://docs.python.org/ja/3/library/threading.html
 # see-also:
 # https://qiita.com/hidetobara/items/11618e1709b0a4f21e65
 # https://docs.python.org/ja/3/glossary.html#term-global-interpreter-lock
+
+
+def square(n: int) -> int:
+    return n * n
+
+
+class TestProcessPoolRunnerDemo(TestCase):
+    def test_starmap(self):
+        args_list = [(i, i + 1, i + 2) for i in range(20)]
+        with ProcessPoolRunner(processes=2, chunksize=3) as runner:
+            self.assertEqual(
+                runner.starmap(module1_add, args_list),
+                [module1_add(*args) for args in args_list],
+            )
+            self.assertEqual(
+                runner.starmap(module2_add, args_list),
+                [module2_add(*args) for args in args_list],
+            )
+            # staticmethod is picklable by its qualified name.
+            self.assertEqual(
+                runner.starmap(ClassInModule1.add, args_list),
+                [ClassInModule1.add(*args) for args in args_list],
+            )
+            self.assertEqual(
+                sorted(runner.starmap(ClassInModule2.add, args_list, ordered=False)),
+                sorted(ClassInModule2.add(*args) for args in args_list),
+            )
+
+    def test_map_unordered(self):
+        with ProcessPoolRunner(processes=2) as runner:
+            self.assertEqual(runner.map(square, range(10)), [n * n for n in range(10)])
+            self.assertEqual(
+                sorted(runner.map(square, range(10), ordered=False)),
+                [n * n for n in range(10)],
+            )
+
+    def test_map_reduce(self):
+        args_list = [(i, i) for i in range(100)]
+        self.assertEqual(
+            parallel_map_reduce(
+                mypkgdemo1_add, args_list, operator.add, 0, star=True, processes=2
+            ),
+            sum(mypkgdemo1_add(*args) for args in args_list),
+        )
+        self.assertEqual(
+            parallel_map_reduce(square, [], operator.add, 0, processes=2), 0
+        )
+
+    def test_start_method(self):
+        self.assertEqual(
+            parallel_map(square, [1, 2, 3], processes=2, start_method="spawn"),
+            [1, 4, 9],
+        )
+        self.assertEqual(
+            parallel_starmap(
+                module1_add, [(1, 2, 3)], processes=2, start_method="spawn"
+            ),
+            [6],
+        )
+        with self.assertRaises(ValueError):
+            ProcessPoolRunner(start_method="thread")
+
+    def test_terminate_on_error(self):
+        with self.assertRaises(ZeroDivisionError):
+            with ProcessPoolRunner(processes=2) as runner:
+                pool = runner.pool
+                runner.map(square, [1, 2])
+                1 / 0
+        self.assertIsNone(runner._pool)
+        with self.assertRaises(ValueError):
+            pool.map(square, [1])
+
+    def test_not_started(self):
+        runner = ProcessPoolRunner(processes=1)
+        with self.assertRaises(RuntimeError):
+            runner.map(square, [1])
+
+
+class TestConcurrencyBenchmarkDemo(TestCase):
+    def test_run_benchmark(self):
+        for workload in WORKLOADS:
+            for model in MODELS:
+                with self.subTest(workload=workload, model=model):
+                    r = run_benchmark(workload, model, workers=2, tasks=4, size=10)
+                    self.assertEqual(r["workers"], 2)
+                    self.assertGreater(r["throughput"], 0.0)
+                    self.assertLessEqual(r["p50"], r["p99"])
+        with self.assertRaises(ValueError):
+            run_benchmark("gpu", "threads", 1, 1, 1)
+
+    def test_percentile(self):
+        values = [float(n) for n in range(1, 101)]
+        self.assertEqual(percentile(values, 50), 50.0)
+        self.assertEqual(percentile(values, 99), 99.0)
+        self.assertEqual(percentile([3.0], 99), 3.0)
+        self.assertEqual(percentile([], 50), 0.0)
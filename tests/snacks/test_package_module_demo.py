@@ -1,5 +1,14 @@
 from unittest import TestCase
-from snacks.mypkgdemo1 import MyPkgDemo1a, MyPkgDemo1b, mypkgdemo1_add
+import array
+import os
+import subprocess
+import sys
+from snacks.mypkgdemo1 import (
+    MyPkgDemo1a,
+    MyPkgDemo1b,
+    mypkgdemo1_add,
+    mypkgdemo1_add_batch,
+)
 
 # relative import
 from .mypkgdemo1 import MyPkgDemo1c, MyPkgDemo1d, mypkgdemo1_sub
@@ -26,6 +35,8 @@ from snacks.mypkgdemo1 import module2
 # "Name may be undefined, or defined from star imports: module (F405)"
 # https://www.flake8rules.com/rules/F405.html
 # -> 断念して、__init__.py 側で手動でエイリアスを設定して import の軽量化を試みた。
+# -> __init__.py 側では PEP 562 の __getattr__ で、エイリアスの参照時に初めて module3-5 を import する。
+from . import mypkgdemo2
 from .mypkgdemo2 import (
     module3_sub,
     module4_sub,
@@ -63,3 +74,86 @@ class TestPackageModuleDemo(TestCase):
         self.assertEqual(ClassInModule3.sub(6, 5), 0)
         self.assertEqual(ClassInModule4.sub(10, 2, 1), 5)
         self.assertEqual(ClassInModule5.sub(10, 1, 2, 3), 1)
+
+    def test_lazy_submodule_import(self):
+        code = (
+            "import sys, tests.snacks.mypkgdemo2 as m; "
+            "print(sorted(k for k in sys.modules if k.startswith(m.__name__ + '.'))); "
+            "m.ClassInModule4; "
+            "print(sorted(k for k in sys.modules if k.startswith(m.__name__ + '.')))"
+        )
+        root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        out = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=root,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        ).stdout
+        self.assertEqual(out, "[]\n['tests.snacks.mypkgdemo2.module4']\n")
+
+        self.assertEqual(sorted(mypkgdemo2.all_module_names), mypkgdemo2.__all__)
+        self.assertIn("module5_sub", dir(mypkgdemo2))
+        with self.assertRaises(AttributeError) as cm:
+            mypkgdemo2.module6
+        self.assertEqual(
+            str(cm.exception),
+            "module 'tests.snacks.mypkgdemo2' has no attribute 'module6'",
+        )
+
+    def test_batch_demo(self):
+        ns1 = [1, 2, 3]
+        ns2 = array.array("i", [10, 20, 30])
+        ns3 = memoryview(bytes([100, 200, 255]))
+        self.assertEqual(
+            mypkgdemo1_add_batch(ns1, ns2),
+            [mypkgdemo1_add(n1, n2) for n1, n2 in zip(ns1, ns2)],
+        )
+        self.assertEqual(
+            module1.module1_add_batch(ns1, ns2, ns3),
+            [module1.module1_add(*ns) for ns in zip(ns1, ns2, ns3)],
+        )
+        # +1 offset of module2_add() is kept.
+        self.assertEqual(
+            module2.module2_add_batch(ns1, ns2, ns3),
+            [module2.module2_add(*ns) for ns in zip(ns1, ns2, ns3)],
+        )
+        self.assertEqual(module2.module2_add_batch((0.5,), (1,), (2,)), [4.5])
+        self.assertEqual(mypkgdemo1_add_batch([], []), [])
+        with self.assertRaises(ValueError) as cm:
+            mypkgdemo1_add_batch([1, 2], [3])
+        self.assertEqual(str(cm.exception), "operand length mismatch: 2 != 1")
+
+    def test_batch_numpy_demo(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        ns1 = numpy.array([1, 2, 3])
+        ns2 = numpy.array([10, 20, 30])
+        self.assertEqual(list(mypkgdemo1_add_batch(ns1, ns2)), [11, 22, 33])
+        self.assertEqual(list(module2.module2_add_batch(ns1, ns2, ns2)), [22, 43, 64])
+        # mixed operand types : ndarray only as last operand, sequences are not concatenated
+        self.assertEqual(
+            list(module1.module1_add_batch([1, 2, 3], (10, 20, 30), ns2)),
+            [21, 42, 63],
+        )
+        self.assertEqual(
+            list(
+                module2.module2_add_batch(array.array("i", [1, 2, 3]), [0, 0, 0], ns1)
+            ),
+            [3, 5, 7],
+        )
+        # ndarray subclass
+        masked = numpy.ma.masked_array([1, 2, 3])
+        self.assertEqual(list(mypkgdemo1_add_batch([1, 1, 1], masked)), [2, 3, 4])
+        self.assertEqual(
+            list(module1.module1_add_batch([0] * 3, [0] * 3, masked)), [1, 2, 3]
+        )
+        # length mismatch : ValueError as list version, not numpy broadcasting
+        with self.assertRaises(ValueError):
+            mypkgdemo1_add_batch(numpy.array([1]), ns1)
+        with self.assertRaises(ValueError):
+            module1.module1_add_batch(ns1, [1], ns2)
+        with self.assertRaises(ValueError):
+            module2.module2_add_batch(ns1, ns2, numpy.array([1]))
@@ -0,0 +1,113 @@
+import io
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+from unittest import TestCase
+
+from snacks.testing.runner import group_by_class, plan_shards, run
+
+SAMPLE_TESTS = textwrap.dedent("""
+    import unittest
+
+
+    @unittest.skip("skip demo for test class")
+    class TestSkipped(unittest.TestCase):
+        def test_a(self):
+            pass
+
+
+    class TestSample(unittest.TestCase):
+        def test_ok(self):
+            pass
+
+        def test_sub(self):
+            for i in range(3):
+                with self.subTest(i=i):
+                    self.assertNotEqual(i, 1)
+
+        def test_sub_error(self):
+            with self.subTest(x=1):
+                raise ValueError("boom")
+
+        @unittest.expectedFailure
+        def test_xfail(self):
+            self.assertEqual(1, 2)
+    """)
+
+CHILD_PROCESS_TESTS = textwrap.dedent("""
+    import multiprocessing
+    import os
+    import unittest
+
+
+    class TestChildProcess(unittest.TestCase):
+        def test_start_child(self):
+            process = multiprocessing.Process(target=os.getpid)
+            process.start()
+            process.join()
+            self.assertEqual(process.exitcode, 0)
+    """)
+
+
+class TestParallelRunnerDemo(TestCase):
+    def test_plan_shards(self):
+        groups = {"m.A": ["m.A.t1", "m.A.t2"], "m.B": ["m.B.t1"], "m.C": ["m.C.t1"]}
+        durations = {"m.A.t1": 3.0, "m.A.t2": 1.0, "m.B.t1": 2.0, "m.C.t1": 2.0}
+        # LPT : A(4.0) -> shard0, B(2.0) -> shard1, C(2.0) -> shard1
+        self.assertEqual(
+            plan_shards(groups, 2, durations),
+            [["m.A.t1", "m.A.t2"], ["m.B.t1", "m.C.t1"]],
+        )
+        self.assertEqual(len(plan_shards(groups, 10)), 3)
+        tests = list(
+            unittest.TestLoader().loadTestsFromTestCase(TestParallelRunnerDemo)
+        )
+        self.assertEqual(
+            list(group_by_class(tests)),
+            ["tests.snacks.test_parallel_runner_demo.TestParallelRunnerDemo"],
+        )
+
+    def test_same_result_as_serial_run(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "test_sample_parallel.py"), "w") as f:
+                f.write(SAMPLE_TESTS)
+            try:
+                stream = io.StringIO()
+                result = run(tmpdir, top_level_dir=tmpdir, processes=2, stream=stream)
+            finally:
+                sys.path.remove(tmpdir)
+                sys.modules.pop("test_sample_parallel", None)
+        self.assertEqual(result.testsRun, 5)
+        self.assertEqual(len(result.skipped), 1)
+        self.assertEqual(len(result.expectedFailures), 1)
+        # str(test) format differs by Python version : check id and subtest params
+        self.assertEqual(
+            [(t.id(), str(t)[-5:]) for t, _ in result.failures],
+            [("test_sample_parallel.TestSample.test_sub", "(i=1)")],
+        )
+        self.assertEqual(
+            [(t.id(), str(t)[-5:]) for t, _ in result.errors],
+            [("test_sample_parallel.TestSample.test_sub_error", "(x=1)")],
+        )
+        self.assertIn("ValueError: boom", result.errors[0][1])
+        self.assertIn(
+            "FAILED (failures=1, errors=1, skipped=1, expected failures=1)",
+            stream.getvalue(),
+        )
+
+    def test_child_process_in_worker(self):
+        # test in shard worker can start its own child process
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with open(os.path.join(tmpdir, "test_sample_child.py"), "w") as f:
+                f.write(CHILD_PROCESS_TESTS)
+            try:
+                result = run(
+                    tmpdir, top_level_dir=tmpdir, processes=2, stream=io.StringIO()
+                )
+            finally:
+                sys.path.remove(tmpdir)
+                sys.modules.pop("test_sample_child", None)
+        self.assertEqual(result.testsRun, 1)
+        self.assertTrue(result.wasSuccessful(), result.errors)
@@ -0,0 +1,108 @@
+from unittest import TestCase
+from dataclasses import field, FrozenInstanceError, is_dataclass
+from typing import List, Dict, Tuple, ClassVar
+import pickle
+
+from snacks.records import record, RecordBatch, RowView
+
+# demonstration of __slots__ record and columnar record batch
+# (slots version of MyData4, MyData5, MyData7 in test_dataclass_demo.py)
+# ref: https://docs.python.org/ja/3/reference/datamodel.html#slots
+
+
+@record
+class MyRecord4:
+    str1: str
+    str2: str = "xyz"
+    str3: str = field(default="abc")
+    str6: ClassVar[str] = "XYZ"
+
+
+@record(frozen=True)
+class MyRecord5:
+    str1: str
+    int1: int
+
+
+@record
+class MyRecord7:
+    strings2: List[str] = field(default_factory=lambda: ["aa", "bb"])
+    dict2: Dict[str, str] = field(default_factory=lambda: {"k1": "v1", "k2": "v2"})
+    tuple1: Tuple[str, int] = field(default=("xx", 100))
+
+
+class TestRecordDemo(TestCase):
+    def test_slots(self):
+        d1 = MyRecord4("hello", str2="world")
+        self.assertTrue(is_dataclass(d1))
+        self.assertEqual(MyRecord4.__slots__, ("str1", "str2", "str3"))
+        self.assertFalse(hasattr(d1, "__dict__"))
+        with self.assertRaises(AttributeError):
+            d1.str4 = "no slot"
+        self.assertEqual(
+            (d1.str1, d1.str2, d1.str3, d1.str6), ("hello", "world", "abc", "XYZ")
+        )
+        self.assertEqual(MyRecord4("foo"), MyRecord4("foo", "xyz", "abc"))
+        self.assertEqual(
+            repr(MyRecord4("foo")), "MyRecord4(str1='foo', str2='xyz', str3='abc')"
+        )
+        # ClassVar is still class variable
+        self.assertEqual(MyRecord4.str6, "XYZ")
+
+    def test_frozen(self):
+        d1 = MyRecord5("hello", 100)
+        with self.assertRaises(FrozenInstanceError) as cm:
+            d1.str1 = "aaa"
+        self.assertEqual(cm.exception.args[0], "cannot assign to field 'str1'")
+        self.assertEqual(hash(d1), hash(MyRecord5("hello", 100)))
+        self.assertEqual(pickle.loads(pickle.dumps(d1)), d1)
+
+    def test_default_factory(self):
+        d1 = MyRecord7()
+        d2 = MyRecord7()
+        self.assertEqual(d1.strings2, ["aa", "bb"])
+        self.assertEqual(d1.dict2, {"k1": "v1", "k2": "v2"})
+        self.assertIsNot(d1.strings2, d2.strings2)
+        self.assertIsNot(d1.dict2, d2.dict2)
+        self.assertIs(d1.tuple1, d2.tuple1)
+        self.assertEqual(pickle.loads(pickle.dumps(d1)), d1)
+
+
+class TestRecordBatchDemo(TestCase):
+    def test_batch(self):
+        batch = RecordBatch(MyRecord5, typecodes={"int1": "q"})
+        batch.append("hello", 100)
+        batch.append(str1="world", int1=200)
+        batch.extend([MyRecord5("foo", 300)])
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(batch.column("int1").tolist(), [100, 200, 300])
+        self.assertEqual(batch.column("str1"), ["hello", "world", "foo"])
+
+        row = batch[1]
+        self.assertIsInstance(row, RowView)
+        self.assertEqual((row.str1, row.int1), ("world", 200))
+        self.assertEqual(batch[-1].astuple(), ("foo", 300))
+        self.assertEqual(batch.record(0), MyRecord5("hello", 100))
+        self.assertEqual([r.int1 for r in batch], [100, 200, 300])
+        with self.assertRaises(IndexError):
+            batch[3]
+        with self.assertRaises(AttributeError):
+            row.int2
+        with self.assertRaises(FrozenInstanceError):
+            row.int1 = 10
+        with self.assertRaises(OverflowError):
+            # int1 column is array.array("q")
+            batch.append("big", 2**64)
+        # failed append does not leave partial row
+        self.assertEqual(len(batch.column("str1")), 3)
+
+    def test_mutable_batch_defaults(self):
+        batch = RecordBatch(MyRecord7)
+        batch.append()
+        batch.append(strings2=["cc"])
+        self.assertEqual(batch[0].strings2, ["aa", "bb"])
+        self.assertEqual(batch[1].strings2, ["cc"])
+        batch[1].tuple1 = ("yy", 1)
+        self.assertEqual(batch.record(1).tuple1, ("yy", 1))
+        with self.assertRaises(ValueError):
+            RecordBatch(MyRecord7, typecodes={"nosuchfield": "i"})
@@ -0,0 +1,61 @@
+from unittest import TestCase
+from enum import Enum
+
+from snacks.fastenum import FastEnum
+from snacks.repeater import CachedRepeater, build_repeat
+
+# demonstration of cached repeat() (see test_enum_demo.py StringRepeater)
+
+
+class StringRepeater(CachedRepeater, Enum):
+    ONE_DOT = (1, ",")
+    TWO_COLON = (2, ":")
+    THREE_DASH = (3, "-")
+
+    def __init__(self, count: int, joiner: str):
+        self.count = count
+        self.joiner = joiner
+
+
+class SmallCacheRepeater(CachedRepeater):
+    repeat_cache_size = 2
+
+
+class StringRepeater2(SmallCacheRepeater, FastEnum):
+    count: int
+    joiner: str
+
+    ONE_DOT = (1, ",")
+    TWO_COLON = (2, ":")
+    ZERO_EMPTY = (0, "")
+
+    def __new__(cls, count: int, joiner: str):
+        obj = object.__new__(cls)
+        obj._value_ = count
+        obj.count = count
+        obj.joiner = joiner
+        return obj
+
+
+class TestCachedRepeaterDemo(TestCase):
+    def test_repeat(self):
+        self.assertEqual(StringRepeater.ONE_DOT.repeat("hello"), "hello")
+        self.assertEqual(StringRepeater.TWO_COLON.repeat("abc"), "abc:abc")
+        self.assertEqual(StringRepeater.THREE_DASH.repeat("def"), "def-def-def")
+        self.assertEqual(StringRepeater2(2).repeat("abc"), "abc:abc")
+        self.assertEqual(StringRepeater2.ZERO_EMPTY.repeat("abc"), "")
+        self.assertEqual(build_repeat("ab", 3, ""), "ababab")
+
+    def test_repeat_many(self):
+        self.assertEqual(
+            StringRepeater.THREE_DASH.repeat_many(["a", "b", "a"]),
+            ["a-a-a", "b-b-b", "a-a-a"],
+        )
+
+    def test_cache_per_member(self):
+        member = StringRepeater2.TWO_COLON
+        member.repeat_many(["a", "b", "a", "c", "d"])
+        info = member.repeat_cache_info()
+        self.assertEqual((info.hits, info.maxsize, info.currsize), (1, 2, 2))
+        # other member has its own cache
+        self.assertEqual(StringRepeater2.ONE_DOT.repeat_cache_info().currsize, 0)
@@ -0,0 +1,133 @@
+import gc
+import inspect
+import weakref
+from unittest import TestCase
+
+from snacks import sigbind
+from snacks.sigbind import get_binder
+
+# compiled signature binding for functions in test_function_definition_demo.py
+
+
+def f1(name, age: int = 0, height: int = 50, weight: int = 3) -> str:
+    return "name={}, age={} years, height={}cm, weight={}kg".format(
+        name, age, height, weight
+    )
+
+
+def f2(name: str, **kwargs) -> str:
+    r = "name=" + name
+    for kw in kwargs:
+        r = r + ", " + kw + "=" + str(kwargs[kw])
+    return r
+
+
+def f3(prefix: str, *strings, sep=",", postfix: str):
+    return prefix + sep.join(strings) + postfix
+
+
+def f4(a: int, b: int, *, c: int, d: int) -> int:
+    return a + b + c + d
+
+
+class TestSignatureBinderDemo(TestCase):
+    def assertSameBinding(self, func, *args, **kwargs):
+        binder = get_binder(func)
+        try:
+            func(*args, **kwargs)
+        except TypeError as e:
+            with self.assertRaises(TypeError) as cm:
+                binder.bind(*args, **kwargs)
+            self.assertEqual(str(cm.exception), str(e))
+            return
+        bound = inspect.signature(func).bind(*args, **kwargs)
+        bound.apply_defaults()
+        self.assertEqual(binder.bind(*args, **kwargs), dict(bound.arguments))
+
+    def test_bind(self):
+        self.assertEqual(
+            get_binder(f1).bind("bob", 1),
+            {"name": "bob", "age": 1, "height": 50, "weight": 3},
+        )
+        calls = [
+            (f1, ("daniel", 3), {"weight": 5}),
+            (f1, (), {}),
+            (f1, ("a", 1, 2, 3, 4), {}),
+            (f1, ("a",), {"x": 1}),
+            (f2, ("alice",), {"year": 3, "height": 100}),
+            (f2, ("clark",), {"name": "daniel"}),
+            (f3, ("abc", "def", "ghi"), {"postfix": "zzz"}),
+            (f3, ("abc",), {}),
+            (f4, (1, 2), {"c": 3, "d": 4}),
+            (f4, (1, 2, 3, 4), {}),
+            (f4, (1, 2), {"c": 3}),
+        ]
+        for func, args, kwargs in calls:
+            with self.subTest(func=func.__name__, args=args, kwargs=kwargs):
+                self.assertSameBinding(func, *args, **kwargs)
+
+    def test_positional_only(self):
+        namespace = {}
+        # "/" in source code is not accepted by flake8 (see test_special_params_demo)
+        exec(
+            "def f5(a, b=2, /, c=3, *args, e, **kw):\n    return (a, b, c, args, e, kw)",
+            namespace,
+        )
+        f5 = namespace["f5"]
+        self.assertSameBinding(f5, 1, e=5)
+        self.assertSameBinding(f5, 1, 2, 3, 4, e=5, a=6)
+        self.assertSameBinding(f5, a=1, e=2)
+        self.assertEqual(
+            get_binder(f5).call_dict({"a": 1, "args": [4], "e": 5, "x": 6}),
+            (1, 2, 3, (4,), 5, {"x": 6}),
+        )
+
+    def test_call_dict(self):
+        self.assertEqual(
+            get_binder(f2).call_dict({"name": "bob", "year": 10}),
+            "name=bob, year=10",
+        )
+        self.assertEqual(
+            get_binder(f2).bind_dict({"name": "bob", "year": 10}),
+            {"name": "bob", "kwargs": {"year": 10}},
+        )
+        self.assertEqual(
+            get_binder(f3).call_many(
+                [
+                    {"prefix": "abc", "strings": ["def", "ghi"], "postfix": "zzz"},
+                    {"prefix": "x", "sep": "-", "strings": "yz", "postfix": "!"},
+                ]
+            ),
+            ["abcdef,ghizzz", "xy-z!"],
+        )
+        with self.assertRaises(TypeError) as cm:
+            get_binder(f4).call_dict({"a": 1, "b": 2, "c": 3})
+        self.assertTrue(
+            str(cm.exception).endswith(
+                "f4() missing 1 required keyword-only argument: 'd'"
+            )
+        )
+        self.assertIs(get_binder(f4), get_binder(f4))
+
+    def test_cache_does_not_keep_func(self):
+        def g(x):
+            return x * 2
+
+        class C:
+            def m(self, x):
+                return x * 3
+
+        c = C()
+        size = len(sigbind._cache)
+        self.assertEqual(get_binder(g).call_dict({"x": 2}), 4)
+        binder = get_binder(c.m)
+        self.assertEqual(binder.call_many([{"x": 1}, {"x": 2}]), [3, 6])
+        instance = weakref.ref(c)
+        del g, c
+        gc.collect()
+        self.assertEqual(len(sigbind._cache), size)
+        # binder does not keep bound method (and its instance) alive
+        self.assertIsNone(instance())
+        self.assertIsNone(binder.func)
+        with self.assertRaises(ReferenceError):
+            binder.call_dict({"x": 1})
@@ -0,0 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from snacks import strbuilder
+from snacks.strbuilder import StringBuilder, arg_trace, format_arg_trace
+
+# list + join version of "r += ..." in test_function_definition_demo.py
+
+
+class TestStringBuilderDemo(TestCase):
+    def test_string_builder(self):
+        sb = StringBuilder(">>")
+        for i, arg in enumerate([10, 20]):
+            sb.append_format(",*a[{}]=[{}]", i, arg)
+        sb.append(",").extend(["x", "y"])
+        self.assertEqual(sb.getvalue(), ">>,*a[0]=[10],*a[1]=[20],xy")
+        self.assertEqual(str(sb), ">>,*a[0]=[10],*a[1]=[20],xy")
+        self.assertEqual(len(sb), 27)
+        sb.append("z")
+        self.assertEqual(sb.getvalue(), ">>,*a[0]=[10],*a[1]=[20],xyz")
+        sb.clear()
+        self.assertEqual(sb.getvalue(), "")
+
+    def test_arg_trace(self):
+        # same output as f1() of test_arg_type_mixin_demo
+        self.assertEqual(arg_trace(">>", ",<<"), ">>,<<")
+        self.assertEqual(
+            arg_trace(">>", ",<<", 10, 20, 30), ">>,*a[0]=[10],*a[1]=[20],*a[2]=[30],<<"
+        )
+        self.assertEqual(
+            arg_trace(">>", ",<<", 10, 20, 30, kw1="aa", kw2="bb"),
+            ">>,*a[0]=[10],*a[1]=[20],*a[2]=[30],**kw[kw1]=[aa],**kw[kw2]=[bb],<<",
+        )
+        self.assertEqual(
+            arg_trace(">>", ",<<", [1, 2, 3], kw1="aa"),
+            ">>,*a[0]=[[1, 2, 3]],**kw[kw1]=[aa],<<",
+        )
+
+    def test_more_args_than_cache(self):
+        size = strbuilder.ARG_PREFIX_CACHE_SIZE
+        try:
+            strbuilder.ARG_PREFIX_CACHE_SIZE = 2
+            self.assertEqual(
+                format_arg_trace("", "", ["a", "b", "c", "d"], {}),
+                ",*a[0]=[a],*a[1]=[b],*a[2]=[c],*a[3]=[d]",
+            )
+        finally:
+            strbuilder.ARG_PREFIX_CACHE_SIZE = size
+
+    def test_arg_prefixes_threads(self):
+        # cache extended from several threads : no caller sees partial extension
+        def trace(n):
+            return format_arg_trace("", "", list(range(n)), {})
+
+        counts = list(range(1, 500, 7)) * 4
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(trace, counts))
+        self.assertEqual(
+            results,
+            ["".join(",*a[{0}]=[{0}]".format(i) for i in range(n)) for n in counts],
+        )
+        prefixes = strbuilder.arg_prefixes(3)
+        self.assertIs(strbuilder.arg_prefixes(2), prefixes)
@@ -1,4 +1,5 @@
 from unittest import TestCase
+from snacks.switch import SwitchBuilder, compile_switch
 
 # demonstration of alt-switch techniques
 # see-also:
@@ -48,3 +49,71 @@ class TestSwitchAlternativeDemo(TestCase):
         self.assertEqual(f1("dd"), "cc or dd")
         self.assertEqual(f1("ee"), "ee")
         self.assertEqual(f1("ff"), "xx")
+
+    def test_compiled_switch_table(self):
+        # snacks.switch : equal values are merged, one dict.get() per exact key.
+        f1 = (
+            SwitchBuilder(default="xx")
+            .case(["aa", "bb"], "aa or bb")
+            .case(("cc", "dd"), "cc or dd")
+            .case("ee", "ee")
+            .compile()
+        )
+        self.assertEqual(f1("aa"), "aa or bb")
+        self.assertEqual(f1("bb"), "aa or bb")
+        self.assertIs(f1("aa"), f1("bb"))
+        self.assertEqual(f1("cc"), "cc or dd")
+        self.assertEqual(f1("dd"), "cc or dd")
+        self.assertEqual(f1("ee"), "ee")
+        self.assertEqual(f1("ff"), "xx")
+
+        f2 = compile_switch({"aa": "aa or bb", "bb": "aa or bb", ("x", 1): "tuple"})
+        self.assertEqual(f2("bb"), "aa or bb")
+        self.assertEqual(f2(("x", 1)), "tuple")
+        self.assertIsNone(f2("ff"))
+
+    def test_compiled_switch_table_prefix_range(self):
+        f1 = (
+            SwitchBuilder(default="xx")
+            .case("op_add", "add")
+            .prefix("op_", "operator")
+            .prefix("op_cmp_", "compare")
+            .range(0, 10, "digit")
+            .range(10, 100, "two digits")
+            .range("a", "b", "starts with a")
+            .compile()
+        )
+        # exact key -> longest prefix -> range -> default
+        self.assertEqual(f1("op_add"), "add")
+        self.assertEqual(f1("op_sub"), "operator")
+        self.assertEqual(f1("op_cmp_eq"), "compare")
+        self.assertEqual(f1("op"), "xx")
+        self.assertEqual(f1(0), "digit")
+        self.assertEqual(f1(9.5), "digit")
+        self.assertEqual(f1(10), "two digits")
+        self.assertEqual(f1(100), "xx")
+        self.assertEqual(f1(-1), "xx")
+        self.assertEqual(f1("abc"), "starts with a")
+        self.assertEqual(f1(None), "xx")
+
+        with self.assertRaises(ValueError):
+            SwitchBuilder().range(0, 10, "a").range(5, 20, "b").compile()
+        with self.assertRaises(ValueError):
+            SwitchBuilder().case("aa", 1).case(["bb", "aa"], 2)
+
+    def test_compiled_switch_table_value_types(self):
+        # equal values of different types are not merged
+        f1 = SwitchBuilder().case("a", 1).case("b", True).case("c", 1.0).compile()
+        self.assertIs(type(f1("a")), int)
+        self.assertIs(f1("b"), True)
+        self.assertIs(type(f1("c")), float)
+
+        # failed case() leaves builder unchanged
+        builder = SwitchBuilder(default="xx").case("aa", 1)
+        with self.assertRaises(ValueError):
+            builder.case(["cc", "aa"], 2)
+        with self.assertRaises(ValueError):
+            builder.case(["dd", "dd"], 3)
+        f2 = builder.case("cc", 4).compile()
+        self.assertEqual(f2("cc"), 4)
+        self.assertEqual(f2("dd"), "xx")
@@ -0,0 +1,73 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from snacks.textsplit import isplit, isplitlines, open_mmap
+
+# lazy version of test_split_join in test_string_demo.py
+
+
+class TestTextSplitDemo(TestCase):
+    def test_isplit(self):
+        self.assertEqual(list(isplit("a b  c")), ["a", "b", "c"])
+        self.assertEqual(list(isplit("a b  c", " ")), ["a", "b", "", "c"])
+        self.assertEqual(list(isplit("a,b,,c,", ",")), ["a", "b", "", "c", ""])
+        self.assertEqual(list(isplit("a,b,,c,", ",", 2)), ["a", "b", ",c,"])
+        self.assertEqual(list(isplit(b"a::b::", b"::")), [b"a", b"b", b""])
+        for text in ("  a b  c  ", "", "   ", "a"):
+            for maxsplit in (-1, 0, 1, 2):
+                with self.subTest(text=text, maxsplit=maxsplit):
+                    self.assertEqual(
+                        list(isplit(text, None, maxsplit)), text.split(None, maxsplit)
+                    )
+        with self.assertRaises(ValueError):
+            list(isplit("a", ""))
+
+    def test_isplit_is_lazy(self):
+        it = isplit("a,b,c", ",")
+        self.assertEqual(next(it), "a")
+        self.assertEqual(list(it), ["b", "c"])
+
+    def test_isplitlines(self):
+        s = "aa\nbb\rcc\r\ndd\vee\x0bff\fgg\x0chh"
+        self.assertEqual(
+            list(isplitlines(s)), ["aa", "bb", "cc", "dd", "ee", "ff", "gg", "hh"]
+        )
+        s = "a\x1cb\x85c d\n\ne\r\n"
+        self.assertEqual(list(isplitlines(s)), s.splitlines())
+        self.assertEqual(list(isplitlines(s, keepends=True)), s.splitlines(True))
+        # bytes.splitlines() splits only \n, \r, \r\n
+        b = b"aa\nbb\rcc\r\ndd\vee\fff"
+        self.assertEqual(list(isplitlines(b)), b.splitlines())
+        self.assertEqual(list(isplitlines(b, True)), b.splitlines(True))
+
+    def test_block_boundary(self):
+        # small block_size : items and "\r\n" are split at block boundary
+        s = "aa\r\nbb,cc  dd\r\n\ree\x85ff,\r"
+        for block_size in range(1, len(s) + 1):
+            with self.subTest(block_size=block_size):
+                self.assertEqual(
+                    list(isplitlines(s, block_size=block_size)), s.splitlines()
+                )
+                self.assertEqual(
+                    list(isplitlines(s, True, block_size)), s.splitlines(True)
+                )
+                self.assertEqual(
+                    list(isplit(s, ",", block_size=block_size)), s.split(",")
+                )
+                self.assertEqual(list(isplit(s, block_size=block_size)), s.split())
+
+    def test_mmap(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "lines.txt")
+            with open(path, "wb") as f:
+                f.write(b"line1\r\nline2,x\nline3")
+            with open_mmap(path) as m:
+                self.assertEqual(list(isplitlines(m)), [b"line1", b"line2,x", b"line3"])
+                self.assertEqual(
+                    list(isplit(m, b",")), [b"line1\r\nline2", b"x\nline3"]
+                )
+            empty = os.path.join(tmpdir, "empty.txt")
+            open(empty, "wb").close()
+            with open_mmap(empty) as m:
+                self.assertEqual(list(isplitlines(m)), [])
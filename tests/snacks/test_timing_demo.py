@@ -0,0 +1,71 @@
+import os
+import tempfile
+import time
+import tracemalloc
+import unittest
+from unittest import TestCase
+
+from snacks.testing.timing import (
+    MemoryTimingTextResult,
+    TestTiming,
+    TimingDB,
+    format_report,
+)
+
+
+class TestTimingDemo(TestCase):
+    def test_timing_result(self):
+        # defined here : not collected as a test of this module
+        class _SlowSetUp(TestCase):
+            def setUp(self):
+                time.sleep(0.02)  # fixture cost is included in timing
+
+            def test_alloc(self):
+                data = bytearray(1_000_000)
+                self.assertEqual(len(data), 1_000_000)
+
+        tracing = tracemalloc.is_tracing()
+        suite = unittest.TestLoader().loadTestsFromTestCase(_SlowSetUp)
+        with open(os.devnull, "w") as stream:
+            result = unittest.TextTestRunner(
+                stream=stream, resultclass=MemoryTimingTextResult
+            ).run(suite)
+        self.assertTrue(result.wasSuccessful())
+        (timing,) = result.timings
+        self.assertTrue(timing.test_id.endswith("_SlowSetUp.test_alloc"))
+        self.assertGreaterEqual(timing.wall, 0.02)
+        self.assertGreaterEqual(timing.peak_memory, 1_000_000)
+        # tracemalloc started by result is stopped at the end of run
+        self.assertEqual(tracemalloc.is_tracing(), tracing)
+
+    def test_timing_db(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with TimingDB(os.path.join(tmpdir, "timing.sqlite")) as db:
+                self.assertEqual(db.durations(), {})
+                self.assertEqual(db.regressions(), [])
+                for wall in (1.0, 3.0, 2.0):
+                    db.record_run(
+                        [
+                            TestTiming("m.A.t1", wall, wall, 0),
+                            TestTiming("m.A.t2", 0.1, 0.1, 10),
+                        ]
+                    )
+                self.assertEqual(db.durations(), {"m.A.t1": 2.0, "m.A.t2": 0.1})
+                self.assertEqual(db.durations(runs=1), {"m.A.t1": 2.0, "m.A.t2": 0.1})
+                self.assertEqual([t.test_id for t in db.slowest(1)], ["m.A.t1"])
+                self.assertEqual(db.regressions(), [])
+                db.record_run(
+                    [
+                        TestTiming("m.A.t1", 2.1, 2.1, 0),
+                        TestTiming("m.A.t2", 0.5, 0.5, 10),
+                    ]
+                )
+                # t1 : 2.1 vs median 2.0 is not a regression, t2 : 0.5 vs 0.1 is
+                (regression,) = db.regressions()
+                self.assertEqual(
+                    (regression.test_id, regression.baseline, regression.latest),
+                    ("m.A.t2", 0.1, 0.5),
+                )
+                report = format_report(db, top=1)
+                self.assertIn("m.A.t1", report)
+                self.assertIn("0.100s ->    0.500s  m.A.t2", report)
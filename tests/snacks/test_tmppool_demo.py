@@ -0,0 +1,102 @@
+import os
+import tempfile
+import unittest
+import unittest.mock
+from os import path
+from unittest import TestCase
+
+from snacks.testing.tmppool import (
+    TempDirPool,
+    default_base_dir,
+    get_pool,
+    pooled_tempdir,
+)
+
+
+class TestTempDirPoolSetupTeardown(TestCase):
+    # TestUnittestSetupTeardown (test_unittest_demo.py) with pooled directories
+    def setUp(self):
+        self.tempdir1 = pooled_tempdir(self)
+        self.tempdir2 = pooled_tempdir(self, "_suffix0_")
+        self.tempdir3 = get_pool().temporary_directory("_suffix0_", "_prefix0_")
+
+    def test_demo1(self):
+        self.assertTrue(path.isdir(self.tempdir1))
+        self.assertTrue(path.basename(self.tempdir2).endswith("_suffix0_"))
+        self.assertTrue(path.basename(self.tempdir3.name).startswith("_prefix0_"))
+        for dirpath in (self.tempdir1, self.tempdir2, self.tempdir3.name):
+            self.assertEqual(os.listdir(dirpath), [])
+            filepath = path.join(dirpath, "日本語1_utf8.txt")
+            with open(filepath, "w", encoding="utf8") as f:
+                f.write("日本語テキスト")
+            with open(filepath, "r", encoding="utf8") as f:
+                self.assertEqual(f.read(), "日本語テキスト")
+
+    def tearDown(self):
+        self.tempdir3.cleanup()
+
+
+class TestTempDirPoolDemo(TestCase):
+    def test_reuse(self):
+        with TempDirPool(size=2) as pool:
+            self.assertEqual(pool.free_count(), 2)
+            dirpath = pool.acquire()
+            os.makedirs(path.join(dirpath, "a", "b"))
+            with open(path.join(dirpath, "a", "b", "c.txt"), "w") as f:
+                f.write("c")
+            os.symlink(pool.root, path.join(dirpath, "link"))
+            pool.release(dirpath)
+            # emptied, symlink target is not followed
+            self.assertEqual(os.listdir(dirpath), [])
+            self.assertTrue(path.isdir(pool.root))
+            self.assertEqual(pool.free_count(), 2)
+            self.assertEqual(pool.acquire(), dirpath)
+            # suffix / prefix are separate free lists
+            with pool.temporary_directory("_s", "p_") as name:
+                self.assertTrue(path.basename(name).startswith("p_"))
+            self.assertEqual(pool.free_count(), 2)
+            self.assertEqual(pool.acquire("_s", "p_"), name)
+            with self.assertRaises(ValueError):
+                pool.release(pool.root)
+            # released twice : rejected, not handed out to two callers
+            pool.release(dirpath)
+            with self.assertRaises(ValueError):
+                pool.release(dirpath)
+            self.assertEqual(pool.acquire(), dirpath)
+            self.assertNotEqual(pool.acquire(), dirpath)
+        self.assertFalse(path.exists(pool.root))
+
+    def test_base_dir(self):
+        # /dev/shm is opt-in
+        with unittest.mock.patch.dict(os.environ, {"SNACKS_TMPPOOL_SHM": ""}):
+            self.assertEqual(default_base_dir(), tempfile.gettempdir())
+            with TempDirPool() as pool:
+                self.assertEqual(pool.base_dir, tempfile.gettempdir())
+        if path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+            self.assertEqual(default_base_dir(use_shm=True), "/dev/shm")
+            with unittest.mock.patch.dict(os.environ, {"SNACKS_TMPPOOL_SHM": "1"}):
+                self.assertEqual(default_base_dir(), "/dev/shm")
+                self.assertEqual(default_base_dir(use_shm=False), tempfile.gettempdir())
+
+    def test_removed_by_test(self):
+        with TempDirPool() as pool:
+            dirpath = pool.acquire()
+            os.rmdir(dirpath)
+            pool.release(dirpath)
+            self.assertEqual(pool.free_count(), 0)
+            self.assertNotEqual(pool.acquire(), dirpath)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires fork")
+    def test_fork(self):
+        parent = get_pool()
+        pid = os.fork()
+        if pid == 0:
+            # child gets its own pool, dropping inherited one does not remove parent's root
+            child = get_pool()
+            status = 0 if child is not parent and path.isdir(child.root) else 1
+            del parent
+            child.close()
+            os._exit(status)
+        _, status = os.waitpid(pid, 0)
+        self.assertEqual(status, 0)
+        self.assertTrue(path.isdir(parent.root))
@@ -0,0 +1,64 @@
+import io
+from unittest import TestCase
+
+from snacks.transcode import (
+    decode_stream,
+    iter_chunks,
+    iter_decode,
+    iter_encode,
+    transcode_file,
+)
+
+# streaming version of test_string_demo.py unicode conversion demo
+
+
+class TestTranscodeDemo(TestCase):
+    def test_iter_chunks(self):
+        data = bytes(range(10))
+        self.assertEqual(
+            [bytes(c) for c in iter_chunks(data, 4)], [data[:4], data[4:8], data[8:]]
+        )
+        f = io.BytesIO(data)
+        self.assertEqual(b"".join(bytes(c) for c in iter_chunks(f, 3)), data)
+        with self.assertRaises(ValueError):
+            list(iter_chunks(data, 0))
+
+    def test_utf8_split_at_chunk_boundary(self):
+        s = "abc日本語テキスト😀xyz"
+        data = s.encode("utf_8")
+        # every chunk size splits multi byte sequences at different positions
+        for chunk_size in range(1, len(data) + 1):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    "".join(decode_stream(data, "utf_8", chunk_size=chunk_size)), s
+                )
+                self.assertEqual(
+                    "".join(
+                        decode_stream(io.BytesIO(data), "utf_8", chunk_size=chunk_size)
+                    ),
+                    s,
+                )
+
+    def test_truncated_input(self):
+        data = "日本".encode("utf_8")[:-1]
+        with self.assertRaises(UnicodeDecodeError):
+            list(decode_stream(data, "utf_8", chunk_size=2))
+        self.assertEqual("".join(decode_stream(data, "utf_8", "replace", 2)), "日�")
+
+    def test_latin_1_round_trip(self):
+        b00_to_ff = bytes(range(256))
+        s1 = "".join(iter_decode(iter_chunks(b00_to_ff, 7), "latin_1"))
+        self.assertEqual(s1, b00_to_ff.decode("latin_1"))
+        self.assertEqual(
+            b"".join(iter_encode([s1[:100], s1[100:]], "latin_1")), b00_to_ff
+        )
+
+    def test_transcode_file(self):
+        s = "BOM付き utf-16 から utf-8 へ" * 100
+        src = io.BytesIO(s.encode("utf_16"))
+        dst = io.BytesIO()
+        bytes_in, bytes_out = transcode_file(src, dst, "utf_16", "utf_8", chunk_size=5)
+        self.assertEqual(dst.getvalue(), s.encode("utf_8"))
+        self.assertEqual(
+            (bytes_in, bytes_out), (len(s.encode("utf_16")), len(s.encode("utf_8")))
+        )
@@ -0,0 +1,52 @@
+from unittest import TestCase
+from dataclasses import dataclass
+from typing import List, Any, Union, get_type_hints
+import gc
+import sys
+
+from snacks import typehints
+from snacks.typehints import get_hints, get_hint_infos, warmup_module, HintInfo
+from .test_typing_demo import MyTypeDemo2
+
+# demonstration of cached get_type_hints()
+
+
+class TestTypeHintsCacheDemo(TestCase):
+    def setUp(self):
+        typehints.cache_clear()
+
+    def test_same_result_as_get_type_hints(self):
+        o1 = MyTypeDemo2("hello", 100, ["aa", "bb"])
+        for obj in (MyTypeDemo2, o1.some_method, MyTypeDemo2.some_class_method):
+            self.assertEqual(dict(get_hints(obj)), get_type_hints(obj))
+        # cached by the underlying function, not by the bound method object
+        self.assertIs(get_hints(o1.some_method), get_hints(o1.some_method))
+        with self.assertRaises(TypeError):
+            get_hints(MyTypeDemo2)["str1"] = int
+
+    def test_precomputed_args(self):
+        infos = get_hint_infos(MyTypeDemo2)
+        self.assertEqual(infos["str1"], HintInfo(str, None, ()))
+        self.assertEqual(infos["strings1"], HintInfo(List[str], list, (str,)))
+        infos = get_hint_infos(MyTypeDemo2.some_class_method)
+        self.assertEqual(infos["list3"].args, (Any,))
+        self.assertIs(infos["union3"].origin, Union)
+        self.assertEqual(infos["union3"].args, (str, int))
+
+    def test_warmup_module(self):
+        module = sys.modules[MyTypeDemo2.__module__]
+        self.assertGreater(warmup_module(module), 3)
+        size = typehints.cache_info()["size"]
+        get_hints(MyTypeDemo2.some_method)
+        self.assertEqual(typehints.cache_info()["size"], size)
+
+    def test_weak_reference(self):
+        @dataclass
+        class Temporary:
+            int1: int
+
+        self.assertEqual(get_hints(Temporary), {"int1": int})
+        self.assertEqual(typehints.cache_info()["size"], 1)
+        del Temporary
+        gc.collect()
+        self.assertEqual(typehints.cache_info()["size"], 0)
@@ -0,0 +1,109 @@
+import gc
+import weakref
+from unittest import TestCase
+from dataclasses import dataclass, field, make_dataclass
+from typing import List, Dict, Any, Union, Optional
+
+from snacks.validator import (
+    compile_validator,
+    compile_hint,
+    validate_many,
+    ValidationError,
+)
+from .test_typing_demo import MyTypeDemo2
+
+# demonstration of type hint driven validator
+
+
+@dataclass
+class Item:
+    name: str
+    price: float
+    tags: List[str] = field(default_factory=list)
+    attrs: Dict[str, Union[str, int]] = field(default_factory=dict)
+    extra: Any = None
+    parent: Optional["Item"] = None
+
+
+class TestValidatorDemo(TestCase):
+    def test_valid(self):
+        validate = compile_validator(MyTypeDemo2)
+        self.assertIs(compile_validator(MyTypeDemo2), validate)
+        self.assertEqual(
+            validate({"str1": "hello", "int1": 100, "strings1": ["aa", "bb"]}),
+            MyTypeDemo2("hello", 100, ["aa", "bb"]),
+        )
+        self.assertEqual(validate({}), MyTypeDemo2())
+
+        item = compile_validator(Item)(
+            {
+                "name": "apple",
+                "price": 100,
+                "attrs": {"color": "red", "weight": 300},
+                "extra": [1, 2],
+                "parent": {"name": "fruit", "price": 0.5},
+            }
+        )
+        # int is coerced to float
+        self.assertEqual(item.price, 100.0)
+        self.assertIs(type(item.price), float)
+        self.assertEqual(item.parent, Item("fruit", 0.5))
+
+    def test_invalid(self):
+        validate = compile_validator(Item)
+        params = [
+            ({"price": 1.0}, "$.name: missing required field"),
+            ({"name": "a", "price": "1"}, "$.price: expected float, got str"),
+            ({"name": "a", "price": 1, "x": 1}, "$: unknown field(s): x"),
+            (
+                {"name": "a", "price": 1, "tags": ["ok", 1]},
+                "$.tags[1]: expected str, got int",
+            ),
+            (
+                {"name": "a", "price": 1, "attrs": {"k": 1.5}},
+                "$.attrs['k']: expected str | int, got float",
+            ),
+            (
+                {"name": "a", "price": 1, "parent": {"name": 1, "price": 1}},
+                "$.parent: expected Item | NoneType, got dict",
+            ),
+            ("not dict", "$: expected dict, got str"),
+        ]
+        for payload, message in params:
+            with self.subTest(payload=payload):
+                with self.assertRaises(ValidationError) as cm:
+                    validate(payload)
+                self.assertEqual(str(cm.exception), message)
+
+    def test_bool_is_not_int(self):
+        check = compile_hint(int)
+        self.assertEqual(check(1), 1)
+        with self.assertRaises(ValidationError):
+            check(True)
+
+    def test_validate_many(self):
+        payloads = [{"str1": "a"}, {"int1": 1}, {"strings1": ["x"]}]
+        self.assertEqual(
+            validate_many(MyTypeDemo2, payloads),
+            [MyTypeDemo2("a"), MyTypeDemo2(int1=1), MyTypeDemo2(strings1=["x"])],
+        )
+        with self.assertRaises(ValidationError) as cm:
+            validate_many(MyTypeDemo2, payloads + [{"int1": "x"}])
+        self.assertEqual(str(cm.exception), "$[3].int1: expected int, got str")
+        with self.assertRaises(TypeError):
+            compile_validator(dict)
+
+    def test_cache_does_not_keep_dataclass(self):
+        inner = make_dataclass("Inner", [("x", int)])
+        # not List[inner] : typing caches subscripted generics (and so inner)
+        outer = make_dataclass("Outer", [("inner", inner), ("parent", Any)])
+        validate = compile_validator(outer)
+        self.assertEqual(
+            validate({"inner": {"x": 1}, "parent": None}), outer(inner(1), None)
+        )
+        refs = [weakref.ref(inner), weakref.ref(outer)]
+        del inner, outer, validate
+        # inner is released by weakref callbacks of outer's cache entries
+        gc.collect()
+        gc.collect()
+        self.assertEqual([ref() for ref in refs], [None, None])